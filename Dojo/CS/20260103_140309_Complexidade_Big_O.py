@@ -1,32 +1,138 @@
-# Este código demonstra a diferença entre complexidade de tempo O(n) e O(n²). 
-# A função O(n) realiza uma operação linear, enquanto a função O(n²) realiza 
-# operações quadráticas em relação ao tamanho da entrada. Vamos comparar o tempo 
+# Este código demonstra a diferença entre complexidade de tempo O(n) e O(n²).
+# A função O(n) realiza uma operação linear, enquanto a função O(n²) realiza
+# operações quadráticas em relação ao tamanho da entrada. Vamos comparar o tempo
 # de execução de ambas as funções para diferentes tamanhos de entrada.
+# Cada função tem três backends selecionáveis: Python puro, NumPy vetorizado e fórmula fechada,
+# que produzem exatamente o mesmo resultado; a tabela final compara os ganhos de fator constante
+# lado a lado com os ganhos assintóticos, e o modo de memória mostra o espaço usado por chamada.
+# Os backends Python puro e fórmula fechada não precisam de bibliotecas externas; só o backend NumPy importa o
+# NumPy, na primeira chamada: pip install numpy
 
-import time
+import sys
+from pathlib import Path
 
-def funcao_O_n(n):
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+bench = carregar_script("20261018_090012_Benchmark_Complexidade.py")
+
+BACKENDS = ("python", "numpy", "fechada")
+ELEMENTOS_POR_BLOCO = 1 << 22  # Limita cada bloco NumPy a ~32 MB de int64
+
+def _importar_numpy():
+    try:
+        import numpy
+    except ImportError as erro:
+        raise ImportError("O backend 'numpy' precisa do NumPy: pip install numpy") from erro
+    return numpy
+
+def backends_disponiveis():
+    # Backends que rodam neste ambiente: sem o NumPy instalado, só "python" e "fechada"
+    try:
+        _importar_numpy()
+    except ImportError:
+        return tuple(b for b in BACKENDS if b != "numpy")
+    return BACKENDS
+
+def _O_n_python(n):
     soma = 0
     for i in range(n):
         soma += i
     return soma
 
-def funcao_O_n2(n):
+def _O_n_numpy(n):
+    # Soma por blocos: cada soma parcial cabe em int64 e o total é acumulado em int do Python
+    np = _importar_numpy()
+    soma = 0
+    for inicio in range(0, n, ELEMENTOS_POR_BLOCO):
+        soma += int(np.arange(inicio, min(inicio + ELEMENTOS_POR_BLOCO, n), dtype=np.int64).sum())
+    return soma
+
+def _O_n_fechada(n):
+    return n * (n - 1) // 2 if n > 0 else 0
+
+def _O_n2_python(n):
     soma = 0
     for i in range(n):
         for j in range(n):
             soma += i + j
     return soma
 
-tamanhos = [10, 100, 200]
-
-for tamanho in tamanhos:
-    inicio = time.time()
-    funcao_O_n(tamanho)
-    tempo_O_n = time.time() - inicio
-    
-    inicio = time.time()
-    funcao_O_n2(tamanho)
-    tempo_O_n2 = time.time() - inicio
-    
-    print(f"Tamanho: {tamanho} - O(n): {tempo_O_n:.6f}s, O(n²): {tempo_O_n2:.6f}s")
\ No newline at end of file
+def _O_n2_numpy(n):
+    # Broadcast de i[:, None] + j em faixas de linhas, para que a matriz n×n nunca exista inteira
+    if n <= 0:
+        return 0
+    np = _importar_numpy()
+    j = np.arange(n, dtype=np.int64)
+    linhas = max(1, ELEMENTOS_POR_BLOCO // n)
+    soma = 0
+    for inicio in range(0, n, linhas):
+        i = np.arange(inicio, min(inicio + linhas, n), dtype=np.int64)
+        soma += int((i[:, None] + j).sum())
+    return soma
+
+def _O_n2_fechada(n):
+    # Σi Σj (i + j) = 2 · n · Σi = n²(n - 1)
+    return n * n * (n - 1) if n > 0 else 0
+
+_IMPLEMENTACOES = {
+    "O(n)": {"python": _O_n_python, "numpy": _O_n_numpy, "fechada": _O_n_fechada},
+    "O(n²)": {"python": _O_n2_python, "numpy": _O_n2_numpy, "fechada": _O_n2_fechada},
+}
+
+def funcao_O_n(n, backend="python"):
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend}. Use um de {BACKENDS}")
+    return _IMPLEMENTACOES["O(n)"][backend](n)
+
+def funcao_O_n2(n, backend="python"):
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend}. Use um de {BACKENDS}")
+    return _IMPLEMENTACOES["O(n²)"][backend](n)
+
+def tabela_backends(nome, tamanhos, limites, trabalho):
+    # `limites` dá o maior n medido por backend; acima dele a célula fica em branco.
+    # Tamanhos cujo trabalho passa de 10^7 operações são medidos uma única vez.
+    print(f"\n{nome}")
+    disponiveis = backends_disponiveis()
+    print(f"{'n':>12} " + " ".join(f"{b:>14}" for b in disponiveis))
+    for n in tamanhos:
+        celulas = []
+        for backend in disponiveis:
+            if n > limites[backend]:
+                celulas.append(f"{'—':>14}")
+                continue
+            pesado = trabalho(n) > 10**7
+            medicao = bench.medir(_IMPLEMENTACOES[nome][backend], n,
+                                  repeticoes=1 if pesado else 5, aquecimento=0 if pesado else 1)
+            celulas.append(f"{medicao['media_aparada_ns'] / 1e9:13.6f}s")
+        print(f"{n:>12} " + " ".join(celulas))
+
+if __name__ == "__main__":
+    tamanhos = bench.gerar_tamanhos(10, 800, pontos=7)
+    resultados = [bench.benchmark(funcao_O_n, tamanhos, memoria=True),
+                  bench.benchmark(funcao_O_n2, tamanhos, memoria=True)]
+
+    for m_n, m_n2 in zip(resultados[0]["medicoes"], resultados[1]["medicoes"]):
+        print(f"Tamanho: {m_n['n']} - O(n): {m_n['media_aparada_ns'] / 1e9:.6f}s, "
+              f"O(n²): {m_n2['media_aparada_ns'] / 1e9:.6f}s")
+    for resultado in resultados:
+        print(f"{resultado['funcao']}: tempo {resultado['classe']} (expoente {bench.formatar_expoente(resultado['expoente'])}), "
+              f"espaço {resultado['classe_espaco']} (expoente {bench.formatar_expoente(resultado['expoente_espaco'])})")
+
+    # Todos os backends devem concordar antes de compararmos tempos
+    for n in (0, 1, 7, 200, 1234):
+        assert len({funcao_O_n(n, b) for b in backends_disponiveis()}) == 1
+        assert len({funcao_O_n2(n, b) for b in backends_disponiveis()}) == 1
+
+    tabela_backends("O(n)", [10**k for k in range(3, 10)],
+                    {"python": 10**7, "numpy": 10**9, "fechada": 10**9}, trabalho=lambda n: n)
+    tabela_backends("O(n²)", [10**k for k in range(2, 6)],
+                    {"python": 10**3, "numpy": 10**5, "fechada": 10**5}, trabalho=lambda n: n * n)
+
+    # O backend NumPy troca tempo por memória: o pico cresce com n até o limite do bloco
+    if "numpy" in backends_disponiveis():
+        espaco = bench.benchmark(lambda n: funcao_O_n(n, "numpy"), bench.gerar_tamanhos(10**3, 10**7, pontos=5),
+                                 nome="funcao_O_n[numpy]", repeticoes=3, memoria=True)
+        bench.imprimir_tabela([espaco])
@@ -29,14 +29,15 @@ def topological_sort(graph):
     return sorted_order
 
 # Exemplo de uso
-grafo = {
-    'A': ['C'],
-    'B': ['C', 'D'],
-    'C': ['E'],
-    'D': ['F'],
-    'E': [],
-    'F': []
-}
-
-resultado = topological_sort(grafo)
-print("Ordenação Topológica:", resultado)
\ No newline at end of file
+if __name__ == "__main__":
+    grafo = {
+        'A': ['C'],
+        'B': ['C', 'D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+
+    resultado = topological_sort(grafo)
+    print("Ordenação Topológica:", resultado)
\ No newline at end of file
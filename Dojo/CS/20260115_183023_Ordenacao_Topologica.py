@@ -1,9 +1,23 @@
-# Este código implementa a ordenação topológica de um grafo de dependências. 
-# A ordenação topológica é usada para organizar tarefas que dependem umas das outras, 
-# garantindo que uma tarefa só seja executada após todas as suas dependências. 
+# Este código implementa a ordenação topológica de um grafo de dependências.
+# A ordenação topológica é usada para organizar tarefas que dependem umas das outras,
+# garantindo que uma tarefa só seja executada após todas as suas dependências.
 # O código utiliza um algoritmo de busca em profundidade (DFS) para realizar a ordenação.
+# A versão iterativa usa uma pilha explícita com coloração branco/cinza/preto: não esbarra no limite de
+# recursão do Python em cadeias longas (>50 mil níveis) e, em vez de devolver uma ordem errada quando o
+# grafo tem ciclo, levanta CicloEncontrado com o caminho do ciclo.
 
+import random
+import sys
+import time
 from collections import defaultdict
+from pathlib import Path
+
+BRANCO, CINZA, PRETO = 0, 1, 2
+
+class CicloEncontrado(Exception):
+    def __init__(self, ciclo):
+        super().__init__(f"O grafo contém um ciclo: {' -> '.join(map(str, ciclo))}")
+        self.ciclo = ciclo
 
 def topological_sort(graph):
     visited = set()
@@ -22,6 +36,76 @@ def topological_sort(graph):
 
     return stack[::-1]  # Retorna a ordem inversa do stack
 
+def topological_sort_iterativo(graph):
+    # `cor` só guarda vértices já descobertos (ausente = branco); destinos que não são chaves
+    # do grafo são tratados como vértices sem saída
+    cor = {}
+    ordem = []
+    caminho = []  # Vértices cinza, na ordem em que foram abertos
+    iteradores = []  # Próximo vizinho a visitar de cada vértice em `caminho`
+    for raiz in graph:
+        if raiz in cor:
+            continue
+        cor[raiz] = CINZA
+        caminho.append(raiz)
+        iteradores.append(iter(graph[raiz]))
+        while iteradores:
+            for neighbor in iteradores[-1]:
+                estado = cor.get(neighbor, BRANCO)
+                if estado == BRANCO:
+                    cor[neighbor] = CINZA
+                    caminho.append(neighbor)
+                    iteradores.append(iter(graph.get(neighbor, ())))
+                    break
+                if estado == CINZA:  # Aresta de retorno: o ciclo é o trecho do caminho a partir de neighbor
+                    raise CicloEncontrado(caminho[caminho.index(neighbor):] + [neighbor])
+            else:
+                node = caminho.pop()
+                iteradores.pop()
+                cor[node] = PRETO
+                ordem.append(node)
+
+    ordem.reverse()
+    return ordem
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+def gerar_dag_em_camadas(num_vertices, num_arestas, camadas=200, semente=0):
+    # Arestas só vão de uma camada para uma posterior, então a profundidade fica abaixo de `camadas`
+    # e a versão recursiva consegue rodar no mesmo grafo
+    rng = random.Random(semente)
+    por_camada = max(num_vertices // camadas, 1)
+    graph = {v: [] for v in range(num_vertices)}
+    for _ in range(num_arestas):
+        u = rng.randrange(num_vertices - por_camada)
+        camada_u = u // por_camada
+        v = rng.randrange((camada_u + 1) * por_camada, min((camada_u + 3) * por_camada, num_vertices))
+        graph[u].append(v)
+    return graph
+
+def benchmark_dfs(num_vertices=200_000, num_arestas=1_000_000, profundidade_cadeia=60_000):
+    bench = carregar_script("20261018_090012_Benchmark_Complexidade.py")
+    graph = gerar_dag_em_camadas(num_vertices, num_arestas)
+    assert topological_sort(graph) == topological_sort_iterativo(graph)
+
+    for funcao in (topological_sort, topological_sort_iterativo):
+        medicao = bench.medir(funcao, graph, repeticoes=3, aquecimento=1)
+        segundos = medicao["media_aparada_ns"] / 1e9
+        print(f"{funcao.__name__:>28}: {segundos:.3f}s, {(num_vertices + num_arestas) / segundos / 1e6:.2f} M (V+E)/s")
+
+    cadeia = {v: [v + 1] for v in range(profundidade_cadeia)}
+    cadeia[profundidade_cadeia] = []
+    try:
+        topological_sort(cadeia)
+        print(f"Recursiva: cadeia de {profundidade_cadeia} níveis ordenada")
+    except RecursionError:
+        print(f"Recursiva: RecursionError numa cadeia de {profundidade_cadeia} níveis")
+    inicio = time.perf_counter()
+    ordem = topological_sort_iterativo(cadeia)
+    print(f"Iterativa: cadeia de {len(ordem) - 1} níveis ordenada em {time.perf_counter() - inicio:.3f}s")
+
 # Exemplo de uso
 if __name__ == "__main__":
     graph = defaultdict(list)
@@ -31,4 +115,12 @@ if __name__ == "__main__":
     graph['D'].extend([])
 
     print("Grafo de dependências:", dict(graph))
-    print("Ordenação topológica:", topological_sort(graph))
\ No newline at end of file
+    print("Ordenação topológica:", topological_sort(graph))
+    print("Ordenação topológica (iterativa):", topological_sort_iterativo(graph))
+
+    try:
+        topological_sort_iterativo({'A': ['B'], 'B': ['C'], 'C': ['A'], 'D': ['A']})
+    except CicloEncontrado as erro:
+        print(erro)
+
+    benchmark_dfs()
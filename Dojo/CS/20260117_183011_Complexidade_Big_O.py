@@ -1,9 +1,16 @@
 # Este código demonstra a diferença entre funções com complexidade O(n) e O(n²). 
 # A função O(n) realiza uma soma simples de elementos em uma lista, 
 # enquanto a função O(n²) compara todos os pares de elementos. 
-# Vamos observar como o tempo de execução varia com o tamanho da entrada.
+# Vamos observar como o tempo de execução e a memória (pico por chamada) variam com o tamanho da entrada.
 
-import time
+import sys
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+bench = carregar_script("20261018_090012_Benchmark_Complexidade.py")
 
 def funcao_O_n(n):
     soma = 0
@@ -18,15 +25,8 @@ def funcao_O_n2(n):
             soma += i + j
     return soma
 
-tamanhos = [10, 100, 200]
-
-for tamanho in tamanhos:
-    start = time.time()
-    funcao_O_n(tamanho)
-    end = time.time()
-    print(f"O(n) para n={tamanho}: {end - start:.6f} segundos")
-
-    start = time.time()
-    funcao_O_n2(tamanho)
-    end = time.time()
-    print(f"O(n²) para n={tamanho}: {end - start:.6f} segundos")
\ No newline at end of file
+if __name__ == "__main__":
+    tamanhos = bench.gerar_tamanhos(10, 800, pontos=7)
+    resultados = [bench.benchmark(funcao_O_n, tamanhos, memoria=True),
+                  bench.benchmark(funcao_O_n2, tamanhos, memoria=True)]
+    bench.imprimir_tabela(resultados)
@@ -0,0 +1,244 @@
+# Este código implementa um harness de benchmark para medir empiricamente a complexidade de qualquer função.
+# Cada tamanho de entrada é medido com time.perf_counter_ns, com aquecimento, várias repetições e
+# descarte dos extremos (média aparada), o que torna as medições muito menos ruidosas que um único time.time().
+# A ordem de crescimento é estimada por regressão log-log e comparada com as classes O(1), O(log n),
+# O(n), O(n log n), O(n²) e O(n³). Os resultados podem ser exportados em JSON ou CSV, e a função
+# verificar_complexidade serve para detectar regressões algorítmicas no nosso próprio código.
+# Com memoria=True o benchmark também mede a memória de pico e a memória líquida de cada chamada
+# (via tracemalloc, ou, no Linux, amostrando o RSS do processo para código nativo que não passa pelo
+# alocador do Python) e ajusta uma classe de complexidade de espaço ao lado da de tempo.
+# Não são necessárias bibliotecas externas.
+
+import csv
+import gc
+import json
+import math
+import os
+import threading
+import time
+import tracemalloc
+
+CLASSES_COMPLEXIDADE = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n) ** 2,
+    "O(n³)": lambda n: float(n) ** 3,
+}
+
+def gerar_tamanhos(inicio, fim, pontos=8):
+    # Gera tamanhos em progressão geométrica, que é o espaçamento adequado para a regressão log-log
+    if pontos < 2 or inicio >= fim:
+        return [inicio]
+    razao = (fim / inicio) ** (1 / (pontos - 1))
+    tamanhos = []
+    for i in range(pontos):
+        n = int(round(inicio * razao ** i))
+        if not tamanhos or n > tamanhos[-1]:
+            tamanhos.append(n)
+    return tamanhos
+
+def media_aparada(amostras, corte=0.2):
+    # Descarta a fração `corte` das amostras em cada extremidade antes de tirar a média
+    ordenadas = sorted(amostras)
+    k = int(len(ordenadas) * corte)
+    if len(ordenadas) - 2 * k < 1:
+        k = (len(ordenadas) - 1) // 2
+    centrais = ordenadas[k:len(ordenadas) - k]
+    return sum(centrais) / len(centrais)
+
+def medir(funcao, entrada, repeticoes=7, aquecimento=2, corte=0.2):
+    for _ in range(aquecimento):
+        funcao(entrada)
+
+    amostras = []
+    gc_ativo = gc.isenabled()
+    gc.disable()  # Evita que uma coleta de lixo caia no meio de uma única medição
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter_ns()
+            funcao(entrada)
+            amostras.append(time.perf_counter_ns() - inicio)
+    finally:
+        if gc_ativo:
+            gc.enable()
+
+    return {
+        "media_aparada_ns": media_aparada(amostras, corte),
+        "mediana_ns": sorted(amostras)[len(amostras) // 2],
+        "min_ns": min(amostras),
+        "max_ns": max(amostras),
+        "repeticoes": repeticoes,
+    }
+
+def _rss_bytes():
+    # Memória residente atual do processo. /proc só existe no Linux, e a biblioteca padrão não tem outra fonte
+    # do RSS atual (ru_maxrss é o pico da vida inteira do processo, que não serve para medir uma chamada)
+    try:
+        with open("/proc/self/statm") as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError as erro:
+        raise RuntimeError("O modo de memória 'rss' precisa de /proc/self/statm (Linux); use 'tracemalloc'") from erro
+
+def medir_memoria(funcao, entrada, modo="tracemalloc", intervalo=0.001):
+    # Pico: maior uso acima da linha de base durante a chamada.
+    # Líquido: o que continua alocado ao final da chamada, incluindo o valor devolvido.
+    gc.collect()
+    if modo == "tracemalloc":
+        ja_ativo = tracemalloc.is_tracing()
+        if not ja_ativo:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        antes, _ = tracemalloc.get_traced_memory()
+        resultado = funcao(entrada)
+        depois, pico = tracemalloc.get_traced_memory()
+        del resultado
+        if not ja_ativo:
+            tracemalloc.stop()
+        return {"pico_bytes": pico - antes, "liquido_bytes": depois - antes}
+
+    if modo == "rss":
+        base = _rss_bytes()
+        maximo = [base]
+        parar = threading.Event()
+
+        def amostrar():
+            while not parar.is_set():
+                maximo[0] = max(maximo[0], _rss_bytes())
+                parar.wait(intervalo)
+
+        amostrador = threading.Thread(target=amostrar, daemon=True)
+        amostrador.start()
+        try:
+            resultado = funcao(entrada)
+        finally:
+            parar.set()
+            amostrador.join()
+        depois = _rss_bytes()
+        del resultado
+        return {"pico_bytes": max(maximo[0], depois) - base, "liquido_bytes": depois - base}
+
+    raise ValueError(f"Modo de memória desconhecido: {modo}. Use 'tracemalloc' ou 'rss'")
+
+def _regressao_linear(xs, ys):
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    sxx = sum((x - media_x) ** 2 for x in xs)
+    if sxx == 0:
+        return 0.0, media_y
+    sxy = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    inclinacao = sxy / sxx
+    return inclinacao, media_y - inclinacao * media_x
+
+def ajustar_complexidade(tamanhos, valores):
+    # Ignora pontos com n < 2 (log n = 0) e medições nulas, que não têm logaritmo
+    pontos = [(n, v) for n, v in zip(tamanhos, valores) if n >= 2 and v > 0]
+    if len(pontos) < 2:
+        return {"classe": "indeterminada", "expoente": None, "erros": {}}
+
+    log_n = [math.log(n) for n, _ in pontos]
+    log_v = [math.log(v) for _, v in pontos]
+    expoente, _ = _regressao_linear(log_n, log_v)
+
+    # Para cada classe, v ≈ c·f(n) vira log v - log f(n) ≈ log c; o melhor ajuste
+    # é o que deixa esse resíduo mais constante (menor variância)
+    erros = {}
+    for nome, f in CLASSES_COMPLEXIDADE.items():
+        residuos = [lv - math.log(f(n)) for (n, _), lv in zip(pontos, log_v)]
+        media = sum(residuos) / len(residuos)
+        erros[nome] = sum((r - media) ** 2 for r in residuos) / len(residuos)
+
+    classe = min(erros, key=erros.get)
+    return {"classe": classe, "expoente": expoente, "erros": erros}
+
+def benchmark(funcao, tamanhos, preparar=None, nome=None, repeticoes=7, aquecimento=2, corte=0.2,
+              memoria=False, modo_memoria="tracemalloc"):
+    # `preparar(n)` constrói a entrada para o tamanho n fora da região cronometrada;
+    # sem ela a função recebe o próprio n. A memória é medida numa chamada à parte,
+    # porque o tracemalloc distorceria os tempos.
+    medicoes = []
+    for n in tamanhos:
+        entrada = preparar(n) if preparar else n
+        resultado = medir(funcao, entrada, repeticoes, aquecimento, corte)
+        if memoria:
+            resultado.update(medir_memoria(funcao, entrada, modo_memoria))
+        resultado["n"] = n
+        medicoes.append(resultado)
+
+    tamanhos_medidos = [m["n"] for m in medicoes]
+    ajuste = ajustar_complexidade(tamanhos_medidos, [m["media_aparada_ns"] for m in medicoes])
+    relatorio = {
+        "funcao": nome or getattr(funcao, "__name__", repr(funcao)),
+        "medicoes": medicoes,
+        "classe": ajuste["classe"],
+        "expoente": ajuste["expoente"],
+    }
+    if memoria:
+        # Um pico de 0 bytes é espaço constante; 1 byte evita o log(0) sem mudar a classe
+        ajuste_espaco = ajustar_complexidade(tamanhos_medidos, [max(m["pico_bytes"], 1) for m in medicoes])
+        relatorio["classe_espaco"] = ajuste_espaco["classe"]
+        relatorio["expoente_espaco"] = ajuste_espaco["expoente"]
+    return relatorio
+
+def verificar_complexidade(resultado, esperada):
+    # Devolve False se a classe ajustada for pior que a esperada (regressão algorítmica)
+    ordem = list(CLASSES_COMPLEXIDADE)
+    if resultado["classe"] not in ordem:
+        return False
+    return ordem.index(resultado["classe"]) <= ordem.index(esperada)
+
+def salvar_json(resultados, caminho):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultados, arquivo, ensure_ascii=False, indent=2)
+
+def salvar_csv(resultados, caminho):
+    campos = ["funcao", "n", "media_aparada_ns", "mediana_ns", "min_ns", "max_ns", "repeticoes", "classe", "expoente",
+              "pico_bytes", "liquido_bytes", "classe_espaco", "expoente_espaco"]
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=campos, extrasaction="ignore")
+        escritor.writeheader()
+        for resultado in resultados:
+            for medicao in resultado["medicoes"]:
+                escritor.writerow({**medicao, "funcao": resultado["funcao"],
+                                   "classe": resultado["classe"], "expoente": resultado["expoente"],
+                                   "classe_espaco": resultado.get("classe_espaco"),
+                                   "expoente_espaco": resultado.get("expoente_espaco")})
+
+def formatar_expoente(expoente):
+    # Com menos de 2 pontos válidos ajustar_complexidade não tem expoente (None)
+    return "indeterminado" if expoente is None else f"{expoente:.2f}"
+
+def imprimir_tabela(resultados):
+    for resultado in resultados:
+        linha = (f"{resultado['funcao']}: tempo {resultado['classe']} "
+                 f"(expoente log-log {formatar_expoente(resultado['expoente'])})")
+        if "classe_espaco" in resultado:
+            linha += (f", espaço {resultado['classe_espaco']} "
+                      f"(expoente log-log {formatar_expoente(resultado['expoente_espaco'])})")
+        print(linha)
+        for m in resultado["medicoes"]:
+            celula = f"    n={m['n']:>10}  {m['media_aparada_ns'] / 1e6:12.4f} ms  (min {m['min_ns'] / 1e6:.4f} ms)"
+            if "pico_bytes" in m:
+                celula += f"  pico {m['pico_bytes']:>12} B  líquido {m['liquido_bytes']:>12} B"
+            print(celula)
+
+# Exemplo de uso
+if __name__ == "__main__":
+    def busca_linear(lista):
+        return -1 in lista
+
+    def ordenacao(lista):
+        return sorted(lista, reverse=True)
+
+    def pares(n):
+        return [(i, i + 1) for i in range(n)]
+
+    tamanhos = gerar_tamanhos(1_000, 200_000, pontos=8)
+    resultados = [
+        benchmark(busca_linear, tamanhos, preparar=lambda n: list(range(n))),
+        benchmark(ordenacao, tamanhos, preparar=lambda n: [(i * 7919) % n for i in range(n)], memoria=True),
+        benchmark(pares, tamanhos, repeticoes=3, memoria=True),
+    ]
+    imprimir_tabela(resultados)
+    print("Busca linear dentro de O(n)?", verificar_complexidade(resultados[0], "O(n)"))
@@ -0,0 +1,171 @@
+# Este código implementa um motor alternativo para a ordenação topológica de Kahn, pensado para grafos com
+# milhões de vértices e dezenas de milhões de arestas. Os rótulos dos vértices são internados como ids
+# inteiros e a adjacência é guardada em formato CSR (um vetor de deslocamentos e um vetor de destinos),
+# em vez de um dicionário de listas. Os graus de entrada saem de um único np.bincount e a fronteira é
+# processada nível a nível com operações vetorizadas do NumPy.
+# A ordem devolvida é exatamente a mesma da versão com deque em 20260104_183025_Ordenacao_Topologica.py.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+kahn = carregar_script("20260104_183025_Ordenacao_Topologica.py")
+
+MENSAGEM_CICLO = "O grafo contém um ciclo, ordenação não é possível."
+
+class GrafoCSR:
+    def __init__(self, deslocamentos, destinos, rotulos=None):
+        # Os vizinhos do vértice i são destinos[deslocamentos[i]:deslocamentos[i + 1]].
+        # Sem rótulos, os próprios ids 0..n-1 são os nomes dos vértices.
+        self.deslocamentos = np.asarray(deslocamentos, dtype=np.int64)
+        self.destinos = np.asarray(destinos, dtype=np.int64)
+        self.rotulos = rotulos
+
+    @property
+    def num_vertices(self):
+        return len(self.deslocamentos) - 1
+
+    @property
+    def num_arestas(self):
+        return len(self.destinos)
+
+    @property
+    def nbytes(self):
+        return self.deslocamentos.nbytes + self.destinos.nbytes
+
+    @classmethod
+    def de_dicionario(cls, graph):
+        # Interna primeiro as chaves (na ordem do dicionário) e depois destinos que não são chaves,
+        # para que os ids sigam a mesma ordem em que a versão com dicionário enxerga os vértices
+        ids = {rotulo: i for i, rotulo in enumerate(graph)}
+        rotulos = list(graph)
+
+        def internar(rotulo):
+            if rotulo not in ids:
+                ids[rotulo] = len(rotulos)
+                rotulos.append(rotulo)
+            return ids[rotulo]
+
+        destinos = np.fromiter((internar(v) for vizinhos in graph.values() for v in vizinhos), dtype=np.int64)
+        graus_saida = np.fromiter((len(vizinhos) for vizinhos in graph.values()), dtype=np.int64, count=len(graph))
+        deslocamentos = np.zeros(len(rotulos) + 1, dtype=np.int64)
+        np.cumsum(graus_saida, out=deslocamentos[1:len(graph) + 1])
+        deslocamentos[len(graph) + 1:] = deslocamentos[len(graph)]
+        return cls(deslocamentos, destinos, rotulos)
+
+    @classmethod
+    def de_arestas(cls, origens, destinos, num_vertices, rotulos=None):
+        # Ordenação estável por origem: a lista de vizinhos de cada vértice mantém a ordem das arestas
+        origens = np.asarray(origens, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int64)
+        permutacao = np.argsort(origens, kind="stable")
+        deslocamentos = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origens, minlength=num_vertices), out=deslocamentos[1:])
+        return cls(deslocamentos, destinos[permutacao], rotulos)
+
+    def graus_entrada(self):
+        return np.bincount(self.destinos, minlength=self.num_vertices)
+
+    def vizinhos(self, fronteira):
+        # Concatena as fatias CSR dos vértices da fronteira, na ordem da fronteira, sem laço em Python
+        inicios = self.deslocamentos[fronteira]
+        comprimentos = self.deslocamentos[fronteira + 1] - inicios
+        total = int(comprimentos.sum())
+        if total == 0:
+            return self.destinos[:0]
+        saltos = np.repeat(inicios - (np.cumsum(comprimentos) - comprimentos), comprimentos)
+        return self.destinos[saltos + np.arange(total)]
+
+    def ordenar_ids(self):
+        # Kahn nível a nível. Na versão com deque, um vértice entra na fila quando a última aresta que
+        # zera seu grau é processada; aqui isso equivale a ordenar os novos vértices de grau zero pela
+        # última ocorrência deles entre os destinos da fronteira atual.
+        grau = self.graus_entrada()
+        fronteira = np.flatnonzero(grau == 0)
+        niveis = []
+        while fronteira.size:
+            niveis.append(fronteira)
+            alvos = self.vizinhos(fronteira)
+            if not alvos.size:
+                break
+            unicos, primeira_no_reverso, contagens = np.unique(alvos[::-1], return_index=True, return_counts=True)
+            grau[unicos] -= contagens
+            zerados = grau[unicos] == 0
+            ultima_ocorrencia = len(alvos) - 1 - primeira_no_reverso[zerados]
+            fronteira = unicos[zerados][np.argsort(ultima_ocorrencia)]
+
+        ordem = np.concatenate(niveis) if niveis else np.empty(0, dtype=np.int64)
+        if len(ordem) != self.num_vertices:
+            return None
+        return ordem
+
+def topological_sort_csr(graph):
+    # Aceita o mesmo dicionário de listas da versão original ou um GrafoCSR já construído
+    grafo = graph if isinstance(graph, GrafoCSR) else GrafoCSR.de_dicionario(graph)
+    ordem = grafo.ordenar_ids()
+    if ordem is None:
+        return MENSAGEM_CICLO
+    if grafo.rotulos is None:
+        return ordem.tolist()
+    return [grafo.rotulos[i] for i in ordem.tolist()]
+
+def gerar_dag_aleatorio(num_vertices, num_arestas, semente=0):
+    # Arestas u -> v com u < v numa numeração aleatória, o que garante a ausência de ciclos
+    rng = np.random.default_rng(semente)
+    a = rng.integers(0, num_vertices, size=num_arestas, dtype=np.int64)
+    b = rng.integers(0, num_vertices - 1, size=num_arestas, dtype=np.int64)
+    b += b >= a  # Evita laços a -> a
+    numeracao = rng.permutation(num_vertices)
+    return numeracao[np.minimum(a, b)], numeracao[np.maximum(a, b)]
+
+def benchmark_motores(num_vertices, num_arestas):
+    origens, destinos = gerar_dag_aleatorio(num_vertices, num_arestas)
+
+    inicio = time.perf_counter()
+    grafo_dict = {u: [] for u in range(num_vertices)}
+    for u, v in zip(origens.tolist(), destinos.tolist()):
+        grafo_dict[u].append(v)
+    construcao_dict = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    grafo_csr = GrafoCSR.de_arestas(origens, destinos, num_vertices)
+    construcao_csr = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    ordem_dict = kahn.topological_sort(grafo_dict)
+    tempo_dict = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    ordem_csr = grafo_csr.ordenar_ids()
+    tempo_csr = time.perf_counter() - inicio
+
+    assert ordem_csr is not None and ordem_csr.tolist() == ordem_dict
+    print(f"V={num_vertices:,} E={num_arestas:,}")
+    print(f"  dicionário: construção {construcao_dict:.2f}s, ordenação {tempo_dict:.2f}s")
+    print(f"  CSR:        construção {construcao_csr:.2f}s, ordenação {tempo_csr:.2f}s "
+          f"({grafo_csr.nbytes / 2**20:.0f} MB de arrays)")
+    print(f"  aceleração na ordenação: {tempo_dict / tempo_csr:.1f}x")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        'A': ['C'],
+        'B': ['C', 'D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+    print("Ordenação Topológica (CSR):", topological_sort_csr(grafo))
+    print("Com ciclo:", topological_sort_csr({'A': ['B'], 'B': ['A']}))
+
+    # Passe o número de arestas na linha de comando para o teste completo, ex.: 10000000
+    num_arestas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    benchmark_motores(max(num_arestas // 10, 2), num_arestas)
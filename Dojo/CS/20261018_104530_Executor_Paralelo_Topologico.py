@@ -0,0 +1,136 @@
+# Este código implementa um executor paralelo guiado pela ordenação topológica: dado o grafo de dependências
+# (no mesmo formato de dicionário de listas da ordenação de Kahn) e uma função por vértice, ele dispara cada
+# tarefa assim que todas as suas dependências terminaram, em vez de executar a ordem serialmente.
+# Há três modos: "thread" (ThreadPoolExecutor, bom para E/S e código que libera o GIL), "process"
+# (ProcessPoolExecutor, para CPU; as funções precisam ser serializáveis com pickle) e "asyncio" (corrotinas,
+# ou funções comuns rodando em threads), todos com paralelismo máximo configurável.
+# Ao final são relatados o tempo de cada tarefa, o caminho crítico e o paralelismo efetivamente alcançado.
+
+import asyncio
+import functools
+import inspect
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+kahn = carregar_script("20260104_183025_Ordenacao_Topologica.py")
+critico = carregar_script("20261018_121030_Caminho_Critico_e_Escalonamento.py")
+
+MODOS = ("thread", "process", "asyncio")
+
+def _executar_cronometrado(tarefa):
+    # perf_counter usa o relógio monotônico do sistema, então os instantes de processos diferentes são comparáveis
+    inicio = time.perf_counter()
+    resultado = tarefa()
+    return resultado, inicio, time.perf_counter()
+
+def _preparar(graph, tarefas):
+    ordem = kahn.topological_sort(graph)
+    if isinstance(ordem, str):
+        raise ValueError(ordem)
+    faltando = [v for v in ordem if v not in tarefas]
+    if faltando:
+        raise ValueError(f"Vértices sem tarefa associada: {faltando}")
+    pendentes = {v: 0 for v in ordem}
+    for u in graph:
+        for v in graph[u]:
+            pendentes[v] += 1
+    return ordem, pendentes
+
+def _executar_em_pool(graph, tarefas, pendentes, pool):
+    tempos = {}
+    resultados = {}
+    em_execucao = {pool.submit(_executar_cronometrado, tarefas[v]): v for v, n in pendentes.items() if n == 0}
+    while em_execucao:
+        concluidos, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+        for futuro in concluidos:
+            u = em_execucao.pop(futuro)
+            resultados[u], inicio, fim = futuro.result()
+            tempos[u] = (inicio, fim)
+            for v in graph.get(u, ()):
+                pendentes[v] -= 1
+                if pendentes[v] == 0:
+                    em_execucao[pool.submit(_executar_cronometrado, tarefas[v])] = v
+    return resultados, tempos
+
+async def _executar_asyncio(graph, tarefas, pendentes, max_paralelismo):
+    limite = asyncio.Semaphore(max_paralelismo)
+    tempos = {}
+    resultados = {}
+
+    async def rodar(v):
+        async with limite:
+            inicio = time.perf_counter()
+            if inspect.iscoroutinefunction(tarefas[v]):
+                resultados[v] = await tarefas[v]()
+            else:
+                resultados[v] = await asyncio.to_thread(tarefas[v])
+            tempos[v] = (inicio, time.perf_counter())
+        return v
+
+    em_execucao = {asyncio.create_task(rodar(v)) for v, n in pendentes.items() if n == 0}
+    while em_execucao:
+        concluidos, em_execucao = await asyncio.wait(em_execucao, return_when=asyncio.FIRST_COMPLETED)
+        for tarefa in concluidos:
+            u = tarefa.result()
+            for v in graph.get(u, ()):
+                pendentes[v] -= 1
+                if pendentes[v] == 0:
+                    em_execucao.add(asyncio.create_task(rodar(v)))
+    return resultados, tempos
+
+def executar(graph, tarefas, modo="thread", max_paralelismo=4):
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconhecido: {modo}. Use um de {MODOS}")
+    ordem, pendentes = _preparar(graph, tarefas)
+
+    inicio = time.perf_counter()
+    if modo == "asyncio":
+        resultados, tempos = asyncio.run(_executar_asyncio(graph, tarefas, pendentes, max_paralelismo))
+    else:
+        classe_pool = ThreadPoolExecutor if modo == "thread" else ProcessPoolExecutor
+        with classe_pool(max_workers=max_paralelismo) as pool:
+            resultados, tempos = _executar_em_pool(graph, tarefas, pendentes, pool)
+    tempo_total = time.perf_counter() - inicio
+
+    duracoes = {v: fim - comeco for v, (comeco, fim) in tempos.items()}
+    analise = critico.caminho_critico(graph, duracoes, ordem)
+    return {
+        "resultados": resultados,
+        "tarefas": {v: {"inicio": tempos[v][0] - inicio, "duracao": duracoes[v]} for v in ordem},
+        "tempo_total": tempo_total,
+        "caminho_critico": analise["caminho"],
+        "duracao_caminho_critico": analise["duracao"],
+        "paralelismo": sum(duracoes.values()) / tempo_total if tempo_total else 0.0,
+    }
+
+def imprimir_relatorio(relatorio):
+    for v, t in relatorio["tarefas"].items():
+        print(f"  {v!s:>6}: início {t['inicio']:.3f}s, duração {t['duracao']:.3f}s")
+    print(f"  Tempo total: {relatorio['tempo_total']:.3f}s")
+    print(f"  Caminho crítico: {' -> '.join(map(str, relatorio['caminho_critico']))} "
+          f"({relatorio['duracao_caminho_critico']:.3f}s)")
+    print(f"  Paralelismo alcançado: {relatorio['paralelismo']:.2f}")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        'A': ['C'],
+        'B': ['C', 'D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+    duracoes = {'A': 0.2, 'B': 0.1, 'C': 0.3, 'D': 0.1, 'E': 0.1, 'F': 0.4}
+    # functools.partial de uma função de módulo é serializável, então serve também para o modo "process"
+    tarefas = {v: functools.partial(time.sleep, d) for v, d in duracoes.items()}
+
+    for modo in MODOS:
+        print(f"Modo {modo}:")
+        imprimir_relatorio(executar(grafo, tarefas, modo=modo, max_paralelismo=3))
@@ -0,0 +1,252 @@
+# Este código implementa um carregador de listas de arestas em disco para as ordenações topológicas do Dojo,
+# para que os grafos não precisem mais ser literais de dicionário dentro dos scripts.
+# Arquivos de texto ("u v" por linha, ou "u,v" em .csv; de # até o fim da linha é comentário) são lidos em blocos
+# de tamanho fixo, e arquivos binários (.bin: pares de inteiros int64 little-endian) são lidos via mmap,
+# sem cópia. Nenhuma lista de tuplas com o arquivo inteiro é construída: carregar_dicionario monta direto
+# o dicionário de listas usado pelas versões de Kahn e DFS, e carregar_csr monta o GrafoCSR em duas
+# passadas (graus e depois destinos), de modo que a memória extra além do próprio grafo é um bloco.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import mmap
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+kahn = carregar_script("20260104_183025_Ordenacao_Topologica.py")
+dfs = carregar_script("20260115_183023_Ordenacao_Topologica.py")
+csr = carregar_script("20261018_093015_Ordenacao_Topologica_CSR.py")
+
+TAMANHO_BLOCO = 1 << 24  # 16 MB de texto ou 1M de arestas binárias por bloco
+TIPO_BINARIO = np.dtype("<i8")
+# Bytes aceitos nas linhas de arestas em texto (já sem comentários e com as vírgulas trocadas por espaço)
+BYTES_DE_ESPACO = b" \t\r\n\v\f"
+BYTES_PERMITIDOS = BYTES_DE_ESPACO + b"0123456789"
+NUMERO = re.compile(rb"[0-9]+")
+NEGATIVO = re.compile(rb"-[0-9]+")
+
+def detectar_formato(caminho):
+    extensao = Path(caminho).suffix.lower()
+    if extensao == ".bin":
+        return "binario"
+    if extensao == ".csv":
+        return "csv"
+    return "texto"
+
+def _blocos_de_texto(caminho, tamanho_bloco):
+    # Blocos de bytes que sempre terminam numa quebra de linha; o pedaço final incompleto
+    # é guardado e emendado no começo do bloco seguinte
+    resto = b""
+    with open(caminho, "rb") as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            bloco = resto + bloco
+            corte = bloco.rfind(b"\n") + 1
+            resto = bloco[corte:]
+            if corte:
+                yield bloco[:corte]
+    if resto.strip():
+        yield resto
+
+def _sem_comentarios(bloco):
+    # Corta de # até o fim da linha, mantendo as linhas (vazias) para que a numeração das linhas não mude
+    if b"#" not in bloco:
+        return bloco
+    return b"\n".join(linha.split(b"#", 1)[0] for linha in bloco.split(b"\n"))
+
+def _erro_na_linha(bloco, caminho, primeira_linha, posicao):
+    # Monta a mensagem de erro da linha que contém o byte `posicao`
+    numero_linha = primeira_linha + bloco.count(b"\n", 0, posicao)
+    inicio = bloco.rfind(b"\n", 0, posicao) + 1
+    campos = bloco[inicio:].split(b"\n", 1)[0].split()
+    for campo in campos:
+        if NEGATIVO.fullmatch(campo):
+            return ValueError(f"{caminho}, linha {numero_linha}: vértice negativo {campo.decode('ascii')}")
+        if not NUMERO.fullmatch(campo):
+            return ValueError(f"{caminho}, linha {numero_linha}: valor inválido {campo.decode('ascii', 'replace')!r}")
+    return ValueError(f"{caminho}, linha {numero_linha}: esperados 2 vértices, encontrados {len(campos)}")
+
+def _validar_linhas(bloco, caminho, primeira_linha):
+    # Cada linha não vazia precisa ter exatamente dois inteiros não negativos (os ids indexam o CSR). A conferência
+    # é vetorizada e a linha só é examinada (para a mensagem) se houver erro
+    invalidos = bloco.translate(None, BYTES_PERMITIDOS)
+    if invalidos:
+        raise _erro_na_linha(bloco, caminho, primeira_linha, bloco.index(invalidos[:1]))
+    # Depois do translate só sobram espaços (bytes <= 32) e dígitos: os números são os trechos sem espaço.
+    # tem_quebra[j] diz se há quebra de linha entre o início do número j e o do número j + 1; numa linha válida
+    # o par (2i, 2i + 1) não tem quebra entre eles e sempre há uma antes do par seguinte
+    codigos = np.frombuffer(bloco, dtype=np.uint8)
+    espacos = codigos <= ord(" ")
+    inicios = ~espacos
+    inicios[1:] &= espacos[:-1]
+    inicios = np.flatnonzero(inicios)
+    if not len(inicios):
+        return
+    tem_quebra = np.logical_or.reduceat(codigos == ord("\n"), inicios)
+    erros = [2 * j for j in np.flatnonzero(tem_quebra[0::2])[:1]]  # Número sozinho na linha
+    erros += [2 * j + 1 for j in np.flatnonzero(~tem_quebra[1:-1:2])[:1]]  # Terceiro número na linha
+    if len(inicios) % 2:
+        erros.append(len(inicios) - 1)
+    if erros:
+        raise _erro_na_linha(bloco, caminho, primeira_linha, inicios[min(erros)])
+
+def blocos_de_arestas(caminho, formato=None, tamanho_bloco=TAMANHO_BLOCO):
+    # Gera pares (origens, destinos) de arrays int64, um bloco por vez
+    formato = formato or detectar_formato(caminho)
+    if formato == "binario":
+        tamanho = os.path.getsize(caminho)
+        if tamanho % (2 * TIPO_BINARIO.itemsize):
+            raise ValueError(f"{caminho}: {tamanho} bytes não formam pares de int64 "
+                             f"(arquivo truncado? o tamanho deve ser múltiplo de {2 * TIPO_BINARIO.itemsize})")
+        if tamanho == 0:
+            return
+        with open(caminho, "rb") as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            pares = None
+            try:
+                pares = np.frombuffer(mapa, dtype=TIPO_BINARIO).reshape(-1, 2)
+                passo = max(tamanho_bloco // (2 * TIPO_BINARIO.itemsize), 1)
+                for inicio in range(0, len(pares), passo):
+                    fim = inicio + passo
+                    negativos = np.flatnonzero((pares[inicio:fim] < 0).any(axis=1))
+                    if len(negativos):
+                        raise ValueError(f"{caminho}, aresta {inicio + negativos[0]}: vértice negativo "
+                                         f"{pares[inicio + negativos[0]].min()}")
+                    yield pares[inicio:fim, 0].copy(), pares[inicio:fim, 1].copy()
+            finally:
+                del pares  # O mmap só pode ser fechado quando nenhuma view aponta para ele
+                mapa.close()
+        return
+
+    primeira_linha = 1
+    for bloco in _blocos_de_texto(caminho, tamanho_bloco):
+        bloco = _sem_comentarios(bloco)
+        if formato == "csv":
+            bloco = bloco.replace(b",", b" ")
+        _validar_linhas(bloco, caminho, primeira_linha)
+        numeros = np.fromstring(bloco.decode("ascii"), dtype=np.int64, sep=" ")
+        primeira_linha += bloco.count(b"\n")
+        yield numeros[0::2], numeros[1::2]
+
+def iterar_arestas(caminho, formato=None, inteiros=True, tamanho_bloco=TAMANHO_BLOCO):
+    # Arestas uma a uma; com inteiros=False os rótulos de texto são mantidos como str
+    formato = formato or detectar_formato(caminho)
+    if inteiros or formato == "binario":
+        for origens, destinos in blocos_de_arestas(caminho, formato, tamanho_bloco):
+            yield from zip(origens.tolist(), destinos.tolist())
+        return
+
+    separador = "," if formato == "csv" else None
+    with open(caminho, encoding="utf-8") as arquivo:
+        for numero_linha, linha in enumerate(arquivo, 1):
+            linha = linha.split("#", 1)[0].strip()
+            if linha:
+                campos = linha.split(separador)
+                if len(campos) != 2:
+                    raise ValueError(f"{caminho}, linha {numero_linha}: esperados 2 vértices, encontrados {len(campos)}")
+                yield campos[0].strip(), campos[1].strip()
+
+def carregar_dicionario(caminho, formato=None, inteiros=True, tamanho_bloco=TAMANHO_BLOCO):
+    # Dicionário de listas no formato esperado por topological_sort (Kahn) e pelas versões DFS;
+    # vértices que só aparecem como destino ganham uma lista vazia
+    graph = {}
+    for u, v in iterar_arestas(caminho, formato, inteiros, tamanho_bloco):
+        vizinhos = graph.get(u)
+        if vizinhos is None:
+            vizinhos = graph[u] = []
+        vizinhos.append(v)
+        if v not in graph:
+            graph[v] = []
+    return graph
+
+def carregar_csr(caminho, formato=None, tamanho_bloco=TAMANHO_BLOCO):
+    # Primeira passada: graus de saída e maior id. Segunda passada: cada bloco é ordenado de forma
+    # estável pela origem e escrito direto na sua posição final, então a lista de vizinhos de cada
+    # vértice fica na mesma ordem das arestas no arquivo, como em GrafoCSR.de_arestas
+    graus = np.zeros(0, dtype=np.int64)
+    maior_id = -1
+    for origens, destinos in blocos_de_arestas(caminho, formato, tamanho_bloco):
+        if not len(origens):
+            continue
+        maior_id = max(maior_id, int(origens.max()), int(destinos.max()))
+        contagem = np.bincount(origens)
+        if len(contagem) > len(graus):
+            graus = np.pad(graus, (0, len(contagem) - len(graus)))
+        graus[:len(contagem)] += contagem
+
+    num_vertices = maior_id + 1
+    deslocamentos = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(graus, out=deslocamentos[1:len(graus) + 1])
+    deslocamentos[len(graus) + 1:] = deslocamentos[len(graus)]
+    vizinhos = np.empty(deslocamentos[-1], dtype=np.int64)
+    cursor = deslocamentos[:-1].copy()
+
+    for origens, destinos in blocos_de_arestas(caminho, formato, tamanho_bloco):
+        if not len(origens):
+            continue
+        permutacao = np.argsort(origens, kind="stable")
+        origens, destinos = origens[permutacao], destinos[permutacao]
+        unicos, primeiros, contagens = np.unique(origens, return_index=True, return_counts=True)
+        posicao_no_grupo = np.arange(len(origens)) - np.repeat(primeiros, contagens)
+        vizinhos[cursor[origens] + posicao_no_grupo] = destinos
+        cursor[unicos] += contagens
+
+    return csr.GrafoCSR(deslocamentos, vizinhos)
+
+def salvar_binario(origens, destinos, caminho):
+    pares = np.empty((len(origens), 2), dtype=TIPO_BINARIO)
+    pares[:, 0] = origens
+    pares[:, 1] = destinos
+    pares.tofile(caminho)
+
+def salvar_texto(origens, destinos, caminho, separador=" ", tamanho_bloco=1 << 20):
+    with open(caminho, "w", encoding="ascii") as arquivo:
+        for inicio in range(0, len(origens), tamanho_bloco):
+            fim = inicio + tamanho_bloco
+            arquivo.writelines(f"{u}{separador}{v}\n"
+                               for u, v in zip(origens[inicio:fim].tolist(), destinos[inicio:fim].tolist()))
+
+# Exemplo de uso
+if __name__ == "__main__":
+    num_vertices, num_arestas = 200_000, 2_000_000
+    origens, destinos = csr.gerar_dag_aleatorio(num_vertices, num_arestas)
+    # Garante que o maior id apareça, para que todos os formatos enxerguem os mesmos vértices
+    origens[0], destinos[0] = 0, num_vertices - 1
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivos = {
+            "texto": os.path.join(pasta, "arestas.txt"),
+            "csv": os.path.join(pasta, "arestas.csv"),
+            "binario": os.path.join(pasta, "arestas.bin"),
+        }
+        salvar_texto(origens, destinos, arquivos["texto"])
+        salvar_texto(origens, destinos, arquivos["csv"], separador=",")
+        salvar_binario(origens, destinos, arquivos["binario"])
+        esperado = csr.GrafoCSR.de_arestas(origens, destinos, num_vertices).ordenar_ids().tolist()
+
+        for formato, caminho in arquivos.items():
+            tamanho = os.path.getsize(caminho) / 2**20
+            inicio = time.perf_counter()
+            grafo_csr = carregar_csr(caminho)
+            tempo_csr = time.perf_counter() - inicio
+            assert grafo_csr.ordenar_ids().tolist() == esperado
+            print(f"{formato:>8} ({tamanho:.0f} MB): CSR carregado em {tempo_csr:.2f}s")
+
+        inicio = time.perf_counter()
+        graph = carregar_dicionario(arquivos["binario"])
+        print(f"Dicionário carregado do binário em {time.perf_counter() - inicio:.2f}s")
+        ordem_kahn = kahn.topological_sort(graph)
+        ordem_dfs = dfs.topological_sort_iterativo(graph)
+        posicao = {v: i for i, v in enumerate(ordem_dfs)}
+        assert all(posicao[u] < posicao[v] for u, v in zip(origens.tolist(), destinos.tolist()))
+        print(f"Kahn: {len(ordem_kahn)} vértices, DFS iterativo: {len(ordem_dfs)} vértices")
@@ -0,0 +1,176 @@
+# Este código implementa um índice de alcançabilidade (fecho transitivo) para grafos de dependências.
+# Em vez de uma busca em profundidade nova a cada pergunta "A depende de B?", o índice é calculado uma vez,
+# em ordem topológica reversa, como uma matriz de bitsets (uma linha de palavras uint64 por vértice):
+# a linha de u é a união das linhas dos seus sucessores mais o próprio bit de u. Cada consulta vira o teste
+# de um único bit, em O(1). O mesmo índice gera a redução transitiva (as arestas que não são implicadas por
+# outros caminhos) e é atualizado incrementalmente quando novas arestas são inseridas.
+# A matriz ocupa V²/8 bytes (≈1.2 GB para 100 mil vértices), o preço das consultas em tempo constante.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+dfs = carregar_script("20260115_183023_Ordenacao_Topologica.py")
+CicloEncontrado = dfs.CicloEncontrado
+
+class IndiceAlcancabilidade:
+    def __init__(self, graph):
+        # A ordem topológica vem do DFS iterativo, que também denuncia ciclos
+        ordem = dfs.topological_sort_iterativo(graph)
+        self.rotulos = list(ordem)
+        self.ids = {v: i for i, v in enumerate(self.rotulos)}
+        self.sucessores = [[] for _ in self.rotulos]
+        for u, vizinhos in graph.items():
+            for v in vizinhos:
+                self.sucessores[self.ids[u]].append(self.ids[v])
+
+        n = len(self.rotulos)
+        self.bits = np.zeros((n, max((n + 63) // 64, 1)), dtype=np.uint64)
+        for i in reversed(range(n)):
+            if self.sucessores[i]:
+                np.bitwise_or.reduce(self.bits[self.sucessores[i]], axis=0, out=self.bits[i])
+            self._marcar(i, i)
+
+    def _marcar(self, linha, coluna):
+        self.bits[linha, coluna >> 6] |= np.uint64(1 << (coluna & 63))
+
+    def _testar(self, linha, coluna):
+        return bool((int(self.bits[linha, coluna >> 6]) >> (coluna & 63)) & 1)
+
+    def _coluna(self, coluna):
+        # Vetor booleano com todos os vértices que alcançam `coluna`
+        return ((self.bits[:, coluna >> 6] >> np.uint64(coluna & 63)) & np.uint64(1)).astype(bool)
+
+    def alcanca(self, a, b):
+        # Existe caminho a -> ... -> b (todo vértice alcança a si mesmo)
+        return self._testar(self.ids[a], self.ids[b])
+
+    def depende(self, a, b):
+        # No formato do grafo, u: [v] significa que v só roda depois de u, isto é, v depende de u
+        return self.alcanca(b, a)
+
+    def descendentes(self, a):
+        linha = np.unpackbits(self.bits[self.ids[a]].view(np.uint8), bitorder="little")
+        return [self.rotulos[i] for i in np.flatnonzero(linha[:len(self.rotulos)]) if i != self.ids[a]]
+
+    def reducao_transitiva(self):
+        # A aresta u -> v é redundante se v já é alcançável a partir de outro sucessor w de u
+        reducao = {}
+        for u, sucessores in enumerate(self.sucessores):
+            cobertura = np.zeros(self.bits.shape[1], dtype=np.uint64)
+            for w in sucessores:
+                estrito = self.bits[w].copy()
+                estrito[w >> 6] &= ~np.uint64(1 << (w & 63))
+                cobertura |= estrito
+            mantidos = []
+            for v in dict.fromkeys(sucessores):
+                if not (int(cobertura[v >> 6]) >> (v & 63)) & 1:
+                    mantidos.append(self.rotulos[v])
+            reducao[self.rotulos[u]] = mantidos
+        return reducao
+
+    def _novo_vertice(self, v):
+        i = len(self.rotulos)
+        self.ids[v] = i
+        self.rotulos.append(v)
+        self.sucessores.append([])
+        linhas, palavras = self.bits.shape
+        if i >= linhas or i >= palavras * 64:
+            # Cresce por duplicação para que inserir vértices seja amortizado
+            nova = np.zeros((max(2 * linhas, i + 1), max(palavras, (2 * linhas + 63) // 64)), dtype=np.uint64)
+            nova[:linhas, :palavras] = self.bits
+            self.bits = nova
+        self._marcar(i, i)
+        return i
+
+    def add_edge(self, a, b):
+        ia = self.ids[a] if a in self.ids else self._novo_vertice(a)
+        ib = self.ids[b] if b in self.ids else self._novo_vertice(b)
+        if ib in self.sucessores[ia]:
+            return  # Aresta repetida: o índice já a contém
+        if self._testar(ib, ia):
+            raise CicloEncontrado([a] + self._caminho(ib, ia))
+        self.sucessores[ia].append(ib)
+        if not self._testar(ia, ib):
+            # Todo vértice que alcança a passa a alcançar tudo que b alcança
+            ancestrais = self._coluna(ia)
+            ancestrais[len(self.rotulos):] = False
+            self.bits[ancestrais] |= self.bits[ib]
+
+    def _caminho(self, origem, destino):
+        # Reconstrói um caminho seguindo sempre um sucessor que ainda alcança o destino
+        caminho = [origem]
+        while caminho[-1] != destino:
+            caminho.append(next(w for w in self.sucessores[caminho[-1]] if self._testar(w, destino)))
+        return [self.rotulos[i] for i in caminho]
+
+def _alcanca_por_dfs(graph, a, b):
+    visitados = {a}
+    pilha = [a]
+    while pilha:
+        u = pilha.pop()
+        if u == b:
+            return True
+        for w in graph[u]:
+            if w not in visitados:
+                visitados.add(w)
+                pilha.append(w)
+    return False
+
+def benchmark_consultas(num_vertices=5_000, num_arestas=20_000, num_consultas=20_000, semente=0):
+    rng = random.Random(semente)
+    graph = {v: [] for v in range(num_vertices)}
+    for _ in range(num_arestas):
+        u, v = sorted(rng.sample(range(num_vertices), 2))
+        graph[u].append(v)
+    consultas = [tuple(rng.sample(range(num_vertices), 2)) for _ in range(num_consultas)]
+
+    inicio = time.perf_counter()
+    indice = IndiceAlcancabilidade(graph)
+    construcao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    respostas_indice = [indice.alcanca(a, b) for a, b in consultas]
+    tempo_indice = time.perf_counter() - inicio
+
+    amostra = consultas[:500]
+    inicio = time.perf_counter()
+    respostas_dfs = [_alcanca_por_dfs(graph, a, b) for a, b in amostra]
+    tempo_dfs = (time.perf_counter() - inicio) / len(amostra) * num_consultas
+    assert respostas_dfs == respostas_indice[:len(amostra)]
+
+    print(f"V={num_vertices:,} E={num_arestas:,}: índice construído em {construcao:.2f}s "
+          f"({indice.bits.nbytes / 2**20:.1f} MB)")
+    print(f"  {num_consultas:,} consultas: índice {tempo_indice:.3f}s, DFS por consulta ~{tempo_dfs:.2f}s")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        'A': ['C', 'E'],
+        'B': ['C', 'D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+    indice = IndiceAlcancabilidade(grafo)
+    print("E depende de A?", indice.depende('E', 'A'))
+    print("F depende de A?", indice.depende('F', 'A'))
+    print("Descendentes de B:", indice.descendentes('B'))
+    print("Redução transitiva:", indice.reducao_transitiva())
+    indice.add_edge('E', 'F')
+    print("Depois de E -> F, F depende de A?", indice.depende('F', 'A'))
+    try:
+        indice.add_edge('F', 'B')
+    except CicloEncontrado as erro:
+        print("Inserção rejeitada:", erro)
+
+    benchmark_consultas()
@@ -0,0 +1,153 @@
+# Este código adiciona custo às ordenações topológicas do Dojo: cada vértice do grafo de dependências ganha
+# um peso (duração), passado num dicionário à parte para que o grafo continue no formato de dicionário de
+# listas usado por topological_sort. A análise de caminho crítico percorre a ordem topológica uma única vez
+# (tempo linear) e devolve o início mais cedo, o início mais tarde e a folga de cada tarefa.
+# Sobre ela há um escalonador de lista no estilo HEFT para k trabalhadores idênticos: as tarefas são
+# priorizadas pelo "rank ascendente" (duração + maior rank entre os sucessores, mais um custo opcional de
+# comunicação) e cada uma vai para o trabalhador que a termina mais cedo, aproveitando buracos na agenda.
+# Serve para dimensionar uma farm de build: o makespan para cada k mostra onde parar de adicionar máquinas.
+
+import bisect
+import random
+import sys
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+kahn = carregar_script("20260104_183025_Ordenacao_Topologica.py")
+
+def _ordem(graph):
+    ordem = kahn.topological_sort(graph)
+    if isinstance(ordem, str):
+        raise ValueError(ordem)
+    return ordem
+
+def _predecessores(graph):
+    predecessores = {u: [] for u in graph}
+    for u in graph:
+        for v in graph[u]:
+            predecessores.setdefault(v, []).append(u)
+    return predecessores
+
+def caminho_critico(graph, pesos, ordem=None):
+    # Vértices sem peso valem 1; a ordem pode ser passada pronta para não ordenar de novo
+    ordem = ordem if ordem is not None else _ordem(graph)
+    inicio_cedo = {v: 0.0 for v in ordem}
+    anterior = {}
+    for u in ordem:
+        termino = inicio_cedo[u] + pesos.get(u, 1)
+        for v in graph.get(u, ()):
+            if termino > inicio_cedo[v]:
+                inicio_cedo[v] = termino
+                anterior[v] = u
+    if not ordem:
+        return {"caminho": [], "duracao": 0.0, "inicio_cedo": {}, "inicio_tarde": {}, "folga": {}}
+
+    fim = max(ordem, key=lambda v: inicio_cedo[v] + pesos.get(v, 1))
+    duracao = inicio_cedo[fim] + pesos.get(fim, 1)
+
+    # Passada reversa: o início mais tarde que não atrasa o projeto
+    inicio_tarde = {}
+    for u in reversed(ordem):
+        limite = min((inicio_tarde[v] for v in graph.get(u, ())), default=duracao)
+        inicio_tarde[u] = limite - pesos.get(u, 1)
+
+    caminho = [fim]
+    while caminho[-1] in anterior:
+        caminho.append(anterior[caminho[-1]])
+    return {
+        "caminho": caminho[::-1],
+        "duracao": duracao,
+        "inicio_cedo": inicio_cedo,
+        "inicio_tarde": inicio_tarde,
+        "folga": {v: inicio_tarde[v] - inicio_cedo[v] for v in ordem},
+    }
+
+def rank_ascendente(graph, pesos, ordem, custo_comunicacao=0.0):
+    rank = {}
+    for u in reversed(ordem):
+        rank[u] = pesos.get(u, 1) + max((custo_comunicacao + rank[v] for v in graph.get(u, ())), default=0.0)
+    return rank
+
+def escalonar(graph, pesos, num_trabalhadores, custo_comunicacao=0.0):
+    # custo_comunicacao é somado quando uma dependência rodou em outro trabalhador
+    if num_trabalhadores < 1:
+        raise ValueError(f"num_trabalhadores deve ser pelo menos 1, recebido {num_trabalhadores}")
+    ordem = _ordem(graph)
+    posicao = {v: i for i, v in enumerate(ordem)}
+    rank = rank_ascendente(graph, pesos, ordem, custo_comunicacao)
+    predecessores = _predecessores(graph)
+    # Empates (pesos zero) são desfeitos pela ordem topológica, então dependências sempre vêm antes
+    prioridade = sorted(ordem, key=lambda v: (-rank[v], posicao[v]))
+
+    agendas = [[] for _ in range(num_trabalhadores)]  # (início, fim, tarefa), ordenadas por início
+    atribuicao = {}
+    for tarefa in prioridade:
+        duracao = pesos.get(tarefa, 1)
+        melhor = None
+        for t, agenda in enumerate(agendas):
+            pronto = max((atribuicao[p][2] + (custo_comunicacao if atribuicao[p][0] != t else 0.0)
+                          for p in predecessores.get(tarefa, ())), default=0.0)
+            inicio = _primeiro_buraco(agenda, pronto, duracao)
+            if melhor is None or inicio + duracao < melhor[2]:
+                melhor = (t, inicio, inicio + duracao)
+        atribuicao[tarefa] = melhor
+        bisect.insort(agendas[melhor[0]], (melhor[1], melhor[2], posicao[tarefa]))
+
+    makespan = max((fim for _, _, fim in atribuicao.values()), default=0.0)
+    trabalho_total = sum(pesos.get(v, 1) for v in ordem)
+    return {
+        "atribuicao": atribuicao,
+        "makespan": makespan,
+        "limite_inferior": max(caminho_critico(graph, pesos, ordem)["duracao"], trabalho_total / num_trabalhadores),
+        "utilizacao": trabalho_total / (makespan * num_trabalhadores) if makespan else 0.0,
+    }
+
+def _primeiro_buraco(agenda, pronto, duracao):
+    # Política de inserção do HEFT: o primeiro intervalo livre depois de `pronto` que comporta a tarefa
+    inicio = pronto
+    for comeco, fim, _ in agenda:
+        if fim <= inicio:
+            continue
+        if comeco - inicio >= duracao:
+            return inicio
+        inicio = max(inicio, fim)
+    return inicio
+
+def gerar_grafo_de_build(num_tarefas=400, largura=20, semente=0):
+    # Grafo em camadas com durações log-normais, parecido com um build real (muitas tarefas curtas, poucas longas)
+    rng = random.Random(semente)
+    graph = {v: [] for v in range(num_tarefas)}
+    for v in range(largura, num_tarefas):
+        for u in rng.sample(range(max(0, v - 3 * largura), v), k=min(3, v)):
+            graph[u].append(v)
+    pesos = {v: round(rng.lognormvariate(0, 1), 2) for v in range(num_tarefas)}
+    return graph, pesos
+
+# Exemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        'A': ['C'],
+        'B': ['C', 'D'],
+        'C': ['E'],
+        'D': ['F'],
+        'E': [],
+        'F': []
+    }
+    pesos = {'A': 3, 'B': 1, 'C': 2, 'D': 4, 'E': 1, 'F': 2}
+    analise = caminho_critico(grafo, pesos)
+    print("Caminho crítico:", " -> ".join(analise["caminho"]), f"({analise['duracao']})")
+    print("Folgas:", analise["folga"])
+    escala = escalonar(grafo, pesos, num_trabalhadores=2)
+    for tarefa, (trabalhador, inicio, fim) in sorted(escala["atribuicao"].items(), key=lambda item: item[1][1]):
+        print(f"  {tarefa}: trabalhador {trabalhador}, {inicio} -> {fim}")
+    print("Makespan com 2 trabalhadores:", escala["makespan"])
+
+    graph, pesos = gerar_grafo_de_build()
+    print("\nDimensionamento para um build de 400 tarefas:")
+    for k in (1, 2, 4, 8, 16, 32):
+        escala = escalonar(graph, pesos, k)
+        print(f"  k={k:>2}: makespan {escala['makespan']:8.2f} (limite inferior {escala['limite_inferior']:8.2f}), "
+              f"utilização {escala['utilizacao']:.0%}")
@@ -7,6 +7,8 @@ import hashlib
 import time
 
 class Bloco:
+    __slots__ = ("indice", "hash_documento", "hash_anterior", "timestamp", "hash")  # Sem __dict__ por bloco
+
     def __init__(self, indice, hash_documento, hash_anterior):
         self.indice = indice
         self.hash_documento = hash_documento
@@ -21,7 +23,7 @@ class Bloco:
 class Blockchain:
     def __init__(self):
         self.cadeia = []
-        self.criar_bloco(genesis=True)
+        self.criar_bloco()  # Bloco gênese, sem documento
 
     def criar_bloco(self, hash_documento=None):
         indice = len(self.cadeia) + 1
@@ -36,8 +38,9 @@ class Blockchain:
         return bloco.hash
 
 # Exemplo de uso
-blockchain = Blockchain()
-documento = "Este é um documento importante."
-hash_notarizado = blockchain.notarizar_documento(documento)
-print(f"Hash do documento notarizado: {hash_notarizado}")
-print(f"Número de blocos na blockchain: {len(blockchain.cadeia)}")
\ No newline at end of file
+if __name__ == "__main__":
+    blockchain = Blockchain()
+    documento = "Este é um documento importante."
+    hash_notarizado = blockchain.notarizar_documento(documento)
+    print(f"Hash do documento notarizado: {hash_notarizado}")
+    print(f"Número de blocos na blockchain: {len(blockchain.cadeia)}")
\ No newline at end of file
@@ -3,12 +3,21 @@
 # Para rodar este código, não são necessárias bibliotecas externas. 
 # Apenas o Python padrão é suficiente.
 
+import hashlib
+
 class Block:
+    __slots__ = ("index", "timestamp", "data", "previous_hash", "hash")  # Sem __dict__ por bloco
+
     def __init__(self, index, timestamp, data, previous_hash):
         self.index = index
         self.timestamp = timestamp
         self.data = data
         self.previous_hash = previous_hash
+        self.hash = self.calcular_hash()
+
+    def calcular_hash(self):
+        valor = f"{self.index}{self.timestamp}{self.data}{self.previous_hash}"
+        return hashlib.sha256(valor.encode()).hexdigest()
 
 def create_genesis_block():
     return Block(0, "01/01/2023", "Genesis Block", "0")
@@ -16,17 +25,18 @@ def create_genesis_block():
 def create_new_block(previous_block, data):
     index = previous_block.index + 1
     timestamp = "01/01/2023"  # Aqui você pode usar datetime.now().isoformat() para timestamps reais
-    return Block(index, timestamp, data, previous_block.previous_hash)
-
-# Criando a cadeia de blocos
-blockchain = [create_genesis_block()]
-previous_block = blockchain[0]
-
-# Adicionando novos blocos
-for i in range(1, 5):
-    new_block = create_new_block(previous_block, f"Block {i} Data")
-    blockchain.append(new_block)
-    previous_block = new_block
-    print(f"Block {new_block.index} has been added to the blockchain!")
-    print(f"Hash: {new_block.previous_hash}")
-    print(f"Data: {new_block.data}\n")
\ No newline at end of file
+    return Block(index, timestamp, data, previous_block.hash)
+
+if __name__ == "__main__":
+    # Criando a cadeia de blocos
+    blockchain = [create_genesis_block()]
+    previous_block = blockchain[0]
+
+    # Adicionando novos blocos
+    for i in range(1, 5):
+        new_block = create_new_block(previous_block, f"Block {i} Data")
+        blockchain.append(new_block)
+        previous_block = new_block
+        print(f"Block {new_block.index} has been added to the blockchain!")
+        print(f"Hash: {new_block.hash}")
+        print(f"Data: {new_block.data}\n")
\ No newline at end of file
@@ -33,11 +33,12 @@ def vigenere_decrypt(ciphertext, keyword):
     return ''.join(decrypted)
 
 # Exemplo de uso
-mensagem = "Ola Mundo!"
-palavra_chave = "chave"
-cifrada = vigenere_encrypt(mensagem, palavra_chave)
-decifrada = vigenere_decrypt(cifrada, palavra_chave)
+if __name__ == "__main__":
+    mensagem = "Ola Mundo!"
+    palavra_chave = "chave"
+    cifrada = vigenere_encrypt(mensagem, palavra_chave)
+    decifrada = vigenere_decrypt(cifrada, palavra_chave)
 
-print("Mensagem Original:", mensagem)
-print("Mensagem Cifrada:", cifrada)
-print("Mensagem Decifrada:", decifrada)
\ No newline at end of file
+    print("Mensagem Original:", mensagem)
+    print("Mensagem Cifrada:", cifrada)
+    print("Mensagem Decifrada:", decifrada)
\ No newline at end of file
@@ -0,0 +1,131 @@
+# Este código implementa a busca de nonce do Proof-of-Work (Hashcash) em vários núcleos.
+# O espaço de nonces é dividido entre processos, em blocos distribuídos sob demanda por um contador
+# compartilhado ("blocos") ou em faixas intercaladas fixas, o processo i testando i, i+P, i+2P... ("intercalado").
+# No modo "primeiro" todos os processos param assim que qualquer um encontra uma solução; no modo "menor" os
+# processos só param depois de passar do menor nonce encontrado, então o resultado é exatamente o mesmo
+# nonce que a busca sequencial de proof_of_work devolveria.
+# O benchmark mede a taxa de hashes com 1, 2, 4... processos para mostrar a escalabilidade com os núcleos.
+# Não são necessárias bibliotecas externas.
+
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+pow_base = carregar_script("20260105_232819_ProofofWork.py")
+rapido = carregar_script("20261018_133510_Hashcash_Rapido.py")
+
+ESTRATEGIAS = ("blocos", "intercalado")
+MODOS = ("primeiro", "menor")
+TAMANHO_BLOCO = 1 << 14  # Nonces por bloco; também é a granularidade do cancelamento
+SEM_SOLUCAO = 2**63 - 1
+
+def _registrar(melhor, nonce, parar):
+    with melhor.get_lock():
+        if nonce < melhor.value:
+            melhor.value = nonce
+    parar.set()
+
+def _trabalhador(header, difficulty, indice, processos, estrategia, modo, proximo, melhor, parar, tentativas):
+    # Cada processo usa o caminho rápido (midstate + alvo binário), com o mesmo resultado de hashcash
+    motor = rapido.HashcashRapido(header)
+    alvo = rapido.alvo_em_bits(rapido.bits_da_dificuldade(difficulty))
+    feitas = 0
+    try:
+        if estrategia == "blocos":
+            while True:
+                with proximo.get_lock():
+                    inicio = proximo.value
+                    proximo.value += TAMANHO_BLOCO
+                # No modo "menor" um bloco só é descartável se começa depois da melhor solução
+                if (modo == "primeiro" and parar.is_set()) or inicio >= melhor.value:
+                    return
+                nonce = motor.buscar(alvo, inicio, inicio + TAMANHO_BLOCO)
+                feitas += TAMANHO_BLOCO if nonce is None else nonce - inicio + 1
+                if nonce is not None:
+                    _registrar(melhor, nonce, parar)
+        else:
+            inicio = indice
+            passo = processos * TAMANHO_BLOCO
+            while True:
+                if (modo == "primeiro" and parar.is_set()) or inicio >= melhor.value:
+                    return
+                nonce = motor.buscar(alvo, inicio, inicio + passo, processos)
+                feitas += TAMANHO_BLOCO if nonce is None else (nonce - inicio) // processos + 1
+                if nonce is not None:
+                    _registrar(melhor, nonce, parar)
+                    return  # As faixas de um processo são crescentes: o primeiro achado é o menor dele
+                inicio += passo
+    finally:
+        with tentativas.get_lock():
+            tentativas.value += feitas
+
+def buscar_paralelo(header, difficulty, processos=None, estrategia="blocos", modo="primeiro"):
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia desconhecida: {estrategia}. Use uma de {ESTRATEGIAS}")
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconhecido: {modo}. Use um de {MODOS}")
+    processos = processos or os.cpu_count() or 1
+
+    proximo = mp.Value("q", 0)
+    melhor = mp.Value("q", SEM_SOLUCAO)
+    tentativas = mp.Value("q", 0)
+    parar = mp.Event()
+    inicio = time.perf_counter()
+    trabalhadores = [
+        mp.Process(target=_trabalhador,
+                   args=(header, difficulty, i, processos, estrategia, modo, proximo, melhor, parar, tentativas))
+        for i in range(processos)
+    ]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    segundos = time.perf_counter() - inicio
+
+    nonce = melhor.value
+    if nonce == SEM_SOLUCAO:
+        codigos = [t.exitcode for t in trabalhadores]
+        raise RuntimeError(f"Nenhum processo encontrou solução (códigos de saída: {codigos})")
+    return {
+        "nonce": nonce,
+        "hash": pow_base.hashcash(header, nonce),
+        "tentativas": tentativas.value,
+        "segundos": segundos,
+        "hashes_por_segundo": tentativas.value / segundos if segundos else 0.0,
+        "processos": processos,
+    }
+
+def proof_of_work_paralelo(header, difficulty, processos=None, estrategia="blocos", modo="primeiro"):
+    # Mesma interface de retorno que proof_of_work: (nonce, hash)
+    resultado = buscar_paralelo(header, difficulty, processos, estrategia, modo)
+    return resultado["nonce"], resultado["hash"]
+
+def benchmark_escalabilidade(difficulty=6, header="Exemplo de Hashcash", estrategia="blocos"):
+    # Cada configuração resolve um cabeçalho diferente para não medir sempre o mesmo nonce
+    contagens = sorted({1, 2, 4, 8, os.cpu_count() or 1} & set(range(1, (os.cpu_count() or 1) + 1)))
+    base = None
+    for processos in contagens:
+        resultado = buscar_paralelo(f"{header} {processos}", difficulty, processos, estrategia)
+        taxa = resultado["hashes_por_segundo"]
+        base = base or taxa
+        print(f"{processos:>3} processos: {taxa / 1e6:6.2f} MH/s (x{taxa / base:.2f}), "
+              f"nonce {resultado['nonce']} em {resultado['segundos']:.2f}s")
+
+if __name__ == "__main__":
+    header = "Exemplo de Hashcash"
+    difficulty = 4  # Número de zeros iniciais desejados
+
+    nonce_sequencial, _ = pow_base.proof_of_work(header, difficulty)
+    for estrategia in ESTRATEGIAS:
+        nonce, result_hash = proof_of_work_paralelo(header, difficulty, estrategia=estrategia, modo="menor")
+        assert nonce == nonce_sequencial
+        print(f"[{estrategia}] Menor nonce: {nonce} ({result_hash})")
+
+    # Passe a dificuldade na linha de comando para o benchmark completo, ex.: 6 ou 7
+    benchmark_escalabilidade(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
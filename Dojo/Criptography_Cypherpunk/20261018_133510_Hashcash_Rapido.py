@@ -0,0 +1,127 @@
+# Este código implementa um caminho rápido para o Hashcash de 20260105_232819_ProofofWork.py.
+# hashcash formata a f-string, codifica e faz o hash do cabeçalho inteiro a cada nonce, e depois compara um
+# hexdigest de 64 caracteres com startswith. Aqui o cabeçalho é processado uma única vez (o "midstate" do
+# SHA-256) e cada nonce só faz copy() desse estado e update() dos dígitos que faltam: os nonces são
+# divididos em prefixo (nonce // 1000, hasheado uma vez a cada mil nonces) e sufixo de três dígitos, tirado de
+# uma tabela de bytes pré-codificada. O digest binário é comparado com um alvo numérico, o que permite
+# dificuldade em bits (e não só em múltiplos de 4 bits, um dígito hexadecimal).
+# O hash de (header, nonce) é bit a bit idêntico ao de hashcash. Não são necessárias bibliotecas externas.
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+pow_base = carregar_script("20260105_232819_ProofofWork.py")
+
+SUFIXOS = [str(i).zfill(3).encode() for i in range(1000)]
+NONCES_PEQUENOS = [str(i).encode() for i in range(1000)]
+
+def alvo_em_bits(bits):
+    # Um digest (big-endian) menor que 2^(256 - bits) tem os `bits` primeiros bits zerados
+    if not 0 <= bits <= 256:
+        raise ValueError("A dificuldade em bits deve estar entre 0 e 256")
+    if bits == 0:
+        return b"\xff" * 32 + b"\x00"  # Maior que qualquer digest de 32 bytes
+    return (1 << (256 - bits)).to_bytes(32, "big")
+
+def bits_da_dificuldade(difficulty):
+    # Cada dígito hexadecimal zero equivale a 4 bits zero
+    return 4 * difficulty
+
+class HashcashRapido:
+    def __init__(self, header):
+        self.header = header
+        self.midstate = hashlib.sha256(header.encode())
+
+    def hash(self, nonce):
+        estado = self.midstate.copy()
+        estado.update(str(nonce).encode())
+        return estado.hexdigest()
+
+    def buscar(self, alvo, inicio=0, fim=None, passo=1):
+        # Primeiro nonce em range(inicio, fim, passo) cujo digest < alvo; None se não houver
+        if passo != 1:
+            return self._buscar_com_passo(alvo, inicio, fim, passo)
+        nonce = inicio
+        while fim is None or nonce < fim:
+            prefixo, resto = divmod(nonce, 1000)
+            limite = 1000 if fim is None else min(1000, fim - prefixo * 1000)
+            if prefixo == 0:
+                # Nonces < 1000 não têm zeros à esquerda, então não seguem o esquema prefixo + sufixo
+                estado, tabela = self.midstate, NONCES_PEQUENOS
+            else:
+                estado = self.midstate.copy()
+                estado.update(str(prefixo).encode())
+                tabela = SUFIXOS
+            copiar = estado.copy
+            for r in range(resto, limite):
+                candidato = copiar()
+                candidato.update(tabela[r])
+                if candidato.digest() < alvo:
+                    return prefixo * 1000 + r
+            nonce = (prefixo + 1) * 1000
+        return None
+
+    def _buscar_com_passo(self, alvo, inicio, fim, passo):
+        prefixo_atual, copiar = None, None
+        nonce = inicio
+        while fim is None or nonce < fim:
+            prefixo, resto = divmod(nonce, 1000)
+            if prefixo != prefixo_atual:
+                prefixo_atual = prefixo
+                if prefixo == 0:
+                    copiar, tabela = self.midstate.copy, NONCES_PEQUENOS
+                else:
+                    estado = self.midstate.copy()
+                    estado.update(str(prefixo).encode())
+                    copiar, tabela = estado.copy, SUFIXOS
+            candidato = copiar()
+            candidato.update(tabela[resto])
+            if candidato.digest() < alvo:
+                return nonce
+            nonce += passo
+        return None
+
+def hashcash_rapido(header, nonce):
+    return HashcashRapido(header).hash(nonce)
+
+def proof_of_work_rapido(header, difficulty=None, bits=None):
+    # Aceita a dificuldade em dígitos hexadecimais (como proof_of_work) ou diretamente em bits
+    if bits is None:
+        bits = bits_da_dificuldade(difficulty)
+    motor = HashcashRapido(header)
+    nonce = motor.buscar(alvo_em_bits(bits))
+    return nonce, motor.hash(nonce)
+
+def benchmark(header="Exemplo de Hashcash", nonces=500_000):
+    inicio = time.perf_counter()
+    prefixo = "0" * 64
+    for nonce in range(nonces):
+        pow_base.hashcash(header, nonce).startswith(prefixo)
+    tempo_original = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    HashcashRapido(header).buscar(alvo_em_bits(256), 0, nonces)  # Alvo impossível: varre a faixa inteira
+    tempo_rapido = time.perf_counter() - inicio
+
+    print(f"hashcash original: {nonces / tempo_original / 1e6:.2f} MH/s")
+    print(f"caminho rápido:    {nonces / tempo_rapido / 1e6:.2f} MH/s (x{tempo_original / tempo_rapido:.2f})")
+
+if __name__ == "__main__":
+    header = "Exemplo de Hashcash"
+    difficulty = 4
+
+    for nonce in list(range(0, 2500, 7)) + [10**6, 10**9 + 123]:
+        assert hashcash_rapido(header, nonce) == pow_base.hashcash(header, nonce)
+    assert proof_of_work_rapido(header, difficulty) == pow_base.proof_of_work(header, difficulty)
+
+    for bits in (16, 17, 18, 19, 20):
+        nonce, result_hash = proof_of_work_rapido(header, bits=bits)
+        print(f"{bits} bits: nonce {nonce}, hash {result_hash}")
+
+    benchmark()
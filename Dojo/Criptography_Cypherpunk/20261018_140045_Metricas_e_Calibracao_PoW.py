@@ -0,0 +1,110 @@
+# Este código adiciona métricas ao vivo e calibração automática de dificuldade ao Proof-of-Work.
+# proof_of_work_monitorado busca o nonce em lotes com o caminho rápido de 20261018_133510_Hashcash_Rapido.py
+# e só consulta o relógio entre um lote e outro, então a instrumentação não pesa no laço quente. A cada
+# `intervalo` segundos ela entrega uma amostra com hashes por segundo, hashes tentados e o tempo estimado até
+# a solução (com dificuldade de b bits, cada hash acerta com probabilidade 2^-b, então faltam em média 2^b
+# hashes, não importa quantos já foram tentados).
+# calibrar_dificuldade mede a taxa de hashes da máquina local e escolhe a dificuldade que dá um tempo médio de
+# solução próximo do alvo, em vez de fixar difficulty = 4 para todas as máquinas.
+# Não são necessárias bibliotecas externas.
+
+import math
+import sys
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+rapido = carregar_script("20261018_133510_Hashcash_Rapido.py")
+
+TAMANHO_LOTE = 1 << 13  # ~5 ms por lote: granularidade das amostras
+
+def _amostra(tentativas, inicio, ultimo_instante, ultimas_tentativas, agora, bits):
+    taxa_media = tentativas / (agora - inicio) if agora > inicio else 0.0
+    taxa_instantanea = ((tentativas - ultimas_tentativas) / (agora - ultimo_instante)
+                        if agora > ultimo_instante else taxa_media)
+    return {
+        "tempo": agora - inicio,
+        "tentativas": tentativas,
+        "hashes_por_segundo": taxa_instantanea,
+        "hashes_por_segundo_medio": taxa_media,
+        "tempo_estimado_restante": 2.0**bits / taxa_media if taxa_media else math.inf,
+        # Probabilidade de já ter achado uma solução com essa quantidade de tentativas
+        "probabilidade_acumulada": 1 - math.exp(-tentativas / 2.0**bits),
+    }
+
+def proof_of_work_monitorado(header, difficulty=None, bits=None, intervalo=1.0, ao_amostrar=None):
+    # ao_amostrar(amostra) é chamado a cada `intervalo` segundos; o retorno inclui a amostra final
+    if bits is None:
+        bits = rapido.bits_da_dificuldade(difficulty)
+    motor = rapido.HashcashRapido(header)
+    alvo = rapido.alvo_em_bits(bits)
+
+    inicio = ultimo_instante = time.perf_counter()
+    tentativas = ultimas_tentativas = 0
+    amostras = []
+    while True:
+        nonce = motor.buscar(alvo, tentativas, tentativas + TAMANHO_LOTE)
+        agora = time.perf_counter()
+        if nonce is not None:
+            tentativas = nonce + 1
+            break
+        tentativas += TAMANHO_LOTE
+        if agora - ultimo_instante >= intervalo:
+            amostra = _amostra(tentativas, inicio, ultimo_instante, ultimas_tentativas, agora, bits)
+            amostras.append(amostra)
+            if ao_amostrar:
+                ao_amostrar(amostra)
+            ultimo_instante, ultimas_tentativas = agora, tentativas
+
+    final = _amostra(tentativas, inicio, ultimo_instante, ultimas_tentativas, agora, bits)
+    return {"nonce": nonce, "hash": motor.hash(nonce), "metricas": final, "amostras": amostras}
+
+def medir_hashrate(segundos=1.0, header="calibracao"):
+    # Varre lotes com um alvo impossível até passar `segundos`, para medir só a taxa de hashes
+    motor = rapido.HashcashRapido(header)
+    impossivel = rapido.alvo_em_bits(256)
+    tentativas = 0
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos:
+        motor.buscar(impossivel, tentativas, tentativas + TAMANHO_LOTE)
+        tentativas += TAMANHO_LOTE
+    return tentativas / (time.perf_counter() - inicio)
+
+def calibrar_dificuldade(tempo_alvo, hashrate=None, segundos_medicao=1.0):
+    # Tempo médio de solução = 2^bits / hashrate, então bits ≈ log2(tempo_alvo · hashrate)
+    if not tempo_alvo > 0:
+        raise ValueError(f"tempo_alvo deve ser positivo (em segundos), recebido {tempo_alvo}")
+    if hashrate is not None and not hashrate > 0:
+        raise ValueError(f"hashrate deve ser positivo (hashes por segundo), recebido {hashrate}")
+    hashrate = hashrate or medir_hashrate(segundos_medicao)
+    bits = max(1, min(256, round(math.log2(tempo_alvo * hashrate))))
+    # proof_of_work original só aceita dígitos hexadecimais (múltiplos de 4 bits)
+    difficulty = max(1, round(bits / 4))
+    return {
+        "hashrate": hashrate,
+        "bits": bits,
+        "tempo_medio_bits": 2.0**bits / hashrate,
+        "difficulty": difficulty,
+        "tempo_medio_difficulty": 16.0**difficulty / hashrate,
+    }
+
+if __name__ == "__main__":
+    header = "Exemplo de Hashcash"
+    calibracao = calibrar_dificuldade(tempo_alvo=2.0)
+    print(f"Taxa local: {calibracao['hashrate'] / 1e6:.2f} MH/s")
+    print(f"Para ~2s por selo: {calibracao['bits']} bits (média {calibracao['tempo_medio_bits']:.2f}s) "
+          f"ou difficulty = {calibracao['difficulty']} (média {calibracao['tempo_medio_difficulty']:.2f}s)")
+
+    def imprimir(amostra):
+        print(f"  {amostra['tempo']:5.1f}s: {amostra['hashes_por_segundo'] / 1e6:.2f} MH/s, "
+              f"{amostra['tentativas']:,} hashes, ~{amostra['tempo_estimado_restante']:.1f}s restantes, "
+              f"P(já resolvido) = {amostra['probabilidade_acumulada']:.0%}")
+
+    resultado = proof_of_work_monitorado(header, bits=calibracao["bits"], intervalo=0.5, ao_amostrar=imprimir)
+    metricas = resultado["metricas"]
+    print(f"Nonce encontrado: {resultado['nonce']}")
+    print(f"Hash resultante: {resultado['hash']}")
+    print(f"Tempo de execução: {metricas['tempo']:.2f} segundos ({metricas['hashes_por_segundo_medio'] / 1e6:.2f} MH/s)")
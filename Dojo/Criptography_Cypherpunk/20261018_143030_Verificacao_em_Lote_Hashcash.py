@@ -0,0 +1,165 @@
+# Este código implementa a verificação em lote de selos Hashcash do lado do servidor.
+# Cunhar um selo custa milhões de hashes, mas verificá-lo custa um só, então um servidor precisa verificar
+# muito mais rápido do que os clientes cunham. O verificador recebe um iterável (ou fluxo) de registros
+# (header, nonce, difficulty), divide-os em blocos e verifica cada bloco num pool de processos ou de threads.
+# Os selos são pequenos, e o hashlib só libera o GIL para entradas acima de ~2 KB, então threads só ajudam
+# com cabeçalhos grandes; para selos típicos o modo "processos" é o que escala com os núcleos.
+# Um filtro de repetição (opcionalmente limitado) rejeita selos já aceitos, isto é, o mesmo header + nonce
+# apresentado de novo, e cada lote devolve um relatório de vazão. Selos com difficulty abaixo do mínimo do servidor
+# ou malformada (não inteira, negativa ou acima de 64 dígitos) contam como inválidos, sem derrubar o lote.
+# Não são necessárias bibliotecas externas.
+
+import functools
+import hashlib
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+rapido = carregar_script("20261018_133510_Hashcash_Rapido.py")
+
+MODOS = ("processos", "threads", "serial")
+TAMANHO_BLOCO = 20_000  # Registros por tarefa enviada ao pool
+DIFICULDADE_MAXIMA = 64  # Dígitos hexadecimais de um SHA-256
+REJEITA_TUDO = b""  # Nenhum digest é menor que b"": é o alvo das dificuldades recusadas
+
+def _alvo(difficulty, dificuldade_minima):
+    if not isinstance(difficulty, int) or isinstance(difficulty, bool):
+        return REJEITA_TUDO
+    if not dificuldade_minima <= difficulty <= DIFICULDADE_MAXIMA:
+        return REJEITA_TUDO
+    return rapido.alvo_em_bits(rapido.bits_da_dificuldade(difficulty))
+
+def _verificar_bloco(registros, dificuldade_minima=1):
+    # Devolve, para cada registro, o digest do selo se ele é válido ou None se não é.
+    # O digest é idêntico ao de hashcash (mesmos bytes hasheados), só comparado em binário.
+    alvos = {}
+    sha256 = hashlib.sha256
+    resultado = []
+    for header, nonce, difficulty in registros:
+        # Só ints exatos entram no cache (True == 1 e 2.0 == 2 teriam o mesmo alvo que 1 e 2)
+        chave = difficulty if type(difficulty) is int else None
+        alvo = alvos.get(chave)
+        if alvo is None:
+            alvo = _alvo(difficulty, dificuldade_minima)
+            if chave is not None:
+                alvos[chave] = alvo
+        digest = sha256(f"{header}{nonce}".encode()).digest()
+        resultado.append(digest if digest < alvo else None)
+    return resultado
+
+class VerificadorDeSelos:
+    def __init__(self, modo="processos", trabalhadores=None, tamanho_bloco=TAMANHO_BLOCO, limite_vistos=None,
+                 dificuldade_minima=1):
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconhecido: {modo}. Use um de {MODOS}")
+        if _alvo(dificuldade_minima, 0) == REJEITA_TUDO:
+            raise ValueError(f"dificuldade_minima deve ser um inteiro entre 0 e {DIFICULDADE_MAXIMA}, "
+                             f"recebido {dificuldade_minima!r}")
+        self.modo = modo
+        # Selos com difficulty menor que esta são recusados: sem o mínimo, ("qualquer coisa", 0, 0) seria aceito
+        self.dificuldade_minima = dificuldade_minima
+        self.tamanho_bloco = tamanho_bloco
+        # Digests de selos já aceitos, em ordem de chegada; com limite_vistos os mais antigos são esquecidos
+        # (os cabeçalhos Hashcash costumam levar a data, então selos velhos já são recusados por outro critério)
+        self.vistos = {}
+        self.limite_vistos = limite_vistos
+        self.pool = None
+        if modo == "processos":
+            self.pool = ProcessPoolExecutor(max_workers=trabalhadores or os.cpu_count())
+        elif modo == "threads":
+            self.pool = ThreadPoolExecutor(max_workers=trabalhadores or os.cpu_count())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+    def verificar_lote(self, registros):
+        # Devolve (aceitos, relatório): aceitos[i] é True se o registro i é válido e inédito
+        registros = list(registros)
+        inicio = time.perf_counter()
+        blocos = [registros[i:i + self.tamanho_bloco] for i in range(0, len(registros), self.tamanho_bloco)]
+        verificar = functools.partial(_verificar_bloco, dificuldade_minima=self.dificuldade_minima)
+        if self.pool:
+            digests = itertools.chain.from_iterable(self.pool.map(verificar, blocos))
+        else:
+            digests = itertools.chain.from_iterable(map(verificar, blocos))
+
+        aceitos = []
+        invalidos = duplicados = 0
+        for digest in digests:
+            if digest is None:
+                invalidos += 1
+                aceitos.append(False)
+            elif digest in self.vistos:
+                duplicados += 1
+                aceitos.append(False)
+            else:
+                self.vistos[digest] = None
+                if self.limite_vistos and len(self.vistos) > self.limite_vistos:
+                    del self.vistos[next(iter(self.vistos))]
+                aceitos.append(True)
+        segundos = time.perf_counter() - inicio
+        return aceitos, {
+            "selos": len(registros),
+            "validos": len(registros) - invalidos - duplicados,
+            "invalidos": invalidos,
+            "duplicados": duplicados,
+            "segundos": segundos,
+            "selos_por_segundo": len(registros) / segundos if segundos else 0.0,
+        }
+
+    def verificar_fluxo(self, registros, tamanho_lote=200_000):
+        # Consome um iterável potencialmente infinito lote a lote, sem materializá-lo inteiro
+        iterador = iter(registros)
+        while True:
+            lote = list(itertools.islice(iterador, tamanho_lote))
+            if not lote:
+                return
+            yield self.verificar_lote(lote)
+
+def gerar_selos(quantidade, difficulty=2, semente=0):
+    # Selos válidos baratos (difficulty baixa) para alimentar o benchmark, cunhados com o caminho rápido
+    selos = []
+    for i in range(quantidade):
+        header = f"remetente{semente}-{i}@dojo"
+        nonce, _ = rapido.proof_of_work_rapido(header, difficulty)
+        selos.append((header, nonce, difficulty))
+    return selos
+
+if __name__ == "__main__":
+    validos = gerar_selos(20_000)
+    falsos = [(header, nonce + 1, difficulty) for header, nonce, difficulty in validos[:2_000]
+              if not rapido.hashcash_rapido(header, nonce + 1).startswith("0" * difficulty)]
+    repetidos = validos[:1_000]
+    # Dificuldade abaixo do mínimo (0 aceitaria qualquer nonce) e registros com difficulty malformada
+    baratos = [(f"gratis-{i}@dojo", 0, 0) for i in range(1_000)]
+    malformados = [("x@dojo", 0, -1), ("x@dojo", 0, 65), ("x@dojo", 0, "2"), ("x@dojo", 0, True), ("x@dojo", 0, 2.0)]
+    # Fluxo misto: selos válidos, nonces adulterados, selos baratos ou malformados e reenvios de selos já aceitos
+    fluxo = validos + falsos + baratos + malformados + repetidos
+
+    for modo in MODOS:
+        with VerificadorDeSelos(modo=modo) as verificador:
+            aceitos, relatorio = verificador.verificar_lote(fluxo)
+            assert sum(aceitos) == len(validos)
+            assert relatorio["invalidos"] == len(falsos) + len(baratos) + len(malformados)
+            print(f"[{modo}] {relatorio['selos']:,} selos em {relatorio['segundos']:.3f}s: "
+                  f"{relatorio['selos_por_segundo'] * 60 / 1e6:.1f} M selos/min, "
+                  f"{relatorio['invalidos']} inválidos, {relatorio['duplicados']} duplicados")
+
+    with VerificadorDeSelos(modo="processos") as verificador:
+        for i, (_, relatorio) in enumerate(verificador.verificar_fluxo(itertools.chain(validos, validos), 15_000)):
+            print(f"  lote {i}: {relatorio['validos']} aceitos, {relatorio['duplicados']} repetições barradas")
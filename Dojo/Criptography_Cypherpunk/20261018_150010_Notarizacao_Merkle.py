@@ -0,0 +1,129 @@
+# Este código adiciona notarização em lote à blockchain de 20260103_183020_Notarizacao_de_Documentos.py.
+# Em vez de um Bloco por documento, os hashes de muitos documentos são reunidos numa árvore de Merkle e só a
+# raiz é ancorada num Bloco, então um milhão de documentos cabe em poucos blocos.
+# Cada documento recebe um recibo com a prova de inclusão: os O(log n) hashes irmãos no caminho da folha até
+# a raiz. verificar_prova confere a prova sem precisar da árvore, só do hash do documento e da raiz.
+# Folhas e nós internos são hasheados com prefixos diferentes (0x00 e 0x01), para que um nó interno não possa
+# ser apresentado como se fosse um documento; um nó sem par sobe de nível sem ser duplicado.
+# Não são necessárias bibliotecas externas.
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+notarizacao = carregar_script("20260103_183020_Notarizacao_de_Documentos.py")
+
+PREFIXO_FOLHA = b"\x00"
+PREFIXO_NO = b"\x01"
+TAMANHO_LOTE = 1 << 18  # 262.144 documentos por bloco
+
+def hash_folha(hash_documento):
+    return hashlib.sha256(PREFIXO_FOLHA + bytes.fromhex(hash_documento)).digest()
+
+def hash_no(esquerda, direita):
+    return hashlib.sha256(PREFIXO_NO + esquerda + direita).digest()
+
+class ArvoreMerkle:
+    def __init__(self, hashes_documentos):
+        if not hashes_documentos:
+            raise ValueError("A árvore de Merkle precisa de pelo menos um documento")
+        # niveis[0] são as folhas e niveis[-1] é [raiz]; guardar todos os níveis permite gerar provas depois
+        self.niveis = [[hash_folha(h) for h in hashes_documentos]]
+        while len(self.niveis[-1]) > 1:
+            nivel = self.niveis[-1]
+            proximo = [hash_no(nivel[i], nivel[i + 1]) for i in range(0, len(nivel) - 1, 2)]
+            if len(nivel) % 2:
+                proximo.append(nivel[-1])
+            self.niveis.append(proximo)
+
+    @property
+    def raiz(self):
+        return self.niveis[-1][0].hex()
+
+    def prova(self, posicao):
+        # Lista de (lado, hash irmão): lado "e" se o irmão fica à esquerda, "d" se fica à direita
+        caminho = []
+        for nivel in self.niveis[:-1]:
+            irmao = posicao ^ 1
+            if irmao < len(nivel):
+                caminho.append(("e" if irmao < posicao else "d", nivel[irmao].hex()))
+            posicao //= 2
+        return caminho
+
+def verificar_prova(hash_documento, prova, raiz):
+    atual = hash_folha(hash_documento)
+    for lado, irmao in prova:
+        irmao = bytes.fromhex(irmao)
+        atual = hash_no(irmao, atual) if lado == "e" else hash_no(atual, irmao)
+    return atual.hex() == raiz
+
+class NotarizadorEmLote:
+    def __init__(self, blockchain, tamanho_lote=TAMANHO_LOTE):
+        self.blockchain = blockchain
+        self.tamanho_lote = tamanho_lote
+        self.pendentes = []
+        self.lotes = []  # (índice do bloco, árvore) de cada lote fechado
+        self.localizacao = {}  # hash do documento -> (lote, posição na árvore)
+
+    def notarizar_documento(self, documento):
+        return self.adicionar_hash(hashlib.sha256(documento.encode()).hexdigest())
+
+    def adicionar_hash(self, hash_documento):
+        # O documento só ganha recibo quando o lote fecha (ao encher ou ao chamar fechar_lote)
+        self.pendentes.append(hash_documento)
+        if len(self.pendentes) >= self.tamanho_lote:
+            self.fechar_lote()
+        return hash_documento
+
+    def fechar_lote(self):
+        if not self.pendentes:
+            return None
+        arvore = ArvoreMerkle(self.pendentes)
+        bloco = self.blockchain.criar_bloco(arvore.raiz)
+        lote = len(self.lotes)
+        self.lotes.append((bloco.indice, arvore))
+        for posicao, hash_documento in enumerate(self.pendentes):
+            self.localizacao[hash_documento] = (lote, posicao)
+        self.pendentes = []
+        return bloco
+
+    def recibo(self, hash_documento):
+        # As provas são montadas sob demanda a partir da árvore guardada, não no fechamento do lote
+        lote, posicao = self.localizacao[hash_documento]
+        indice_bloco, arvore = self.lotes[lote]
+        return {
+            "indice_bloco": indice_bloco,
+            "raiz": arvore.raiz,
+            "posicao": posicao,
+            "prova": arvore.prova(posicao),
+        }
+
+def verificar_recibo(blockchain, hash_documento, recibo):
+    # A prova tem de levar à raiz e a raiz tem de ser a que está ancorada no bloco indicado
+    bloco = blockchain.cadeia[recibo["indice_bloco"] - 1]
+    return bloco.hash_documento == recibo["raiz"] and verificar_prova(hash_documento, recibo["prova"], recibo["raiz"])
+
+# Exemplo de uso
+if __name__ == "__main__":
+    blockchain = notarizacao.Blockchain()
+    notarizador = NotarizadorEmLote(blockchain)
+    documento = "Este é um documento importante."
+    hash_documento = notarizador.notarizar_documento(documento)
+
+    inicio = time.perf_counter()
+    for i in range(1_000_000 - 1):
+        notarizador.adicionar_hash(hashlib.sha256(f"documento {i}".encode()).hexdigest())
+    notarizador.fechar_lote()
+    print(f"1.000.000 documentos notarizados em {time.perf_counter() - inicio:.2f}s")
+    print(f"Número de blocos na blockchain: {len(blockchain.cadeia)}")
+
+    recibo = notarizador.recibo(hash_documento)
+    print(f"Prova de inclusão com {len(recibo['prova'])} hashes, no bloco {recibo['indice_bloco']}")
+    print("Recibo válido:", verificar_recibo(blockchain, hash_documento, recibo))
+    adulterado = hashlib.sha256(b"Este e um documento importante.").hexdigest()
+    print("Documento adulterado aceito:", verificar_prova(adulterado, recibo["prova"], recibo["raiz"]))
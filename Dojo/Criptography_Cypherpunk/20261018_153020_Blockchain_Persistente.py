@@ -0,0 +1,287 @@
+# Este código adiciona um armazenamento persistente à blockchain de 20260103_183020_Notarizacao_de_Documentos.py.
+# Cada Bloco vira um registro binário de tamanho fixo num arquivo só de acréscimo (blocos.dat), lido e escrito
+# por mmap; o cabeçalho do arquivo guarda quantos blocos são válidos, então um registro só passa a existir
+# depois de gravado por inteiro. Um índice em disco (indice.dat), uma tabela hash de endereçamento aberto
+# também mapeada em memória, leva do hash do documento ao índice do bloco em O(1), sem varrer a cadeia.
+# Reabrir a blockchain lê só os cabeçalhos e o último registro: nenhum hash é recalculado. A verificação de
+# integridade é uma passada única e sequencial sobre o arquivo mapeado, que recalcula cada hash e confere o
+# encadeamento. BlockchainPersistente tem a mesma interface de Blockchain (criar_bloco, notarizar_documento,
+# cadeia), então também serve ao NotarizadorEmLote de 20261018_150010_Notarizacao_Merkle.py.
+# Não são necessárias bibliotecas externas.
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+notarizacao = carregar_script("20260103_183020_Notarizacao_de_Documentos.py")
+
+MAGICO_BLOCOS = b"DOJOBLK1"
+MAGICO_INDICE = b"DOJOIDX1"
+TAMANHO_CABECALHO = 64
+CABECALHO_BLOCOS = struct.Struct("<8sQ")  # mágico, número de blocos gravados
+CABECALHO_INDICE = struct.Struct("<8sQQQ")  # mágico, capacidade, entradas, blocos já indexados
+# índice, timestamp, tem documento, hash do documento, hash anterior, hash do bloco (hashes em binário)
+REGISTRO = struct.Struct("<Qd?7x32s32s32s")
+SLOT = struct.Struct("<32sQ")  # hash do documento, índice do bloco (0 = slot vazio)
+BLOCOS_INICIAIS = 1 << 12
+CAPACIDADE_INICIAL = 1 << 12  # Sempre potência de 2
+BLOCOS_POR_PASSADA = 1 << 16  # Registros copiados do mapa de cada vez na verificação
+
+def _criar_arquivo(caminho, cabecalho, tamanho):
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(cabecalho.ljust(TAMANHO_CABECALHO, b"\x00"))
+        arquivo.truncate(tamanho)
+
+class IndiceDeHashes:
+    # Tabela hash com sondagem linear num arquivo mapeado; a chave é o hash (32 bytes) do documento
+    def __init__(self, caminho, capacidade=CAPACIDADE_INICIAL):
+        self.caminho = Path(caminho)
+        if not self.caminho.exists():
+            _criar_arquivo(self.caminho, CABECALHO_INDICE.pack(MAGICO_INDICE, capacidade, 0, 0),
+                           TAMANHO_CABECALHO + capacidade * SLOT.size)
+        self._abrir()
+
+    def _abrir(self):
+        self.arquivo = open(self.caminho, "r+b")
+        self.mapa = mmap.mmap(self.arquivo.fileno(), 0)
+        magico, self.capacidade, self.entradas, self.blocos_indexados = CABECALHO_INDICE.unpack_from(self.mapa)
+        if magico != MAGICO_INDICE:
+            raise ValueError(f"{self.caminho} não é um índice de hashes")
+        self.mascara = self.capacidade - 1
+
+    def fechar(self):
+        self.mapa.flush()
+        self.mapa.close()
+        self.arquivo.close()
+
+    def buscar(self, chave):
+        posicao = int.from_bytes(chave[:8], "little") & self.mascara
+        while True:
+            guardada, indice = SLOT.unpack_from(self.mapa, TAMANHO_CABECALHO + posicao * SLOT.size)
+            if indice == 0:
+                return None
+            if guardada == chave:
+                return indice
+            posicao = (posicao + 1) & self.mascara
+
+    def inserir(self, chave, indice):
+        # Mantém a primeira ocorrência: um documento notarizado de novo continua apontando para o bloco original
+        if (self.entradas + 1) * 2 > self.capacidade:
+            self._crescer()
+        posicao = int.from_bytes(chave[:8], "little") & self.mascara
+        while True:
+            deslocamento = TAMANHO_CABECALHO + posicao * SLOT.size
+            guardada, ocupado = SLOT.unpack_from(self.mapa, deslocamento)
+            if ocupado == 0:
+                SLOT.pack_into(self.mapa, deslocamento, chave, indice)
+                self.entradas += 1
+                return True
+            if guardada == chave:
+                return False
+            posicao = (posicao + 1) & self.mascara
+
+    def marcar_indexados(self, blocos):
+        self.blocos_indexados = blocos
+        CABECALHO_INDICE.pack_into(self.mapa, 0, MAGICO_INDICE, self.capacidade, self.entradas, blocos)
+
+    def _crescer(self):
+        # Reespalha todas as entradas num arquivo com o dobro de slots e troca os arquivos de uma vez
+        temporario = self.caminho.with_suffix(".tmp")
+        temporario.unlink(missing_ok=True)
+        novo = IndiceDeHashes(temporario, self.capacidade * 2)
+        for chave, indice in SLOT.iter_unpack(self.mapa[TAMANHO_CABECALHO:]):
+            if indice:
+                novo.inserir(chave, indice)
+        novo.marcar_indexados(self.blocos_indexados)
+        novo.fechar()
+        self.fechar()
+        os.replace(temporario, self.caminho)
+        self._abrir()
+
+class BlockchainPersistente:
+    def __init__(self, diretorio):
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        caminho_blocos = self.diretorio / "blocos.dat"
+        if not caminho_blocos.exists():
+            _criar_arquivo(caminho_blocos, CABECALHO_BLOCOS.pack(MAGICO_BLOCOS, 0),
+                           TAMANHO_CABECALHO + BLOCOS_INICIAIS * REGISTRO.size)
+        self.arquivo = open(caminho_blocos, "r+b")
+        self.mapa = mmap.mmap(self.arquivo.fileno(), 0)
+        magico, self.blocos = CABECALHO_BLOCOS.unpack_from(self.mapa)
+        if magico != MAGICO_BLOCOS:
+            raise ValueError(f"{caminho_blocos} não é um arquivo de blocos")
+        # Caminho rápido de reabertura: o último hash vem direto do último registro, sem recalcular nada
+        self.ultimo_hash = self[-1].hash if self.blocos else None
+
+        caminho_indice = self.diretorio / "indice.dat"
+        self.indice = IndiceDeHashes(caminho_indice)
+        if self.indice.blocos_indexados > self.blocos:
+            # O índice não pode cobrir blocos que não existem: ele é descartado e refeito
+            self.indice.fechar()
+            caminho_indice.unlink()
+            self.indice = IndiceDeHashes(caminho_indice)
+        # Blocos gravados depois da última atualização do índice (por exemplo, numa queda) são indexados agora
+        self._indexar(self.indice.blocos_indexados)
+
+        if self.blocos == 0:
+            self.criar_bloco()  # Bloco gênese, sem documento
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        self.indice.fechar()
+        self.mapa.flush()
+        self.mapa.close()
+        self.arquivo.close()
+
+    @property
+    def cadeia(self):
+        # Mesma forma de acesso de Blockchain.cadeia: cadeia[indice - 1], len(cadeia), iteração
+        return self
+
+    def __len__(self):
+        return self.blocos
+
+    def __getitem__(self, posicao):
+        if posicao < 0:
+            posicao += self.blocos
+        if not 0 <= posicao < self.blocos:
+            raise IndexError("Bloco fora da cadeia")
+        return self._decodificar(REGISTRO.unpack_from(self.mapa, TAMANHO_CABECALHO + posicao * REGISTRO.size))
+
+    def __iter__(self):
+        for posicao in range(self.blocos):
+            yield self[posicao]
+
+    @staticmethod
+    def _decodificar(registro):
+        # Monta o Bloco com os campos gravados, sem passar por __init__ (que pegaria um novo timestamp)
+        indice, timestamp, tem_documento, documento, hash_anterior, hash_bloco = registro
+        bloco = notarizacao.Bloco.__new__(notarizacao.Bloco)
+        bloco.indice = indice
+        bloco.hash_documento = documento.hex() if tem_documento else None
+        bloco.hash_anterior = hash_anterior.hex() if indice > 1 else "0"  # O gênese aponta para "0"
+        bloco.timestamp = timestamp
+        bloco.hash = hash_bloco.hex()
+        return bloco
+
+    def criar_bloco(self, hash_documento=None):
+        novo_bloco = notarizacao.Bloco(self.blocos + 1, hash_documento, self.ultimo_hash or "0")
+        self._gravar(novo_bloco)
+        return novo_bloco
+
+    def notarizar_documento(self, documento):
+        hash_documento = hashlib.sha256(documento.encode()).hexdigest()
+        bloco = self.criar_bloco(hash_documento)
+        return bloco.hash
+
+    def buscar_documento(self, hash_documento):
+        # Devolve o Bloco em que o documento foi notarizado, ou None
+        indice = self.indice.buscar(bytes.fromhex(hash_documento))
+        return None if indice is None else self[indice - 1]
+
+    def _gravar(self, bloco):
+        deslocamento = TAMANHO_CABECALHO + self.blocos * REGISTRO.size
+        if deslocamento + REGISTRO.size > len(self.mapa):
+            self._crescer_arquivo()
+        tem_documento = bloco.hash_documento is not None
+        documento = bytes.fromhex(bloco.hash_documento) if tem_documento else bytes(32)
+        anterior = bytes.fromhex(bloco.hash_anterior) if bloco.indice > 1 else bytes(32)
+        REGISTRO.pack_into(self.mapa, deslocamento, bloco.indice, bloco.timestamp, tem_documento,
+                           documento, anterior, bytes.fromhex(bloco.hash))
+        # O contador no cabeçalho só avança depois que o registro está completo no arquivo
+        self.blocos += 1
+        CABECALHO_BLOCOS.pack_into(self.mapa, 0, MAGICO_BLOCOS, self.blocos)
+        self.ultimo_hash = bloco.hash
+        if tem_documento:
+            self.indice.inserir(documento, bloco.indice)
+        self.indice.marcar_indexados(self.blocos)
+
+    def _crescer_arquivo(self):
+        # O arquivo é pré-alocado e dobra de tamanho quando enche, para não remapear a cada bloco
+        tamanho = len(self.mapa)
+        self.mapa.close()
+        self.arquivo.truncate(TAMANHO_CABECALHO + 2 * (tamanho - TAMANHO_CABECALHO))
+        self.mapa = mmap.mmap(self.arquivo.fileno(), 0)
+
+    def _indexar(self, inicio):
+        for posicao in range(inicio, self.blocos):
+            indice, _, tem_documento, documento, _, _ = REGISTRO.unpack_from(
+                self.mapa, TAMANHO_CABECALHO + posicao * REGISTRO.size)
+            if tem_documento:
+                self.indice.inserir(documento, indice)
+        self.indice.marcar_indexados(self.blocos)
+
+    def verificar_integridade(self):
+        # Passada sequencial sobre o arquivo mapeado, em trechos de BLOCOS_POR_PASSADA registros
+        inicio = time.perf_counter()
+        sha256 = hashlib.sha256
+        anterior = bytes(32)
+        for primeiro in range(0, self.blocos, BLOCOS_POR_PASSADA):
+            ultimo = min(self.blocos, primeiro + BLOCOS_POR_PASSADA)
+            trecho = self.mapa[TAMANHO_CABECALHO + primeiro * REGISTRO.size:TAMANHO_CABECALHO + ultimo * REGISTRO.size]
+            for posicao, registro in enumerate(REGISTRO.iter_unpack(trecho), primeiro):
+                indice, timestamp, tem_documento, documento, hash_anterior, hash_bloco = registro
+                documento = documento.hex() if tem_documento else None
+                texto_anterior = hash_anterior.hex() if indice > 1 else "0"
+                valor = f"{indice}{documento}{texto_anterior}{timestamp}"
+                if (indice != posicao + 1 or hash_anterior != anterior
+                        or sha256(valor.encode()).digest() != hash_bloco):
+                    return {"valida": False, "blocos_verificados": posicao, "bloco_invalido": posicao + 1,
+                            "segundos": time.perf_counter() - inicio}
+                anterior = hash_bloco
+        return {"valida": True, "blocos_verificados": self.blocos, "bloco_invalido": None,
+                "segundos": time.perf_counter() - inicio}
+
+# Exemplo de uso
+if __name__ == "__main__":
+    quantidade = 200_000
+    with tempfile.TemporaryDirectory() as diretorio:
+        inicio = time.perf_counter()
+        with BlockchainPersistente(diretorio) as blockchain:
+            hash_notarizado = blockchain.notarizar_documento("Este é um documento importante.")
+            for i in range(quantidade - 1):
+                blockchain.notarizar_documento(f"documento {i}")
+        print(f"{quantidade:,} documentos gravados em {time.perf_counter() - inicio:.2f}s "
+              f"({REGISTRO.size} bytes por bloco)")
+
+        inicio = time.perf_counter()
+        blockchain = BlockchainPersistente(diretorio)
+        print(f"Reabertura em {(time.perf_counter() - inicio) * 1e3:.2f} ms, "
+              f"número de blocos na blockchain: {len(blockchain.cadeia)}")
+        assert blockchain.cadeia[-1].hash == blockchain.ultimo_hash
+
+        procurado = hashlib.sha256(f"documento {quantidade - 2}".encode()).hexdigest()
+        inicio = time.perf_counter()
+        bloco = blockchain.buscar_documento(procurado)
+        tempo_indice = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        varredura = next(b for b in blockchain.cadeia if b.hash_documento == procurado)
+        tempo_varredura = time.perf_counter() - inicio
+        assert bloco.hash == varredura.hash
+        print(f"Busca pelo índice: {tempo_indice * 1e6:.1f} µs; varrendo a cadeia: {tempo_varredura * 1e3:.1f} ms")
+        print("Documento não notarizado encontrado:", blockchain.buscar_documento(hashlib.sha256(b"?").hexdigest()))
+
+        resultado = blockchain.verificar_integridade()
+        print(f"Cadeia íntegra: {resultado['valida']} ({resultado['blocos_verificados']:,} blocos "
+              f"em {resultado['segundos']:.2f}s)")
+
+        # Adultera o timestamp do bloco 1000 direto no arquivo
+        blockchain.mapa[TAMANHO_CABECALHO + 999 * REGISTRO.size + 8] ^= 1
+        resultado = blockchain.verificar_integridade()
+        print(f"Após adulteração: íntegra = {resultado['valida']}, primeiro bloco inválido: {resultado['bloco_invalido']}")
+        blockchain.fechar()
@@ -0,0 +1,139 @@
+# Este código permite notarizar arquivos grandes sem carregá-los na memória.
+# notarizar_documento de 20260103_183020_Notarizacao_de_Documentos.py recebe o documento inteiro como str e
+# ainda faz .encode(), o que dobra a memória. hash_fluxo lê o arquivo em blocos de tamanho fixo com readinto
+# num único buffer reutilizado, então a memória fica constante qualquer que seja o tamanho do arquivo, e o hash
+# é o mesmo SHA-256 que notarizar_documento calcularia para o mesmo conteúdo.
+# hash_diretorio calcula o hash de milhares de arquivos em paralelo num pool de threads: o hashlib libera o GIL
+# durante o update de blocos grandes, e a leitura do disco também não segura o GIL.
+# hash_em_arvore divide um único arquivo enorme em segmentos, calcula o hash de cada segmento numa thread e
+# combina os hashes com a árvore de Merkle de 20261018_150010_Notarizacao_Merkle.py. O resultado é outro valor
+# (não é o SHA-256 do arquivo) e depende do tamanho do segmento, que por isso deve ser guardado junto.
+# Não são necessárias bibliotecas externas.
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+notarizacao = carregar_script("20260103_183020_Notarizacao_de_Documentos.py")
+merkle = carregar_script("20261018_150010_Notarizacao_Merkle.py")
+
+MODOS = ("sequencial", "arvore")
+TAMANHO_BLOCO = 1 << 20  # 1 MiB por leitura
+TAMANHO_SEGMENTO = 1 << 26  # 64 MiB por segmento no modo árvore
+
+def hash_fluxo(fluxo, tamanho_bloco=TAMANHO_BLOCO, limite=None):
+    # Lê de um arquivo binário (ou qualquer objeto com readinto) até o fim ou até `limite` bytes
+    sha256 = hashlib.sha256()
+    buffer = bytearray(tamanho_bloco)
+    visao = memoryview(buffer)
+    restante = limite
+    while restante is None or restante > 0:
+        alvo = visao if restante is None or restante >= tamanho_bloco else visao[:restante]
+        lidos = fluxo.readinto(alvo)
+        if not lidos:
+            break
+        sha256.update(visao[:lidos])
+        if restante is not None:
+            restante -= lidos
+    return sha256.hexdigest()
+
+def hash_arquivo(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    with open(caminho, "rb", buffering=0) as arquivo:
+        return hash_fluxo(arquivo, tamanho_bloco)
+
+def _hash_segmento(caminho, inicio, tamanho, tamanho_bloco):
+    # Cada thread abre o próprio arquivo, então as posições de leitura não se misturam
+    with open(caminho, "rb", buffering=0) as arquivo:
+        arquivo.seek(inicio)
+        return hash_fluxo(arquivo, tamanho_bloco, limite=tamanho)
+
+def hash_em_arvore(caminho, tamanho_segmento=TAMANHO_SEGMENTO, trabalhadores=None, tamanho_bloco=TAMANHO_BLOCO):
+    tamanho = os.path.getsize(caminho)
+    inicios = range(0, max(tamanho, 1), tamanho_segmento)  # Um arquivo vazio ainda tem um segmento (vazio)
+    with ThreadPoolExecutor(max_workers=trabalhadores or os.cpu_count()) as pool:
+        folhas = list(pool.map(lambda inicio: _hash_segmento(caminho, inicio, tamanho_segmento, tamanho_bloco),
+                               inicios))
+    return merkle.ArvoreMerkle(folhas).raiz
+
+def hash_diretorio(diretorio, padrao="**/*", trabalhadores=None, tamanho_bloco=TAMANHO_BLOCO):
+    # Devolve {caminho: hash} para cada arquivo de `diretorio` que casa com `padrao`, em ordem de caminho
+    caminhos = sorted(caminho for caminho in Path(diretorio).glob(padrao) if caminho.is_file())
+    with ThreadPoolExecutor(max_workers=trabalhadores or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        hashes = pool.map(lambda caminho: hash_arquivo(caminho, tamanho_bloco), caminhos)
+        return dict(zip(caminhos, hashes))
+
+def notarizar_arquivo(blockchain, caminho, modo="sequencial", tamanho_segmento=TAMANHO_SEGMENTO):
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconhecido: {modo}. Use um de {MODOS}")
+    if modo == "sequencial":
+        hash_documento = hash_arquivo(caminho)
+    else:
+        hash_documento = hash_em_arvore(caminho, tamanho_segmento)
+    bloco = blockchain.criar_bloco(hash_documento)
+    return bloco.hash
+
+def notarizar_diretorio(blockchain, diretorio, padrao="**/*", trabalhadores=None):
+    # Os hashes são calculados em paralelo, mas os blocos são criados na ordem dos caminhos
+    hashes = hash_diretorio(diretorio, padrao, trabalhadores)
+    return {caminho: blockchain.criar_bloco(hash_documento).hash for caminho, hash_documento in hashes.items()}
+
+def _medir(funcao, *args):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    segundos = time.perf_counter() - inicio
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+# Exemplo de uso
+if __name__ == "__main__":
+    documento = "Este é um documento importante."
+    with tempfile.TemporaryDirectory() as diretorio:
+        diretorio = Path(diretorio)
+        pequeno = diretorio / "documento.txt"
+        pequeno.write_text(documento, encoding="utf-8")
+        assert hash_arquivo(pequeno) == hashlib.sha256(documento.encode()).hexdigest()
+
+        megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+        grande = diretorio / "arquivo.bin"
+        with open(grande, "wb") as arquivo:
+            bloco = os.urandom(1 << 20)
+            for _ in range(megabytes):
+                arquivo.write(bloco)
+
+        esperado, segundos, pico = _medir(lambda: hashlib.sha256(grande.read_bytes()).hexdigest())
+        print(f"Arquivo inteiro na memória: {megabytes / segundos:7.0f} MB/s, pico {pico / 2**20:7.1f} MiB")
+        obtido, segundos, pico = _medir(hash_arquivo, grande)
+        assert obtido == esperado
+        print(f"Em blocos com readinto:     {megabytes / segundos:7.0f} MB/s, pico {pico / 2**20:7.1f} MiB")
+        raiz, segundos, pico = _medir(hash_em_arvore, grande, 1 << 24)
+        print(f"Árvore de segmentos 16 MiB: {megabytes / segundos:7.0f} MB/s, pico {pico / 2**20:7.1f} MiB "
+              f"({os.cpu_count()} núcleos)")
+
+        arquivos = diretorio / "arquivos"
+        arquivos.mkdir()
+        for i in range(2_000):
+            (arquivos / f"doc{i:04}.txt").write_bytes(os.urandom(64 * 1024))
+        inicio = time.perf_counter()
+        serial = {caminho: hash_arquivo(caminho) for caminho in sorted(arquivos.iterdir())}
+        tempo_serial = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        paralelo = hash_diretorio(arquivos)
+        tempo_paralelo = time.perf_counter() - inicio
+        assert serial == paralelo
+        print(f"2.000 arquivos: {tempo_serial:.2f}s em série, {tempo_paralelo:.2f}s no pool de threads")
+
+        blockchain = notarizacao.Blockchain()
+        notarizar_arquivo(blockchain, grande, modo="arvore")
+        notarizar_diretorio(blockchain, arquivos)
+        print(f"Número de blocos na blockchain: {len(blockchain.cadeia)}")
@@ -0,0 +1,185 @@
+# Este código simula um serviço de timestamping com N nós, usando asyncio e filas em memória como rede.
+# O nó 0 é o líder: ele recebe os registros dos clientes, junta os que chegaram enquanto o bloco anterior era
+# replicado num único Block (até tamanho_lote registros), encadeia-o pelo hash do bloco anterior e o envia aos
+# seguidores. Cada seguidor confere o índice, o previous_hash e recalcula o hash antes de anexar o bloco e
+# responder; quando a maioria dos nós (quórum, contando o líder) tem o bloco, ele é confirmado e os clientes
+# recebem o índice do bloco e o timestamp. Com 2f+1 nós o serviço continua confirmando com f nós parados.
+# A rede entrega as mensagens de cada nó em ordem, com uma latência configurável.
+# O gerador de carga mede registros por segundo e os percentis da latência de confirmação variando o número de
+# nós e o tamanho do lote. Usa o Block de 20260122_183027_Timestamping_Distribuido.py.
+# Não são necessárias bibliotecas externas.
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+timestamping = carregar_script("20260122_183027_Timestamping_Distribuido.py")
+
+LATENCIA = 0.0005  # Segundos por mensagem entre dois nós
+TAMANHO_LOTE = 256
+
+class No:
+    def __init__(self, identificador, cluster):
+        self.identificador = identificador
+        self.cluster = cluster
+        self.caixa = asyncio.Queue()  # Mensagens (instante de entrega, mensagem) vindas da rede
+        self.cadeia = [timestamping.create_genesis_block()]
+        self.altura_confirmada = 0
+        self.ativo = True
+        self.rejeitados = 0
+
+    async def receber(self):
+        while True:
+            entrega, mensagem = await self.caixa.get()
+            espera = entrega - time.perf_counter()
+            if espera > 0:
+                await asyncio.sleep(espera)
+            if self.ativo:
+                self.tratar(*mensagem)
+
+    def tratar(self, tipo, *argumentos):
+        if tipo == "anexar":
+            bloco, = argumentos
+            anterior = self.cadeia[-1]
+            # O seguidor só aceita o bloco que continua a própria cadeia e cujo hash confere
+            if (bloco.index != anterior.index + 1 or bloco.previous_hash != anterior.hash
+                    or bloco.calcular_hash() != bloco.hash):
+                self.rejeitados += 1
+                return
+            self.cadeia.append(bloco)
+            self.cluster.enviar(self.cluster.lider, ("confirmacao", bloco.index, self.identificador))
+        elif tipo == "confirmar":
+            self.altura_confirmada = max(self.altura_confirmada, argumentos[0])
+        elif tipo == "confirmacao":
+            self.cluster.registrar_confirmacao(*argumentos)
+
+class ClusterDeTimestamping:
+    def __init__(self, num_nos=3, tamanho_lote=TAMANHO_LOTE, latencia=LATENCIA):
+        self.nos = [No(i, self) for i in range(num_nos)]
+        self.lider = self.nos[0]
+        self.quorum = num_nos // 2 + 1
+        self.tamanho_lote = tamanho_lote
+        self.latencia = latencia
+        self.entrada = asyncio.Queue()  # (registro, futuro do cliente)
+        self.aguardando = {}  # índice do bloco -> (nós que já têm o bloco, futuro do quórum)
+        self.tarefas = []
+        self.lotes = []  # Tamanho de cada bloco confirmado
+
+    async def __aenter__(self):
+        self.tarefas = [asyncio.create_task(no.receber()) for no in self.nos]
+        self.tarefas.append(asyncio.create_task(self._liderar()))
+        return self
+
+    async def __aexit__(self, *excecao):
+        for tarefa in self.tarefas:
+            tarefa.cancel()
+        await asyncio.gather(*self.tarefas, return_exceptions=True)
+
+    def enviar(self, destino, mensagem):
+        destino.caixa.put_nowait((time.perf_counter() + self.latencia, mensagem))
+
+    async def registrar(self, registro):
+        # Chamado pelos clientes; devolve (índice do bloco, timestamp) depois que o bloco é confirmado
+        futuro = asyncio.get_running_loop().create_future()
+        self.entrada.put_nowait((registro, futuro))
+        return await futuro
+
+    def registrar_confirmacao(self, indice, identificador):
+        nos, futuro = self.aguardando.get(indice, (None, None))
+        if nos is None:
+            return
+        nos.add(identificador)
+        if len(nos) >= self.quorum and not futuro.done():
+            futuro.set_result(None)
+
+    async def _liderar(self):
+        while True:
+            lote = [await self.entrada.get()]
+            # Tudo o que chegou enquanto o bloco anterior era replicado entra neste bloco
+            while len(lote) < self.tamanho_lote and not self.entrada.empty():
+                lote.append(self.entrada.get_nowait())
+
+            anterior = self.lider.cadeia[-1]
+            bloco = timestamping.Block(anterior.index + 1, time.time(), [registro for registro, _ in lote],
+                                       anterior.hash)
+            self.lider.cadeia.append(bloco)
+            quorum = asyncio.get_running_loop().create_future()
+            self.aguardando[bloco.index] = ({self.lider.identificador}, quorum)
+            self.registrar_confirmacao(bloco.index, self.lider.identificador)  # Com um só nó o quórum é o líder
+            for seguidor in self.nos[1:]:
+                self.enviar(seguidor, ("anexar", bloco))
+            await quorum
+            del self.aguardando[bloco.index]
+
+            self.lider.altura_confirmada = bloco.index
+            for seguidor in self.nos[1:]:
+                self.enviar(seguidor, ("confirmar", bloco.index))
+            self.lotes.append(len(lote))
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_result((bloco.index, bloco.timestamp))
+
+def percentil(valores_ordenados, p):
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(p / 100 * len(valores_ordenados)))]
+
+async def gerar_carga(cluster, registros=20_000, clientes=500):
+    # Cada cliente envia seus registros um de cada vez, esperando a confirmação do anterior
+    latencias = []
+
+    async def cliente(numero):
+        for i in range(numero, registros, clientes):
+            inicio = time.perf_counter()
+            await cluster.registrar(f"registro {i}")
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(numero) for numero in range(clientes)))
+    segundos = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        "registros_por_segundo": registros / segundos,
+        "p50_ms": percentil(latencias, 50) * 1e3,
+        "p95_ms": percentil(latencias, 95) * 1e3,
+        "p99_ms": percentil(latencias, 99) * 1e3,
+        "blocos": len(cluster.lotes),
+        "lote_medio": sum(cluster.lotes) / len(cluster.lotes),
+    }
+
+def cadeias_consistentes(cluster):
+    # Os nós ativos têm de concordar com o líder em todos os blocos que já receberam
+    hashes_lider = [bloco.hash for bloco in cluster.lider.cadeia]
+    return all([bloco.hash for bloco in no.cadeia] == hashes_lider[:len(no.cadeia)]
+               for no in cluster.nos if no.ativo)
+
+async def benchmark(contagens_nos=(1, 3, 5), tamanhos_lote=(1, 16, 256), registros=4_000, clientes=200):
+    print(f"{'nós':>4} {'lote':>5} {'registros/s':>12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'lote médio':>11}")
+    for num_nos in contagens_nos:
+        for tamanho_lote in tamanhos_lote:
+            async with ClusterDeTimestamping(num_nos, tamanho_lote) as cluster:
+                r = await gerar_carga(cluster, registros, clientes)
+                assert cadeias_consistentes(cluster)
+            print(f"{num_nos:>4} {tamanho_lote:>5} {r['registros_por_segundo']:>12,.0f} {r['p50_ms']:>8.2f} "
+                  f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['lote_medio']:>11.1f}")
+
+async def exemplo():
+    async with ClusterDeTimestamping(num_nos=5, tamanho_lote=4) as cluster:
+        cluster.nos[4].ativo = False  # Com 5 nós o quórum é 3, então um nó parado não impede a confirmação
+        confirmacoes = await asyncio.gather(*(cluster.registrar(f"Block {i} Data") for i in range(1, 11)))
+        for registro, (indice, timestamp) in zip(range(1, 11), confirmacoes):
+            print(f"Registro {registro} confirmado no bloco {indice} ({time.strftime('%H:%M:%S', time.localtime(timestamp))})")
+        await asyncio.sleep(10 * cluster.latencia)  # Deixa as últimas mensagens "confirmar" chegarem
+        for no in cluster.nos:
+            print(f"Nó {no.identificador}: {len(no.cadeia)} blocos, altura confirmada {no.altura_confirmada}"
+                  f"{'' if no.ativo else ' (parado)'}")
+        print("Cadeias consistentes:", cadeias_consistentes(cluster))
+        print(f"Hash do último bloco: {cluster.lider.cadeia[-1].hash}")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    asyncio.run(exemplo())
+    asyncio.run(benchmark())
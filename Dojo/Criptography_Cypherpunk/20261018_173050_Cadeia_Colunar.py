@@ -0,0 +1,220 @@
+# Este código implementa uma representação compacta, em colunas, para cadeias longas de blocos de notarização.
+# Cada Bloco de 20260103_183020_Notarizacao_de_Documentos.py é um objeto Python com dois hashes hexadecimais de
+# 64 caracteres (str), um float e um int, todos alocados separadamente; numa cadeia de 10 milhões de blocos isso
+# passa de alguns GB. CadeiaColunar guarda os mesmos campos num único array estruturado do NumPy: índice e
+# timestamp em 8 bytes cada e os hashes em binário, 32 bytes cada, 113 bytes por bloco no total. O array cresce
+# dobrando de tamanho, como uma lista.
+# cadeia[i] devolve uma VisaoBloco, um objeto leve (com __slots__) que lê os campos do array sob demanda e tem os
+# mesmos atributos de Bloco, então as funções que recebem um Blockchain (validar, NotarizadorEmLote...) também
+# aceitam uma CadeiaColunar. Para cadeias pequenas, Bloco e o Block de 20260122_183027_Timestamping_Distribuido.py
+# agora usam __slots__, o que já elimina o __dict__ de cada bloco.
+# O benchmark mede a memória por bloco e a velocidade de iteração das três representações.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import gc
+import hashlib
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+notarizacao = carregar_script("20260103_183020_Notarizacao_de_Documentos.py")
+
+DTYPE_BLOCO = np.dtype([
+    ("indice", "<i8"),
+    ("timestamp", "<f8"),
+    ("tem_documento", "?"),  # O bloco gênese não tem documento (hash_documento = None)
+    ("hash_documento", "V32"),
+    ("hash_anterior", "V32"),
+    ("hash", "V32"),
+])
+CAPACIDADE_INICIAL = 1024
+
+class VisaoBloco:
+    __slots__ = ("_cadeia", "_posicao")
+
+    def __init__(self, cadeia, posicao):
+        self._cadeia = cadeia
+        self._posicao = posicao
+
+    def _campo(self, nome):
+        return self._cadeia.registros[self._posicao][nome]
+
+    @property
+    def indice(self):
+        return int(self._campo("indice"))
+
+    @property
+    def timestamp(self):
+        return float(self._campo("timestamp"))
+
+    @property
+    def hash_documento(self):
+        return bytes(self._campo("hash_documento")).hex() if self._campo("tem_documento") else None
+
+    @property
+    def hash_anterior(self):
+        # O gênese (índice 1) aponta para "0"; o primeiro bloco de um trecho fatiado guarda o hash do anterior
+        return bytes(self._campo("hash_anterior")).hex() if self.indice > 1 else "0"
+
+    @property
+    def hash(self):
+        return bytes(self._campo("hash")).hex()
+
+    # Mesma fórmula de Bloco, lendo os campos da visão
+    calcular_hash = notarizacao.Bloco.calcular_hash
+
+class CadeiaColunar:
+    def __init__(self, capacidade=CAPACIDADE_INICIAL, criar_genese=True):
+        self._registros = np.zeros(capacidade, dtype=DTYPE_BLOCO)
+        self.blocos = 0
+        if criar_genese:
+            self.criar_bloco()  # Bloco gênese, sem documento
+
+    @classmethod
+    def de_blockchain(cls, blockchain):
+        # Converte uma cadeia de objetos Bloco (Blockchain, BlockchainPersistente...) para colunas
+        cadeia = cls(capacidade=max(len(blockchain.cadeia), 1), criar_genese=False)
+        for bloco in blockchain.cadeia:
+            cadeia._anexar(bloco)
+        return cadeia
+
+    @property
+    def registros(self):
+        # Só as linhas ocupadas; é uma visão do array, sem cópia
+        return self._registros[:self.blocos]
+
+    @property
+    def cadeia(self):
+        # Mesma forma de acesso de Blockchain.cadeia: cadeia[indice - 1], len(cadeia), iteração
+        return self
+
+    def __len__(self):
+        return self.blocos
+
+    def __getitem__(self, posicao):
+        if posicao < 0:
+            posicao += self.blocos
+        if not 0 <= posicao < self.blocos:
+            raise IndexError("Bloco fora da cadeia")
+        return VisaoBloco(self, posicao)
+
+    def __iter__(self):
+        for posicao in range(self.blocos):
+            yield VisaoBloco(self, posicao)
+
+    def coluna(self, nome):
+        # Acesso vetorizado a um campo de todos os blocos, por exemplo coluna("timestamp")
+        return self.registros[nome]
+
+    def criar_bloco(self, hash_documento=None):
+        hash_anterior = self[-1].hash if self.blocos else "0"
+        self._anexar(notarizacao.Bloco(self.blocos + 1, hash_documento, hash_anterior))
+        return self[-1]
+
+    def notarizar_documento(self, documento):
+        hash_documento = hashlib.sha256(documento.encode()).hexdigest()
+        bloco = self.criar_bloco(hash_documento)
+        return bloco.hash
+
+    def _anexar(self, bloco):
+        if self.blocos == len(self._registros):
+            maior = np.zeros(2 * len(self._registros), dtype=DTYPE_BLOCO)
+            maior[:self.blocos] = self._registros
+            self._registros = maior
+        tem_documento = bloco.hash_documento is not None
+        self._registros[self.blocos] = (
+            bloco.indice,
+            bloco.timestamp,
+            tem_documento,
+            bytes.fromhex(bloco.hash_documento) if tem_documento else bytes(32),
+            bytes.fromhex(bloco.hash_anterior) if bloco.indice > 1 else bytes(32),
+            bytes.fromhex(bloco.hash),
+        )
+        self.blocos += 1
+
+    def buscar_documento(self, hash_documento):
+        # Comparação vetorizada sobre a coluna inteira; devolve a visão do primeiro bloco com o documento
+        encontrados = np.flatnonzero(self.coluna("tem_documento")
+                                     & (self.coluna("hash_documento") == np.void(bytes.fromhex(hash_documento))))
+        return self[int(encontrados[0])] if len(encontrados) else None
+
+    def encadeamento_valido(self):
+        # Confere todas as ligações hash_anterior -> hash de uma vez (os hashes em si não são recalculados).
+        # Um trecho de fatiar começa no índice do seu primeiro bloco, não necessariamente em 1
+        registros = self.registros
+        if not self.blocos:
+            return True
+        primeiro = int(registros["indice"][0])
+        return bool(np.all(registros["hash_anterior"][1:] == registros["hash"][:-1])
+                    and np.all(registros["indice"] == np.arange(primeiro, primeiro + self.blocos)))
+
+    def fatiar(self, inicio, fim):
+        # Cópia compacta de um trecho da cadeia
+        trecho = CadeiaColunar(capacidade=max(fim - inicio, 1), criar_genese=False)
+        trecho._registros[:fim - inicio] = self._registros[inicio:fim]
+        trecho.blocos = fim - inicio
+        return trecho
+
+class _BlocoComDict:
+    # O Bloco de antes de __slots__, com um __dict__ por instância, só para comparação no benchmark
+    __init__ = notarizacao.Bloco.__init__
+    calcular_hash = notarizacao.Bloco.calcular_hash
+
+def _medir_memoria(construir):
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, memoria
+
+def _lista_de_blocos(classe, quantidade):
+    blocos = [classe(1, None, "0")]
+    for i in range(quantidade - 1):
+        blocos.append(classe(i + 2, hashlib.sha256(str(i).encode()).hexdigest(), blocos[-1].hash))
+    return blocos
+
+def benchmark(quantidade=200_000):
+    com_dict, memoria_dict = _medir_memoria(lambda: _lista_de_blocos(_BlocoComDict, quantidade))
+    com_slots, memoria_slots = _medir_memoria(lambda: _lista_de_blocos(notarizacao.Bloco, quantidade))
+    blockchain = notarizacao.Blockchain()
+    blockchain.cadeia = com_slots
+    colunar, memoria_colunar = _medir_memoria(lambda: CadeiaColunar.de_blockchain(blockchain).fatiar(0, quantidade))
+
+    print(f"{'representação':<24} {'bytes/bloco':>12} {'10M blocos':>11} {'iterar .hash':>13}")
+    for nome, blocos, memoria in (("Bloco com __dict__", com_dict, memoria_dict),
+                                  ("Bloco com __slots__", com_slots, memoria_slots),
+                                  ("CadeiaColunar (visões)", colunar, memoria_colunar)):
+        inicio = time.perf_counter()
+        for bloco in blocos:
+            bloco.hash
+        segundos = time.perf_counter() - inicio
+        print(f"{nome:<24} {memoria / quantidade:>12.0f} {memoria / quantidade * 1e7 / 2**30:>9.2f} GB "
+              f"{quantidade / segundos / 1e6:>8.2f} M/s")
+
+    inicio = time.perf_counter()
+    intervalos = np.diff(colunar.coluna("timestamp"))
+    segundos = time.perf_counter() - inicio
+    print(f"{'CadeiaColunar (coluna)':<24} {'':>12} {'':>11} {quantidade / segundos / 1e6:>8.0f} M/s "
+          f"(np.diff dos timestamps, intervalo médio {intervalos.mean() * 1e6:.1f} µs)")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    cadeia = CadeiaColunar()
+    hash_notarizado = cadeia.notarizar_documento("Este é um documento importante.")
+    for i in range(10_000):
+        cadeia.notarizar_documento(f"documento {i}")
+    print(f"Hash do documento notarizado: {hash_notarizado}")
+    print(f"Número de blocos na blockchain: {len(cadeia.cadeia)} ({cadeia.registros.nbytes / len(cadeia):.0f} bytes por bloco)")
+    bloco = cadeia.buscar_documento(hashlib.sha256(b"documento 1234").hexdigest())
+    print(f"Documento encontrado no bloco {bloco.indice}; hash recalculado confere: {bloco.calcular_hash() == bloco.hash}")
+    print("Encadeamento válido:", cadeia.encadeamento_valido())
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
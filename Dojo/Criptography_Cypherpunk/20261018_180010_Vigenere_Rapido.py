@@ -0,0 +1,136 @@
+# Este código implementa um motor rápido para a Cifra de Vigenère de 20260129_183016_Cifra_de_Vigenere.py.
+# vigenere_encrypt repete a palavra-chave até o tamanho do texto e chama ord/chr para cada caractere. Aqui as
+# 26 tabelas de deslocamento são calculadas uma única vez e o texto é processado em passos do tamanho da chave:
+# os caracteres nas posições j, j+L, j+2L... usam todos a mesma letra da chave, então cada uma dessas fatias é
+# traduzida de uma vez com bytes.translate ("translate") ou indexando a tabela da letra com o NumPy ("numpy").
+# A semântica é exatamente a do código original: a posição na chave avança a cada caractere (inclusive os que
+# não são letras, que ficam inalterados), maiúsculas e minúsculas são preservadas e a chave vale pelo
+# deslocamento de k.lower(). O caminho rápido trabalha sobre bytes ASCII; letras fora do ASCII (que o original
+# também desloca) são tratadas uma a uma pela mesma fórmula do original.
+# O parâmetro `deslocamento` diz em que posição da chave o texto começa, para cifrar um texto em pedaços.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+vigenere = carregar_script("20260129_183016_Cifra_de_Vigenere.py")
+
+MOTORES = ("translate", "numpy")
+MINUSCULAS = string.ascii_lowercase.encode()
+MAIUSCULAS = string.ascii_uppercase.encode()
+NAO_ASCII = re.compile(r"[^\x00-\x7f]+")
+
+# TABELAS[s] desloca as letras ASCII s posições e deixa os outros bytes como estão
+TABELAS = [
+    bytes.maketrans(MINUSCULAS + MAIUSCULAS,
+                    MINUSCULAS[s:] + MINUSCULAS[:s] + MAIUSCULAS[s:] + MAIUSCULAS[:s])
+    for s in range(26)
+]
+TABELAS_NP = np.frombuffer(b"".join(TABELAS), dtype=np.uint8).reshape(26, 256)
+
+def deslocamentos_da_chave(palavra_chave, decifrar=False):
+    # Mesmo deslocamento do original, ord(k.lower()) - ord('a'), reduzido a 0..25
+    deslocamentos = [(ord(k.lower()) - ord("a")) % 26 for k in palavra_chave]
+    return [(26 - s) % 26 for s in deslocamentos] if decifrar else deslocamentos
+
+def _translate(dados, deslocamentos, deslocamento):
+    tamanho_chave = len(deslocamentos)
+    saida = bytearray(len(dados))
+    for j in range(min(tamanho_chave, len(dados))):
+        tabela = TABELAS[deslocamentos[(deslocamento + j) % tamanho_chave]]
+        saida[j::tamanho_chave] = dados[j::tamanho_chave].translate(tabela)
+    return bytes(saida)
+
+def _numpy(dados, deslocamentos, deslocamento):
+    # Mesmos passos do tamanho da chave, com cada fatia indexando a tabela da sua letra da chave
+    tamanho_chave = len(deslocamentos)
+    codigos = np.frombuffer(dados, dtype=np.uint8)
+    saida = np.empty_like(codigos)
+    for j in range(min(tamanho_chave, len(codigos))):
+        np.take(TABELAS_NP[deslocamentos[(deslocamento + j) % tamanho_chave]], codigos[j::tamanho_chave],
+                out=saida[j::tamanho_chave])
+    return saida.tobytes()
+
+_IMPLEMENTACOES = {"translate": _translate, "numpy": _numpy}
+
+def transformar_bytes(dados, deslocamentos, deslocamento=0, motor="translate"):
+    # Aplica os deslocamentos a bytes ASCII; bytes fora do ASCII passam inalterados
+    if motor not in _IMPLEMENTACOES:
+        raise ValueError(f"Motor desconhecido: {motor}. Use um de {MOTORES}")
+    if not dados:
+        return b""
+    return _IMPLEMENTACOES[motor](dados, deslocamentos, deslocamento)
+
+def _letras_fora_do_ascii(trecho, deslocamentos, deslocamento):
+    # Letras não ASCII (á, Ç...) recebem a mesma fórmula de vigenere_encrypt, caractere a caractere
+    caracteres = []
+    for posicao, c in enumerate(trecho, deslocamento):
+        if c.isalpha():
+            base = ord("a") if c.islower() else ord("A")
+            c = chr((ord(c) - base + deslocamentos[posicao % len(deslocamentos)]) % 26 + base)
+        caracteres.append(c)
+    return "".join(caracteres)
+
+def _transformar_texto(texto, palavra_chave, decifrar, deslocamento, motor):
+    deslocamentos = deslocamentos_da_chave(palavra_chave, decifrar)
+    if texto.isascii():
+        return transformar_bytes(texto.encode("ascii"), deslocamentos, deslocamento, motor).decode("ascii")
+    # As posições da chave são contadas em caracteres: os trechos ASCII vão pelo caminho rápido, cada um com o
+    # seu deslocamento, e só os trechos não ASCII passam pelo laço caractere a caractere
+    partes = []
+    inicio = 0
+    for trecho in NAO_ASCII.finditer(texto):
+        ascii_ = texto[inicio:trecho.start()].encode("ascii")
+        partes.append(transformar_bytes(ascii_, deslocamentos, deslocamento + inicio, motor).decode("ascii"))
+        partes.append(_letras_fora_do_ascii(trecho.group(), deslocamentos, deslocamento + trecho.start()))
+        inicio = trecho.end()
+    partes.append(transformar_bytes(texto[inicio:].encode("ascii"), deslocamentos, deslocamento + inicio,
+                                    motor).decode("ascii"))
+    return "".join(partes)
+
+def cifrar(texto, palavra_chave, deslocamento=0, motor="translate"):
+    return _transformar_texto(texto, palavra_chave, False, deslocamento, motor)
+
+def decifrar(texto, palavra_chave, deslocamento=0, motor="translate"):
+    return _transformar_texto(texto, palavra_chave, True, deslocamento, motor)
+
+def benchmark(megabytes=8, palavra_chave="chave"):
+    frase = "Ola Mundo! A cifra de Vigenere desloca cada letra pela letra da chave. "
+    texto = (frase * (megabytes * 2**20 // len(frase) + 1))[:megabytes * 2**20]
+    esperado = base = None
+    for nome, funcao in (("original", vigenere.vigenere_encrypt),
+                         ("translate", lambda t, k: cifrar(t, k, motor="translate")),
+                         ("numpy", lambda t, k: cifrar(t, k, motor="numpy"))):
+        inicio = time.perf_counter()
+        cifrada = funcao(texto, palavra_chave)
+        segundos = time.perf_counter() - inicio
+        esperado = esperado or cifrada
+        assert cifrada == esperado
+        base = base or segundos
+        print(f"{nome:<10} {megabytes / segundos:8.1f} MB/s (x{base / segundos:.0f})")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    mensagem = "Ola Mundo!"
+    palavra_chave = "chave"
+    for motor in MOTORES:
+        cifrada = cifrar(mensagem, palavra_chave, motor=motor)
+        assert cifrada == vigenere.vigenere_encrypt(mensagem, palavra_chave)
+        assert decifrar(cifrada, palavra_chave, motor=motor) == mensagem
+        print(f"[{motor}] Mensagem Cifrada: {cifrada}")
+
+    acentuada = "Atenção: o código é VÁLIDO às 10h, não às 11h!"
+    for motor in MOTORES:
+        assert cifrar(acentuada, "Zebra", motor=motor) == vigenere.vigenere_encrypt(acentuada, "Zebra")
+        assert decifrar(acentuada, "Zebra", motor=motor) == vigenere.vigenere_decrypt(acentuada, "Zebra")
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
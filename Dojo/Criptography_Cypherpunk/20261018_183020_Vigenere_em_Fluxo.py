@@ -0,0 +1,176 @@
+# Este código cifra e decifra arquivos e fluxos com a Cifra de Vigenère sem carregar o texto inteiro na memória.
+# O texto é processado em pedaços de tamanho fixo pelo motor de 20261018_180010_Vigenere_Rapido.py, e cada pedaço
+# começa na posição da chave em que o anterior parou. Como em vigenere_encrypt, a posição na chave avança a cada
+# caractere, letra ou não, então o deslocamento de um pedaço é o número de caracteres antes dele: em UTF-8 isso
+# é o número de bytes que não são de continuação (0x80-0xBF). Os cortes entre pedaços nunca caem no meio de um
+# caractere, e um pedaço só de ASCII vai direto pelo caminho rápido em bytes, sem decodificar.
+# Os arquivos são lidos por mmap. Com processos > 1, uma passada rápida conta os caracteres de cada pedaço
+# (somas de prefixo dão o deslocamento de cada um) e os pedaços são cifrados em paralelo num pool de processos,
+# cada processo abrindo o próprio mmap; o resultado é escrito em ordem.
+# cifrar_fluxo/decifrar_fluxo fazem o mesmo para qualquer iterável de str ou de bytes (linhas de um log, um socket...).
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+rapido = carregar_script("20261018_180010_Vigenere_Rapido.py")
+
+TAMANHO_BLOCO = 1 << 24  # 16 MiB por pedaço
+# Para contar caracteres UTF-8: translate(None, NAO_CONTINUACAO) deixa só os bytes de continuação
+NAO_CONTINUACAO = bytes(b for b in range(256) if not 0x80 <= b < 0xC0)
+
+def contar_caracteres(dados):
+    return len(dados) - len(dados.translate(None, NAO_CONTINUACAO))
+
+def _fim_completo(dados, fim):
+    # Recua `fim` até o início de um caractere UTF-8, para não partir um caractere entre dois pedaços
+    while 0 < fim < len(dados) and 0x80 <= dados[fim] < 0xC0:
+        fim -= 1
+    return fim
+
+def _tamanho_utf8(primeiro_byte):
+    return 4 if primeiro_byte >= 0xF0 else 3 if primeiro_byte >= 0xE0 else 2 if primeiro_byte >= 0xC0 else 1
+
+def _fim_do_ultimo_completo(dados):
+    # Num fluxo, o último caractere pode estar incompleto; ele fica para o próximo pedaço
+    if not dados:
+        return 0
+    ultimo = _fim_completo(dados, len(dados) - 1)
+    return len(dados) if len(dados) - ultimo >= _tamanho_utf8(dados[ultimo]) else ultimo
+
+def transformar_pedaco(dados, palavra_chave, deslocamento, decifrar=False, motor="translate"):
+    # Devolve os bytes transformados de um pedaço UTF-8 que começa na posição `deslocamento` da chave
+    if dados.isascii():
+        deslocamentos = rapido.deslocamentos_da_chave(palavra_chave, decifrar)
+        return rapido.transformar_bytes(dados, deslocamentos, deslocamento, motor)
+    transformar = rapido.decifrar if decifrar else rapido.cifrar
+    return transformar(dados.decode("utf-8"), palavra_chave, deslocamento, motor).encode("utf-8")
+
+def _fluxo(pedacos, palavra_chave, decifrar, motor):
+    deslocamento = 0
+    sobra = b""  # Bytes de um caractere UTF-8 que ficou partido no fim do pedaço anterior
+    for pedaco in pedacos:
+        if isinstance(pedaco, str):
+            transformar = rapido.decifrar if decifrar else rapido.cifrar
+            yield transformar(pedaco, palavra_chave, deslocamento, motor)
+            deslocamento += len(pedaco)
+            continue
+        dados = sobra + bytes(pedaco)
+        corte = _fim_do_ultimo_completo(dados)
+        dados, sobra = dados[:corte], dados[corte:]
+        yield transformar_pedaco(dados, palavra_chave, deslocamento, decifrar, motor)
+        deslocamento += contar_caracteres(dados)
+    if sobra:
+        yield transformar_pedaco(sobra, palavra_chave, deslocamento, decifrar, motor)
+
+def cifrar_fluxo(pedacos, palavra_chave, motor="translate"):
+    return _fluxo(pedacos, palavra_chave, False, motor)
+
+def decifrar_fluxo(pedacos, palavra_chave, motor="translate"):
+    return _fluxo(pedacos, palavra_chave, True, motor)
+
+def _cortes(mapa, tamanho_bloco):
+    inicio = 0
+    while inicio < len(mapa):
+        fim = _fim_completo(mapa, min(len(mapa), inicio + tamanho_bloco))
+        if fim <= inicio:
+            fim = min(len(mapa), inicio + tamanho_bloco)  # Bloco menor que um caractere
+        yield inicio, fim
+        inicio = fim
+
+def _transformar_trecho(caminho, inicio, fim, palavra_chave, deslocamento, decifrar, motor):
+    # Executado no processo trabalhador: lê o próprio trecho do arquivo por mmap
+    with open(caminho, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        return transformar_pedaco(mapa[inicio:fim], palavra_chave, deslocamento, decifrar, motor)
+
+def _arquivo(origem, destino, palavra_chave, decifrar, processos, tamanho_bloco, motor):
+    inicio_tempo = time.perf_counter()
+    tamanho = os.path.getsize(origem)
+    with open(destino, "wb") as saida:
+        if tamanho == 0:
+            return {"bytes": 0, "segundos": 0.0, "mb_por_segundo": 0.0}
+        with open(origem, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            cortes = list(_cortes(mapa, tamanho_bloco))
+            if not processos or processos == 1:
+                deslocamento = 0
+                for inicio, fim in cortes:
+                    dados = mapa[inicio:fim]
+                    saida.write(transformar_pedaco(dados, palavra_chave, deslocamento, decifrar, motor))
+                    deslocamento += contar_caracteres(dados)
+            else:
+                # Soma de prefixo dos caracteres: cada pedaço sabe de antemão em que posição da chave começa
+                deslocamentos = [0]
+                for inicio, fim in cortes[:-1]:
+                    deslocamentos.append(deslocamentos[-1] + contar_caracteres(mapa[inicio:fim]))
+                with ProcessPoolExecutor(max_workers=processos) as pool:
+                    # Janela limitada de pedaços em andamento, para não acumular o arquivo inteiro na memória
+                    pendentes = deque()
+                    for (inicio, fim), deslocamento in zip(cortes, deslocamentos):
+                        pendentes.append(pool.submit(_transformar_trecho, origem, inicio, fim, palavra_chave,
+                                                     deslocamento, decifrar, motor))
+                        if len(pendentes) >= 2 * processos:
+                            saida.write(pendentes.popleft().result())
+                    while pendentes:
+                        saida.write(pendentes.popleft().result())
+    segundos = time.perf_counter() - inicio_tempo
+    return {"bytes": tamanho, "segundos": segundos, "mb_por_segundo": tamanho / 2**20 / segundos}
+
+def cifrar_arquivo(origem, destino, palavra_chave, processos=None, tamanho_bloco=TAMANHO_BLOCO, motor="translate"):
+    return _arquivo(origem, destino, palavra_chave, False, processos, tamanho_bloco, motor)
+
+def decifrar_arquivo(origem, destino, palavra_chave, processos=None, tamanho_bloco=TAMANHO_BLOCO, motor="translate"):
+    return _arquivo(origem, destino, palavra_chave, True, processos, tamanho_bloco, motor)
+
+# Exemplo de uso
+if __name__ == "__main__":
+    palavra_chave = "chave"
+    linhas = ["2026-10-18 12:00:01 INFO Ola Mundo!\n", "2026-10-18 12:00:02 WARN conexão recusada às 12h\n"]
+    texto = "".join(linhas * 1000)
+    esperado = rapido.vigenere.vigenere_encrypt(texto, palavra_chave)
+    assert "".join(cifrar_fluxo(linhas * 1000, palavra_chave)) == esperado
+    # Pedaços de bytes pequenos e irregulares, partindo caracteres acentuados ao meio
+    dados = texto.encode("utf-8")
+    pedacos = (dados[i:i + 7] for i in range(0, len(dados), 7))
+    assert b"".join(cifrar_fluxo(pedacos, palavra_chave)).decode("utf-8") == esperado
+
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    with tempfile.TemporaryDirectory() as diretorio:
+        diretorio = Path(diretorio)
+        log, cifrado, decifrado = diretorio / "log.txt", diretorio / "log.cifrado", diretorio / "log.decifrado"
+        with open(log, "wb") as arquivo:
+            bloco = "".join(linhas[:1] * 20000).encode()
+            for _ in range(megabytes * 2**20 // len(bloco)):
+                arquivo.write(bloco)
+            arquivo.write(dados)  # Um trecho com acentos no fim
+
+        pequeno = diretorio / "pequeno.txt"
+        pequeno.write_bytes(dados)
+        for processos in (None, 2):
+            cifrar_arquivo(pequeno, cifrado, palavra_chave, processos, tamanho_bloco=1000)
+            assert cifrado.read_text(encoding="utf-8") == esperado
+
+        resultados = set()
+        for processos in (None, 2, 4):
+            relatorio = cifrar_arquivo(log, cifrado, palavra_chave, processos)
+            resultados.add(hashlib.sha256(cifrado.read_bytes()).hexdigest())
+            print(f"Cifrar {relatorio['bytes'] / 2**20:.0f} MiB com {processos or 1} processo(s): "
+                  f"{relatorio['mb_por_segundo']:.0f} MB/s ({os.cpu_count()} núcleos)")
+        assert len(resultados) == 1
+        relatorio = decifrar_arquivo(cifrado, decifrado, palavra_chave)
+        print(f"Decifrar: {relatorio['mb_por_segundo']:.0f} MB/s")
+        # Só a parte ASCII volta idêntica: o original converte letras acentuadas em letras ASCII
+        parte_ascii = os.path.getsize(log) - len(dados)
+        with open(log, "rb") as original, open(decifrado, "rb") as resultado:
+            assert original.read(parte_ascii) == resultado.read(parte_ascii)
+        print("Arquivo decifrado confere com o original")
@@ -0,0 +1,175 @@
+# Este código recupera o tamanho da chave e a chave de um texto cifrado com a Cifra de Vigenère.
+# Em vigenere_encrypt a posição na chave avança a cada caractere (letra ou não), então a letra na posição i do
+# texto foi deslocada pela letra i mod L da chave: as colunas da análise são formadas pelas posições no texto
+# inteiro, e só as letras entram nas contagens.
+# - Índice de coincidência: para cada período candidato p, as letras são separadas em p colunas e o IC médio é
+#   calculado de uma vez com np.bincount; no período certo cada coluna é uma cifra de César e o IC fica perto do
+#   da língua (~0,07), nos errados fica perto do aleatório (~0,038).
+# - Kasiski: os trigramas de letras consecutivas viram códigos inteiros e são ordenados por código, o que junta
+#   as ocorrências de cada trigrama; as distâncias entre repetições tendem a ser múltiplas do tamanho da chave, e
+#   cada período recebe um voto por distância divisível.
+# - Qui-quadrado: em cada coluna, o deslocamento cuja distribuição mais se aproxima das frequências da língua é
+#   a letra da chave; os 26 deslocamentos de todas as colunas são avaliados juntos numa matriz.
+# Os períodos candidatos são avaliados em série: cada um custa um bincount de poucos milissegundos, menos do que
+# iniciar um pool de processos e enviar as letras a ele (um pool foi medido e era mais lento em todos os tamanhos,
+# de 100 caracteres a 1 milhão). O benchmark mede o tempo até quebrar a cifra conforme o tamanho do texto cresce.
+# Para executar este código, você precisa instalar o NumPy: pip install numpy
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+rapido = carregar_script("20261018_180010_Vigenere_Rapido.py")
+
+# Frequências das letras a..z, em porcentagem
+FREQUENCIAS = {
+    "pt": [14.63, 1.04, 3.88, 4.99, 12.57, 1.02, 1.30, 1.28, 6.18, 0.40, 0.02, 2.78, 4.74,
+           5.05, 10.73, 2.52, 1.20, 6.53, 7.81, 4.34, 4.63, 1.67, 0.01, 0.21, 0.01, 0.47],
+    "en": [8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+           6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074],
+}
+TOLERANCIA_IC = 0.9  # Períodos com IC médio acima de 90% do melhor são candidatos
+LETRAS_POR_COLUNA = 20  # Com menos letras por coluna o IC é só ruído, então períodos maiores não são testados
+# Piso para as letras raras (k, w, y...): uma única ocorrência delas não deve dominar o qui-quadrado
+PISO_FREQUENCIA = 0.5
+# Matriz 26x26: DESLOCADOS[k, i] = (i + k) % 26, a letra cifrada de i com a letra k da chave
+DESLOCADOS = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+def preparar(texto_cifrado):
+    # Posições (no texto inteiro) e valores 0..25 das letras ASCII; o resto só ocupa posição na chave
+    codigos = np.frombuffer(texto_cifrado.encode("ascii", errors="replace"), dtype=np.uint8)
+    minusculas = codigos | 0x20  # Maiúsculas ASCII viram minúsculas
+    letras = (minusculas >= ord("a")) & (minusculas <= ord("z"))
+    posicoes = np.flatnonzero(letras)
+    return posicoes, (minusculas[posicoes] - ord("a")).astype(np.int64)
+
+def contagens_por_coluna(posicoes, valores, periodo):
+    colunas = posicoes % periodo
+    return np.bincount(colunas * 26 + valores, minlength=periodo * 26).reshape(periodo, 26)
+
+def indice_de_coincidencia(contagens):
+    # IC de cada coluna: soma de c(c-1) sobre n(n-1)
+    n = contagens.sum(axis=1)
+    pares = (contagens * (contagens - 1)).sum(axis=1)
+    return np.where(n > 1, pares / np.maximum(n * (n - 1), 1), 0.0)
+
+def chave_por_qui_quadrado(contagens, lingua="pt"):
+    # qui2[coluna, k] compara a coluna decifrada com a letra k com as frequências esperadas
+    esperadas = np.maximum(FREQUENCIAS[lingua], PISO_FREQUENCIA) / 100
+    n = contagens.sum(axis=1)[:, None, None]
+    observadas = contagens[:, DESLOCADOS]  # (colunas, k, letra do texto claro)
+    esperado = np.maximum(n * esperadas[None, None, :], 1e-9)
+    qui2 = ((observadas - esperado) ** 2 / esperado).sum(axis=2)
+    deslocamentos = qui2.argmin(axis=1)
+    return deslocamentos, qui2[np.arange(len(deslocamentos)), deslocamentos].sum()
+
+def _avaliar_periodos(posicoes, valores, periodos, lingua):
+    resultados = []
+    for periodo in periodos:
+        contagens = contagens_por_coluna(posicoes, valores, periodo)
+        deslocamentos, qui2 = chave_por_qui_quadrado(contagens, lingua)
+        resultados.append({
+            "periodo": periodo,
+            "ic": float(indice_de_coincidencia(contagens).mean()),
+            "chave": "".join(chr(ord("a") + int(k)) for k in deslocamentos),
+            "qui2": float(qui2),
+        })
+    return resultados
+
+def kasiski(texto_cifrado, periodo_maximo, tamanho_ngrama=3, letras=None):
+    # votos[p] = quantas distâncias entre n-gramas repetidos são múltiplas de p.
+    # As posições vêm de preparar (letras = (posicoes, valores), se já calculadas), as mesmas das colunas do IC:
+    # str.lower() pode mudar o tamanho do texto ('İ' vira dois caracteres) e desalinhar as posições da chave
+    posicoes, valores = letras if letras is not None else preparar(texto_cifrado)
+    quantidade = len(valores) - tamanho_ngrama + 1
+    if quantidade > 0:
+        # Um n-grama só conta se as suas letras são vizinhas no texto
+        consecutivos = posicoes[tamanho_ngrama - 1:] - posicoes[:quantidade] == tamanho_ngrama - 1
+        codigos = np.zeros(quantidade, dtype=np.int64)
+        for i in range(tamanho_ngrama):
+            codigos = codigos * 26 + valores[i:i + quantidade]
+        codigos, inicios = codigos[consecutivos], posicoes[:quantidade][consecutivos]
+        # Ordenação estável por código: as ocorrências de cada n-grama ficam juntas e em ordem de posição
+        ordem = np.argsort(codigos, kind="stable")
+        codigos, inicios = codigos[ordem], inicios[ordem]
+        repetidos = codigos[1:] == codigos[:-1]
+        distancias = (inicios[1:] - inicios[:-1])[repetidos]
+    else:
+        distancias = np.empty(0, dtype=np.int64)
+    votos = {}
+    for periodo in range(2, periodo_maximo + 1):
+        votos[periodo] = int(np.count_nonzero(distancias % periodo == 0)) if len(distancias) else 0
+    return votos
+
+def quebrar(texto_cifrado, periodo_maximo=40, lingua="pt"):
+    posicoes, valores = preparar(texto_cifrado)
+    periodo_maximo = max(1, min(periodo_maximo, len(valores) // LETRAS_POR_COLUNA))
+    avaliacoes = _avaliar_periodos(posicoes, valores, range(1, periodo_maximo + 1), lingua)
+
+    # Múltiplos do período certo também têm IC alto: entre os candidatos, ganha o de mais votos de Kasiski e,
+    # empatados, o menor
+    votos = kasiski(texto_cifrado, periodo_maximo, letras=(posicoes, valores))
+    melhor_ic = max(a["ic"] for a in avaliacoes)
+    candidatos = [a for a in avaliacoes if a["ic"] >= TOLERANCIA_IC * melhor_ic]
+    escolhido = max(candidatos, key=lambda a: (votos.get(a["periodo"], 0), -a["periodo"]))
+    return {
+        "periodo": escolhido["periodo"],
+        "chave": escolhido["chave"],
+        "texto": rapido.decifrar(texto_cifrado, escolhido["chave"]),
+        "avaliacoes": avaliacoes,
+        "kasiski": votos,
+    }
+
+FRASES = [
+    "A criptografia protege a privacidade das pessoas contra a vigilância em massa.",
+    "Os cypherpunks escrevem código porque a privacidade não será concedida por governos ou empresas.",
+    "Uma cifra de substituição polialfabética usa vários alfabetos para esconder a frequência das letras.",
+    "Durante três séculos a cifra de Vigenère foi considerada indecifrável pelos diplomatas europeus.",
+    "O método de Kasiski procura sequências repetidas no texto cifrado e mede a distância entre elas.",
+    "Com o tamanho da chave em mãos, cada coluna se torna uma simples cifra de César.",
+    "Para que a mensagem chegue intacta, o remetente e o destinatário precisam combinar a mesma chave.",
+    "Nenhum sistema é mais seguro do que o cuidado de quem guarda a chave secreta.",
+    "O texto claro passa por uma transformação que depende de cada letra da palavra secreta.",
+    "As frequências das letras na língua portuguesa entregam o deslocamento de cada coluna.",
+]
+
+def gerar_texto(caracteres, semente=0):
+    gerador = random.Random(semente)
+    partes, tamanho = [], 0
+    while tamanho < caracteres:
+        frase = gerador.choice(FRASES)
+        partes.append(frase)
+        tamanho += len(frase) + 1
+    return " ".join(partes)[:caracteres]
+
+def benchmark(tamanhos=(100, 200, 400, 1_000, 10_000, 100_000, 1_000_000), tamanho_chave=7, semente=1):
+    gerador = random.Random(semente)
+    chave = "".join(gerador.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(tamanho_chave))
+    print(f"Chave de {tamanho_chave} letras")
+    print(f"{'caracteres':>10} {'segundos':>9} {'período':>8}  chave encontrada")
+    for caracteres in tamanhos:
+        cifrado = rapido.cifrar(gerar_texto(caracteres, semente), chave)
+        inicio = time.perf_counter()
+        resultado = quebrar(cifrado)
+        segundos = time.perf_counter() - inicio
+        certo = "ok" if resultado["chave"] == chave else "errada"
+        print(f"{caracteres:>10,} {segundos:>9.3f} {resultado['periodo']:>8}  {resultado['chave']} ({certo})")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    palavra_chave = "cypherpunk"
+    mensagem = gerar_texto(2_000)
+    cifrada = rapido.cifrar(mensagem, palavra_chave)
+    resultado = quebrar(cifrada)
+    print(f"Período: {resultado['periodo']}, chave recuperada: {resultado['chave']}")
+    print("IC médio por período:", ", ".join(f"{a['periodo']}: {a['ic']:.3f}" for a in resultado["avaliacoes"][:12]))
+    # Letras acentuadas não voltam: vigenere_encrypt já as transforma em letras ASCII
+    print("Texto decifrado:", resultado["texto"][:100], "...")
+    benchmark()
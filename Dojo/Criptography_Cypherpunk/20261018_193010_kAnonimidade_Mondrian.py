@@ -0,0 +1,246 @@
+# Este código implementa k-anonimização de verdade, pelo algoritmo Mondrian multidimensional.
+# 20260131_183030_kAnonimidade.py só descarta os grupos (Idade, Cidade) com menos de k registros, o que é
+# supressão: no exemplo dele todos os registros somem. Aqui os quase-identificadores são generalizados: o Mondrian
+# divide recursivamente os registros pela mediana da dimensão mais larga, desde que os dois lados fiquem com
+# pelo menos k registros, e cada partição final vira uma classe de equivalência cujos valores são trocados pela
+# faixa ("25-40") ou pelo conjunto de categorias ("Rio de Janeiro|São Paulo") que ela cobre.
+# Os quase-identificadores viram códigos inteiros (int32) numa única matriz, e as partições são trechos
+# contíguos de um vetor de permutação dividido no lugar, como no quicksort; a mediana sai de np.partition.
+# Os dados podem vir de um DataFrame ou de uma função que devolve os pedaços (por exemplo pd.read_csv com
+# chunksize): são duas passadas para montar os códigos, e na memória ficam só a matriz de códigos, a permutação
+# e o número da classe de cada linha (10^7 linhas com 3 quase-identificadores: ~250 MB, com pico de ~1 GB no
+# processo durante a divisão e o resumo). transformar devolve os pedaços já generalizados.
+# Valores ausentes (NaN, None, pd.NA) ficam fora do domínio ordenado e recebem um código próprio, depois do último
+# valor; na classe eles aparecem como "ausente". Colunas booleanas são tratadas como categorias, e não como faixas.
+# A perda de informação é medida pela NCP (Normalized Certainty Penalty): 0 é o dado original, 1 é tudo
+# generalizado para o domínio inteiro.
+# Para executar este código, você precisa instalar o pandas e o NumPy: pip install pandas numpy
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROTULO_AUSENTE = "ausente"
+
+def _pedacos(fonte):
+    # Aceita um DataFrame ou uma função sem argumentos que devolve um iterável de DataFrames
+    return [fonte] if isinstance(fonte, pd.DataFrame) else fonte()
+
+class Mondrian:
+    def __init__(self, quase_identificadores, k):
+        if k < 1:
+            raise ValueError("k deve ser pelo menos 1")
+        self.quase_identificadores = list(quase_identificadores)
+        self.k = k
+
+    def _codificar(self, fonte):
+        # Passada 1: domínio ordenado de cada quase-identificador (sem os ausentes) e número de linhas.
+        # bool conta como numérico para o pandas, mas "False-True" não é uma faixa: vira categoria
+        dominios = {coluna: set() for coluna in self.quase_identificadores}
+        self.numericos = {}
+        self.com_ausentes = set()
+        linhas = 0
+        for pedaco in _pedacos(fonte):
+            linhas += len(pedaco)
+            for coluna in self.quase_identificadores:
+                serie = pedaco[coluna]
+                self.numericos.setdefault(coluna, pd.api.types.is_numeric_dtype(serie)
+                                          and not pd.api.types.is_bool_dtype(serie))
+                unicos = pd.unique(serie)
+                ausentes = pd.isna(unicos)
+                if ausentes.any():
+                    self.com_ausentes.add(coluna)
+                    unicos = unicos[~ausentes]
+                dominios[coluna].update(unicos)
+        self.dominios = {coluna: np.array(sorted(valores)) for coluna, valores in dominios.items()}
+
+        # Passada 2: cada valor vira sua posição no domínio ordenado, e os ausentes viram len(domínio)
+        codigos = np.empty((linhas, len(self.quase_identificadores)), dtype=np.int32)
+        inicio = 0
+        for pedaco in _pedacos(fonte):
+            for d, coluna in enumerate(self.quase_identificadores):
+                dominio, valores = self.dominios[coluna], pedaco[coluna].to_numpy()
+                destino = codigos[inicio:inicio + len(pedaco), d]
+                if coluna in self.com_ausentes:
+                    # Os ausentes não entram no searchsorted: None não é comparável com str, e NaN não tem posição
+                    ausentes = pd.isna(valores)
+                    destino[ausentes] = len(dominio)
+                    destino[~ausentes] = np.searchsorted(dominio, valores[~ausentes])
+                else:
+                    destino[:] = np.searchsorted(dominio, valores)
+            inicio += len(pedaco)
+        return codigos
+
+    def ajustar(self, fonte):
+        inicio_tempo = time.perf_counter()
+        codigos = self._codificar(fonte)
+        linhas = len(codigos)
+        if linhas < self.k:
+            raise ValueError(f"São necessárias pelo menos k = {self.k} linhas, há {linhas}")
+        larguras_globais = np.maximum(codigos.max(axis=0) - codigos.min(axis=0), 1).astype(np.float64)
+
+        ordem = np.arange(linhas, dtype=np.int32 if linhas < 2**31 else np.int64)
+        pilha = [(0, linhas)]
+        inicios = []  # Início de cada partição final; as partições cobrem `ordem` sem buracos
+        while pilha:
+            ini, fim = pilha.pop()
+            if fim - ini < 2 * self.k:
+                inicios.append(ini)  # Pequena demais para dividir
+                continue
+            linhas_particao = ordem[ini:fim]
+            valores = codigos[linhas_particao]
+            minimos, maximos = valores.min(axis=0), valores.max(axis=0)
+            corte = None
+            # Tenta as dimensões da mais larga (relativa ao domínio) para a mais estreita
+            for d in np.argsort(-(maximos - minimos) / larguras_globais):
+                if maximos[d] == minimos[d]:
+                    break
+                coluna = valores[:, d]
+                mediana = np.partition(coluna, len(coluna) // 2)[len(coluna) // 2]
+                for esquerda in (coluna < mediana, coluna <= mediana):
+                    tamanho_esquerda = int(np.count_nonzero(esquerda))
+                    if self.k <= tamanho_esquerda <= len(coluna) - self.k:
+                        corte = esquerda, tamanho_esquerda
+                        break
+                if corte:
+                    break
+            if corte:
+                esquerda, tamanho_esquerda = corte
+                ordem[ini:fim] = np.concatenate((linhas_particao[esquerda], linhas_particao[~esquerda]))
+                pilha.append((ini + tamanho_esquerda, fim))
+                pilha.append((ini, ini + tamanho_esquerda))
+            else:
+                inicios.append(ini)
+
+        # Cada linha recebe o número da sua partição, na ordem original das linhas
+        inicios = np.sort(np.array(inicios, dtype=np.int64))
+        tamanhos = np.diff(np.append(inicios, linhas))
+        self.rotulos = np.empty(linhas, dtype=np.int32)
+        self.rotulos[ordem] = np.repeat(np.arange(len(inicios), dtype=np.int32), tamanhos)
+        self._resumir(codigos, ordem, inicios, tamanhos)
+        self.segundos = time.perf_counter() - inicio_tempo
+        return self
+
+    def _resumir(self, codigos, ordem, inicios, tamanhos):
+        # Uma linha por classe de equivalência: tamanho e valor generalizado de cada quase-identificador.
+        # As partições são trechos contíguos de `ordem`, então mínimos e máximos saem de reduceat.
+        resumo = {"tamanho": tamanhos}
+        penalidades = np.zeros(len(inicios))
+        particoes = np.repeat(np.arange(len(inicios)), tamanhos)
+        for d, coluna in enumerate(self.quase_identificadores):
+            dominio = self.dominios[coluna]
+            agrupados = codigos[ordem, d]
+            if self.numericos[coluna]:
+                # A faixa cobre só os valores presentes; o código dos ausentes (len(domínio)) fica de fora
+                ausentes = agrupados == len(dominio)
+                tem_ausentes = np.logical_or.reduceat(ausentes, inicios)
+                so_ausentes = np.logical_and.reduceat(ausentes, inicios)
+                if len(dominio):
+                    minimos = dominio[np.minimum.reduceat(np.where(ausentes, len(dominio) - 1, agrupados), inicios)]
+                    maximos = dominio[np.maximum.reduceat(np.where(ausentes, 0, agrupados), inicios)]
+                else:
+                    minimos = maximos = np.zeros(len(inicios))
+                rotulos = []
+                for a, b, tem, so in zip(minimos.tolist(), maximos.tolist(), tem_ausentes, so_ausentes):
+                    faixa = str(a) if a == b else f"{a}-{b}"
+                    rotulos.append(ROTULO_AUSENTE if so else f"{faixa}|{ROTULO_AUSENTE}" if tem else faixa)
+                resumo[coluna] = rotulos
+                largura = float(dominio[-1] - dominio[0]) if len(dominio) else 0.0
+                # Uma classe que mistura valores e ausentes não diz nada sobre o valor: penalidade máxima
+                penalidades += np.where(tem_ausentes, ~so_ausentes, (maximos - minimos) / (largura or 1.0))
+            else:
+                # Pares (partição, categoria) distintos, já ordenados por partição; o ausente é a última categoria
+                nomes_dominio = dominio.astype(str)
+                if coluna in self.com_ausentes:
+                    nomes_dominio = np.append(nomes_dominio, ROTULO_AUSENTE)
+                cardinalidade = len(nomes_dominio)
+                pares = np.unique(particoes * cardinalidade + agrupados)
+                categorias_por_particao = np.bincount(pares // cardinalidade, minlength=len(inicios))
+                nomes = nomes_dominio[pares % cardinalidade]
+                grupos = np.split(nomes, np.cumsum(categorias_por_particao)[:-1])
+                resumo[coluna] = ["|".join(grupo) for grupo in grupos]
+                penalidades += (categorias_por_particao - 1) / max(cardinalidade - 1, 1)
+        self.classes = pd.DataFrame(resumo)
+        # NCP média por linha e por quase-identificador
+        self.perda_de_informacao = float((penalidades * tamanhos).sum()
+                                         / (tamanhos.sum() * len(self.quase_identificadores)))
+
+    def transformar(self, fonte):
+        # Devolve os pedaços com os quase-identificadores generalizados (como Categorical, para poupar memória)
+        categorias = {}
+        for coluna in self.quase_identificadores:
+            codigos, unicos = pd.factorize(self.classes[coluna])
+            categorias[coluna] = (codigos, unicos)
+        inicio = 0
+        for pedaco in _pedacos(fonte):
+            rotulos = self.rotulos[inicio:inicio + len(pedaco)]
+            pedaco = pedaco.copy()
+            for coluna, (codigos, unicos) in categorias.items():
+                pedaco[coluna] = pd.Categorical.from_codes(codigos[rotulos], categories=unicos)
+            inicio += len(pedaco)
+            yield pedaco
+
+def anonimizar(df, quase_identificadores, k):
+    # Atalho para um DataFrame que cabe na memória
+    mondrian = Mondrian(quase_identificadores, k).ajustar(df)
+    return next(mondrian.transformar(df))
+
+CIDADES = ["Belo Horizonte", "Brasília", "Curitiba", "Fortaleza", "Manaus", "Porto Alegre", "Recife",
+           "Rio de Janeiro", "Salvador", "São Paulo"]
+
+def gerar_pedacos(linhas, tamanho_pedaco=1_000_000, semente=0):
+    # Dados sintéticos reproduzíveis: cada chamada devolve os mesmos pedaços, para as duas passadas
+    def fonte():
+        for numero, inicio in enumerate(range(0, linhas, tamanho_pedaco)):
+            n = min(tamanho_pedaco, linhas - inicio)
+            gerador = np.random.default_rng((semente, numero))
+            yield pd.DataFrame({
+                "Idade": gerador.integers(18, 90, n),
+                "CEP": gerador.integers(10_000, 99_999, n) // 10 * 10,
+                "Cidade": pd.Categorical.from_codes(gerador.integers(0, len(CIDADES), n), CIDADES),
+                "Diagnostico": gerador.integers(0, 20, n),
+            })
+    return fonte
+
+def pico_de_memoria():
+    # Pico de memória residente do processo até aqui, em bytes, ou None onde não há o módulo resource (Windows).
+    # tracemalloc deixaria o laço do Mondrian várias vezes mais lento
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+def benchmark(linhas=1_000_000, k=10, quase_identificadores=("Idade", "CEP", "Cidade")):
+    fonte = gerar_pedacos(linhas)
+    mondrian = Mondrian(quase_identificadores, k).ajustar(fonte)
+    inicio = time.perf_counter()
+    linhas_transformadas = sum(len(pedaco) for pedaco in mondrian.transformar(fonte))
+    segundos_transformar = time.perf_counter() - inicio
+    pico = pico_de_memoria()
+    assert linhas_transformadas == linhas and mondrian.classes["tamanho"].min() >= k
+    print(f"{linhas:,} linhas, k = {k}: {len(mondrian.classes):,} classes "
+          f"(tamanho médio {mondrian.classes['tamanho'].mean():.1f}, mínimo {mondrian.classes['tamanho'].min()})")
+    print(f"  ajustar: {linhas / mondrian.segundos:,.0f} linhas/s; transformar: {linhas / segundos_transformar:,.0f} linhas/s")
+    print(f"  perda de informação (NCP): {mondrian.perda_de_informacao:.3f}; pico de memória do processo "
+          f"{f'{pico / 2**20:.0f} MiB' if pico is not None else 'indisponível'}")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    data = {
+        'Nome': ['Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Frank'],
+        'Idade': [25, 30, 25, 30, 40, 40],
+        'Cidade': ['São Paulo', 'São Paulo', 'Rio de Janeiro', 'Rio de Janeiro', 'São Paulo', 'Rio de Janeiro']
+    }
+    df = pd.DataFrame(data)
+    # O nome é um identificador direto: ele sai antes da anonimização
+    anonimizado = anonimizar(df.drop(columns="Nome"), ["Idade", "Cidade"], k=2)
+    print("Dados anonimizados (k-anonimidade, k = 2):")
+    print(anonimizado)
+    print("Menor classe:", anonimizado.groupby(["Idade", "Cidade"], observed=True).size().min())
+
+    for k in (5, 50):
+        benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, k)
@@ -0,0 +1,292 @@
+# Este código monitora a k-anonimidade de registros que chegam continuamente, em micro-lotes.
+# 20260131_183030_kAnonimidade.py calcula groupby(['Idade', 'Cidade']).size() sobre o DataFrame inteiro; refazer
+# isso a cada lote custa O(registros acumulados). Aqui cada valor de quase-identificador vira um código inteiro
+# (um dicionário por coluna) e cada tupla de códigos vira o número de uma classe de equivalência, com a contagem
+# da classe num array do NumPy. Cada lote só atualiza as contagens das classes que aparecem nele: o lote é
+# agrupado de forma vetorizada e só as tuplas distintas do lote passam pelo dicionário de classes.
+# Um registro só é liberado quando a sua classe chega a k registros. Até lá ele fica num buffer de espera de
+# tamanho limitado; quando a classe chega a k, os registros retidos dela saem junto com os do lote. Se o buffer
+# passa do limite, os registros retidos mais antigos são suprimidos (descartados e descontados das contagens).
+# remover desconta registros (por exemplo, um pedido de exclusão) e sinaliza as classes liberadas que caíram abaixo
+# de k; os novos registros dessas classes voltam a ser retidos até que elas cheguem a k de novo. Um registro que
+# ainda está no buffer sai dele; remover registros de classes desconhecidas, ou mais registros liberados do que a
+# classe tem, é um erro, e nesse caso nada é alterado.
+# Cada lote devolve um relatório com a latência e a memória do estado do monitor.
+# O dicionário de classes guarda toda combinação já vista, então a memória cresce com o número de combinações
+# distintas: quase-identificadores muito finos (o CEP inteiro) devem ser generalizados antes de entrar no monitor.
+# Para executar este código, você precisa instalar o pandas e o NumPy: pip install pandas numpy
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# carregador.py fica na pasta Dojo, um nível acima
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from carregador import carregar_script
+
+mondrian = carregar_script("20261018_193010_kAnonimidade_Mondrian.py")
+
+CAPACIDADE_INICIAL = 1024
+
+class MonitorKAnonimidade:
+    def __init__(self, quase_identificadores, k, limite_espera=100_000):
+        if k < 1:
+            raise ValueError("k deve ser pelo menos 1")
+        self.quase_identificadores = list(quase_identificadores)
+        self.k = k
+        self.limite_espera = limite_espera
+        # Codificação: valor -> código em cada coluna, e tupla de códigos -> número da classe
+        self._codigos = {coluna: {} for coluna in self.quase_identificadores}
+        self._valores = {coluna: [] for coluna in self.quase_identificadores}
+        self._classes = {}
+        self._tuplas = []
+        self._bytes_chaves = 0  # Tamanho aproximado das tuplas guardadas como chave
+        # Por classe: registros contados (liberados + retidos) e se a classe já foi liberada
+        self.contagens = np.zeros(CAPACIDADE_INICIAL, dtype=np.int64)
+        self.liberadas = np.zeros(CAPACIDADE_INICIAL, dtype=bool)
+        # Buffer de espera, em ordem de chegada, com a classe de cada registro retido
+        self.retidos = None
+        self._classes_retidos = np.empty(0, dtype=np.int64)
+        self.lotes = 0
+        self.liberados = 0
+        self.suprimidos = 0
+
+    def _crescer(self, classes):
+        if classes > len(self.contagens):
+            capacidade = max(classes, 2 * len(self.contagens))
+            for nome in ("contagens", "liberadas"):
+                antigo = getattr(self, nome)
+                novo = np.zeros(capacidade, dtype=antigo.dtype)
+                novo[:len(antigo)] = antigo
+                setattr(self, nome, novo)
+
+    def _classes_do_lote(self, lote, criar=True):
+        # Número da classe de cada registro do lote; classes novas são criadas aqui. Com criar=False nada é
+        # acrescentado aos dicionários e os registros de valores ou classes nunca vistos recebem -1
+        chave = np.zeros(len(lote), dtype=np.int64)
+        globais = []
+        for coluna in self.quase_identificadores:
+            inversos, unicos = pd.factorize(lote[coluna], use_na_sentinel=False)
+            mapa, valores = self._codigos[coluna], self._valores[coluna]
+            codigos = np.empty(len(unicos), dtype=np.int64)
+            for i, valor in enumerate(np.asarray(unicos).tolist()):
+                if pd.api.types.is_scalar(valor) and pd.isna(valor):
+                    # NaN != NaN: cada NaN seria uma chave nova do dicionário (e uma classe nova a cada lote), então
+                    # todo valor ausente (NaN, None, NaT, pd.NA) vira a mesma chave, como em groupby(dropna=False)
+                    valor = None
+                if valor not in mapa:
+                    if not criar:
+                        codigos[i] = -1
+                        continue
+                    mapa[valor] = len(valores)
+                    valores.append(valor)
+                codigos[i] = mapa[valor]
+            globais.append(codigos[inversos])
+            # Chave compacta da tupla dentro do lote: fica sempre menor que o tamanho do lote
+            chave = pd.factorize(chave * len(unicos) + inversos)[0]
+        grupos, primeiros = np.unique(chave, return_index=True)
+        # Só as tuplas distintas do lote passam pelo dicionário de classes
+        numeros = np.empty(len(grupos), dtype=np.int64)
+        for g, tupla in enumerate(map(tuple, np.column_stack(globais)[primeiros].tolist())):
+            numero = self._classes.get(tupla)
+            if numero is None:
+                if not criar:
+                    numeros[g] = -1
+                    continue
+                numero = self._classes[tupla] = len(self._tuplas)
+                self._tuplas.append(tupla)
+                self._bytes_chaves += sys.getsizeof(tupla)
+            numeros[g] = numero
+        self._crescer(len(self._tuplas))
+        return numeros[chave]
+
+    def processar_lote(self, lote):
+        # Devolve (liberados, relatório): os registros que já podem sair, com a sua classe com pelo menos k
+        inicio = time.perf_counter()
+        classes = self._classes_do_lote(lote)
+        self.contagens[:len(self._tuplas)] += np.bincount(classes, minlength=len(self._tuplas))
+
+        # Classes que chegaram a k neste lote: os registros retidos delas também saem
+        atingiram = np.flatnonzero(~self.liberadas[:len(self._tuplas)] & (self.contagens[:len(self._tuplas)] >= self.k))
+        self.liberadas[atingiram] = True
+        partes = []
+        if len(atingiram) and len(self._classes_retidos):
+            saem = self.liberadas[self._classes_retidos]
+            if saem.any():
+                partes.append(self.retidos[saem])
+                self.retidos = self.retidos[~saem]
+                self._classes_retidos = self._classes_retidos[~saem]
+        saem = self.liberadas[classes]
+        partes.append(lote[saem])
+        if not saem.all():
+            ficam = lote[~saem]
+            self.retidos = ficam if self.retidos is None else pd.concat((self.retidos, ficam))
+            self._classes_retidos = np.concatenate((self._classes_retidos, classes[~saem]))
+
+        # Buffer cheio: os retidos mais antigos são suprimidos e saem das contagens
+        excesso = len(self._classes_retidos) - self.limite_espera
+        if excesso > 0:
+            self.contagens[:len(self._tuplas)] -= np.bincount(self._classes_retidos[:excesso],
+                                                               minlength=len(self._tuplas))
+            self.retidos = self.retidos.iloc[excesso:]
+            self._classes_retidos = self._classes_retidos[excesso:]
+            self.suprimidos += excesso
+
+        liberados = pd.concat(partes) if len(partes) > 1 else partes[0]
+        self.lotes += 1
+        self.liberados += len(liberados)
+        segundos = time.perf_counter() - inicio
+        return liberados, {
+            "lote": self.lotes,
+            "registros": len(lote),
+            "liberados": len(liberados),
+            "retidos": len(self._classes_retidos),
+            "suprimidos": max(excesso, 0),
+            "classes": len(self._tuplas),
+            "classes_abaixo_de_k": self.quantidade_abaixo_de_k(),
+            "segundos": segundos,
+            "memoria": self.memoria(),
+        }
+
+    def processar_fluxo(self, lotes):
+        # Consome um iterável potencialmente infinito de DataFrames, lote a lote
+        for lote in lotes:
+            yield self.processar_lote(lote)
+
+    def remover(self, registros):
+        # Desconta os registros e devolve as classes liberadas que caíram abaixo de k. Os que ainda estão retidos
+        # (comparados pelo registro inteiro, do mais antigo para o mais novo) saem do buffer; os demais são
+        # descontados dos já liberados da classe
+        n = len(self._tuplas)
+        classes = self._classes_do_lote(registros, criar=False)
+        desconhecidos = np.count_nonzero(classes < 0)
+        if desconhecidos:
+            raise ValueError(f"{desconhecidos} registro(s) de classes que o monitor nunca recebeu")
+
+        saem = np.zeros(len(self._classes_retidos), dtype=bool)
+        if len(registros) and len(self._classes_retidos):
+            # Cada registro a remover tira no máximo um retido idêntico: os `quantos` mais antigos de cada hash
+            hashes = pd.util.hash_pandas_object(registros, index=False).to_numpy()
+            hashes_retidos = pd.util.hash_pandas_object(self.retidos[registros.columns], index=False).to_numpy()
+            unicos, quantos = np.unique(hashes, return_counts=True)
+            posicao = np.minimum(np.searchsorted(unicos, hashes_retidos), len(unicos) - 1)
+            pedidos = np.where(unicos[posicao] == hashes_retidos, quantos[posicao], 0)
+            saem = pd.Series(hashes_retidos).groupby(hashes_retidos).cumcount().to_numpy() < pedidos
+
+        removidos = np.bincount(classes, minlength=n)
+        removidos_retidos = np.bincount(self._classes_retidos[saem], minlength=n)
+        liberados_por_classe = self.contagens[:n] - np.bincount(self._classes_retidos, minlength=n)
+        excesso = np.flatnonzero(removidos - removidos_retidos > liberados_por_classe)
+        if len(excesso):
+            raise ValueError(f"Remoção maior que os registros liberados de {len(excesso)} classe(s), por exemplo "
+                             f"{self._descrever(excesso[:1]).iloc[0].to_dict()}")
+
+        if saem.any():
+            self.retidos = self.retidos[~saem]
+            self._classes_retidos = self._classes_retidos[~saem]
+        antes = self.contagens[:n].copy()
+        self.contagens[:n] -= removidos
+        cairam = np.flatnonzero(self.liberadas[:n] & (antes >= self.k) & (self.contagens[:n] < self.k))
+        descricao = self._descrever(cairam)
+        # Abaixo de k a classe deixa de estar liberada: os próximos registros dela esperam no buffer
+        self.liberadas[cairam] = False
+        return descricao
+
+    def quantidade_abaixo_de_k(self):
+        contagens = self.contagens[:len(self._tuplas)]
+        return int(np.count_nonzero((contagens > 0) & (contagens < self.k)))
+
+    def abaixo_de_k(self):
+        # Classes com registros e menos de k deles: as que ainda estão retidas e as liberadas que caíram
+        contagens = self.contagens[:len(self._tuplas)]
+        return self._descrever(np.flatnonzero((contagens > 0) & (contagens < self.k)))
+
+    def _descrever(self, numeros):
+        # Valores originais dos quase-identificadores de cada classe, com a contagem e se já foi liberada
+        tuplas = [self._tuplas[n] for n in numeros.tolist()]
+        descricao = {coluna: [self._valores[coluna][tupla[d]] for tupla in tuplas]
+                     for d, coluna in enumerate(self.quase_identificadores)}
+        descricao["Contagem"] = self.contagens[numeros]
+        descricao["Liberada"] = self.liberadas[numeros]
+        return pd.DataFrame(descricao)
+
+    def memoria(self):
+        # Bytes aproximados do estado: arrays de contagens, dicionários de codificação e o buffer de espera
+        total = self.contagens.nbytes + self.liberadas.nbytes + self._classes_retidos.nbytes
+        total += sys.getsizeof(self._classes) + sys.getsizeof(self._tuplas) + self._bytes_chaves
+        total += sum(sys.getsizeof(mapa) + sys.getsizeof(self._valores[coluna]) for coluna, mapa in self._codigos.items())
+        if self.retidos is not None:
+            total += int(self.retidos.memory_usage(deep=True).sum())
+        return total
+
+def benchmark(lotes=200, tamanho_lote=5_000, k=10, quase_identificadores=("Idade", "Cidade"), limite_espera=100_000,
+              generalizar=None):
+    # Compara o monitor incremental com refazer o groupby sobre todos os registros a cada lote;
+    # generalizar, se dado, é aplicado a cada lote antes dos dois
+    fonte = mondrian.gerar_pedacos(lotes * tamanho_lote, tamanho_lote, semente=1)
+    monitor = MonitorKAnonimidade(quase_identificadores, k, limite_espera)
+    acumulados = []
+    latencias, latencias_groupby = [], []
+    print(f"k = {k}, quase-identificadores {list(quase_identificadores)}, lotes de {tamanho_lote:,} registros")
+    print(f"{'lote':>5} {'acumulados':>11} {'monitor ms':>11} {'groupby ms':>11} {'retidos':>8} "
+          f"{'suprimidos':>11} {'< k':>7} {'estado':>10}")
+    for lote in fonte():
+        if generalizar:
+            lote = generalizar(lote)
+        _, relatorio = monitor.processar_lote(lote)
+        latencias.append(relatorio["segundos"])
+
+        inicio = time.perf_counter()
+        acumulados.append(lote)
+        todos = pd.concat(acumulados, ignore_index=True)
+        todos.groupby(list(quase_identificadores), observed=True).size()
+        latencias_groupby.append(time.perf_counter() - inicio)
+
+        if relatorio["lote"] == 1 or relatorio["lote"] % (lotes // 5 or 1) == 0:
+            print(f"{relatorio['lote']:>5} {len(todos):>11,} {relatorio['segundos'] * 1e3:>11.2f} "
+                  f"{latencias_groupby[-1] * 1e3:>11.2f} {relatorio['retidos']:>8,} {monitor.suprimidos:>11,} "
+                  f"{relatorio['classes_abaixo_de_k']:>7,} {relatorio['memoria'] / 2**20:>7.1f} MiB")
+    pico = mondrian.pico_de_memoria()
+    print(f"  latência média: monitor {np.mean(latencias) * 1e3:.2f} ms (p99 {np.percentile(latencias, 99) * 1e3:.2f} ms), "
+          f"groupby {np.mean(latencias_groupby) * 1e3:.2f} ms; {monitor.liberados:,} liberados; "
+          f"pico de memória do processo {f'{pico / 2**20:.0f} MiB' if pico is not None else 'indisponível'}")
+
+# Exemplo de uso
+if __name__ == "__main__":
+    data = {
+        'Nome': ['Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Frank'],
+        'Idade': [25, 30, 25, 30, 40, 40],
+        'Cidade': ['São Paulo', 'São Paulo', 'Rio de Janeiro', 'Rio de Janeiro', 'São Paulo', 'Rio de Janeiro']
+    }
+    df = pd.DataFrame(data)
+    # Os mesmos registros, chegando em lotes de dois, seguidos de mais pessoas com as mesmas combinações
+    chegadas = [df.iloc[i:i + 2] for i in range(0, len(df), 2)] + [df.iloc[[0, 2, 4]].assign(Nome=["Gil", "Hana", "Ivo"])]
+    monitor = MonitorKAnonimidade(["Idade", "Cidade"], k=2, limite_espera=4)
+    saida = []
+    for liberados, relatorio in monitor.processar_fluxo(chegadas):
+        saida.append(liberados)
+        print(f"Lote {relatorio['lote']}: {relatorio['liberados']} liberados ({', '.join(liberados['Nome']) or '-'}), "
+              f"{relatorio['retidos']} retidos, {relatorio['suprimidos']} suprimidos")
+    publicados = pd.concat(saida)
+    print("Menor classe publicada:", publicados.groupby(["Idade", "Cidade"]).size().min())
+    print("Classes abaixo de k:")
+    print(monitor.abaixo_de_k())
+    print("Após remover Charlie, classes liberadas que caíram abaixo de k:")
+    print(monitor.remover(df.iloc[[2]]))
+    # Frank ainda está no buffer: ele sai de lá, e uma segunda remoção dele excede a contagem da classe
+    monitor.remover(df.iloc[[5]])
+    print("Retidos após remover Frank:", ", ".join(monitor.retidos["Nome"]))
+    try:
+        monitor.remover(df.iloc[[5]])
+    except ValueError as erro:
+        print("Remoção recusada:", erro)
+
+    lotes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    benchmark(lotes)
+    # Com o CEP as classes são muito mais raras: só o primeiro dígito (a região postal) entra, e mesmo assim um
+    # buffer pequeno suprime os registros das combinações que demoram a chegar a k
+    benchmark(lotes, quase_identificadores=("Idade", "CEP", "Cidade"), limite_espera=20_000,
+              generalizar=lambda lote: lote.assign(CEP=lote["CEP"] // 10_000))
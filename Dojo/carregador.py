@@ -0,0 +1,41 @@
+# Este código carrega os scripts do Dojo uns dentro dos outros.
+# Os nomes dos scripts começam com data/hora (20260104_183025_...), o que não é um identificador Python válido, então
+# eles não podem ser importados com import: carregar_script os carrega pelo caminho, procurando o arquivo nas
+# subpastas do Dojo (os nomes são únicos). Cada script é executado uma única vez por processo: uma segunda chamada
+# devolve o módulo já carregado de sys.modules, e o script que está rodando como programa principal é reaproveitado
+# em vez de executado de novo. Assim todos os scripts enxergam as mesmas classes (por exemplo, um único
+# CicloEncontrado), e except/isinstance funcionam entre eles.
+# Os scripts encontram este arquivo acrescentando a pasta Dojo ao sys.path.
+# Não são necessárias bibliotecas externas.
+
+import importlib.util
+import sys
+from pathlib import Path
+
+PASTA_DOJO = Path(__file__).resolve().parent
+
+def localizar_script(nome_arquivo):
+    encontrados = sorted(PASTA_DOJO.glob(f"*/{nome_arquivo}"))
+    if not encontrados:
+        raise FileNotFoundError(f"Script não encontrado nas pastas do Dojo: {nome_arquivo}")
+    return encontrados[0]
+
+def carregar_script(nome_arquivo):
+    caminho = localizar_script(nome_arquivo)
+    if caminho.stem in sys.modules:
+        return sys.modules[caminho.stem]
+    # O script executado diretamente (python 2026...py) está em sys.modules como __main__
+    principal = sys.modules.get("__main__")
+    arquivo_principal = getattr(principal, "__file__", None)
+    if arquivo_principal and Path(arquivo_principal).resolve() == caminho:
+        sys.modules[caminho.stem] = principal
+        return principal
+    spec = importlib.util.spec_from_file_location(caminho.stem, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[caminho.stem] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    except BaseException:
+        del sys.modules[caminho.stem]  # Um script que falhou ao carregar não fica registrado pela metade
+        raise
+    return modulo